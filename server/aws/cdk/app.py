@@ -6,27 +6,37 @@
 """
 Example CDK App for Morales Corp Tenant
 This script sets up the AWS CDK application for the Morales Corp tenant.
+`python app.py` synthesizes every target serially in one App, while
+`cdk-auto-platform synth --jobs N` shards them across worker processes.
 """
 
-from aws_cdk import App, Environment
+from aws_cdk import Environment
+from constructs import Construct
+from cdk_auto_platform.models.environments.app_environment import AppEnvironment
+from cdk_auto_platform.models.tenants.tenant_base import TenantBase
+from cdk_auto_platform.utils.synthesis.synth_plan import SynthPlan
 from tenants.example import TenantExample
 from stacks.playground_stack.component import PlaygroundStack
 
 
-app: App = App()
+# region tenant-stacks
+def build_tenant_stacks(scope: Construct, tenant: TenantBase) -> None:
+    PlaygroundStack(
+        scope,
+        tenant,
+        env=Environment(account=tenant.AWS_ACCOUNT, region=tenant.AWS_REGION),
+    )
+
 
-# region tenants
-tenant_example = TenantExample()
 # endregion
 
-# region tenant-stacks
-tenant_example_playground_stack = PlaygroundStack(
-    app,
-    tenant_example.prod(),
-    env=Environment(
-        account=tenant_example.AWS_ACCOUNT, region=tenant_example.AWS_REGION
-    ),
+# region tenants
+synth_plan = SynthPlan(
+    tenants={"example": TenantExample},
+    environments=[AppEnvironment.PROD],
+    stack_factory=build_tenant_stacks,
 )
 # endregion
 
-app.synth()  # type: ignore
+if __name__ == "__main__":
+    synth_plan.synth()
@@ -4,15 +4,249 @@ cdk_auto_platform - AWS CDK Platform Extension
 This CDK extension provides a platform for building CDK applications.
 """
 
+from importlib import import_module
+
 __version__ = "1.0.59"
 __author__ = "Cesar Morales"
 __email__ = "me@cesarmoralesonya.es"
 
-# Expose main components
-from cdk_auto_platform.build import *  # noqa
-from cdk_auto_platform.models import *  # noqa
-from cdk_auto_platform.modules import *  # noqa
-from cdk_auto_platform.packages import *  # noqa
-from cdk_auto_platform.stacks import *  # noqa
+# Expose main components lazily, so importing a single model does not load
+# aws_cdk and boot the jsii runtime for every construct library we use.
+_EXPORTS = {
+    # region: build
+    "DrawableServicesBuilder": "cdk_auto_platform.build.drawable_services_builder",
+    "FirewallRulesBuilder": "cdk_auto_platform.build.firewall_rules_builder",
+    "MetricRegistryBuilder": "cdk_auto_platform.build.metric_registry_builder",
+    "NestedStackShardingBuilder": (
+        "cdk_auto_platform.build.nested_stack_sharding_builder"
+    ),
+    "ScalingRulesBuilder": "cdk_auto_platform.build.scaling_rules_builder",
+    "ServiceLoadBalancerLoggingBuilder": (
+        "cdk_auto_platform.build.service_load_balancer_logging_builder"
+    ),
+    "ServiceSecretsBuilder": "cdk_auto_platform.build.service_secrets_builder",
+    "EcsComputeArchitecture": "cdk_auto_platform.build.service_task_definition_builder",
+    "ServiceTaskDefinitionBuilder": (
+        "cdk_auto_platform.build.service_task_definition_builder"
+    ),
+    "TagRulesBuilder": "cdk_auto_platform.build.tag_rules_builder",
+    "TrackableServicesBuilder": "cdk_auto_platform.build.trackable_services_builder",
+    "VpcCidrBuilder": "cdk_auto_platform.build.vpc_cidr_builder",
+    # endregion
+    # region: models
+    "AlarmCpuThresholds": "cdk_auto_platform.models.alarms.alarm_cpu_thresholds",
+    "AlarmFreeMemoryThresholds": (
+        "cdk_auto_platform.models.alarms.alarm_free_memory_thresholds"
+    ),
+    "AlarmFreeStorageThresholds": (
+        "cdk_auto_platform.models.alarms.alarm_free_storage_thresholds"
+    ),
+    "AlarmIopsThresholds": "cdk_auto_platform.models.alarms.alarm_iops_thresholds",
+    "AlarmMemoryThresholds": "cdk_auto_platform.models.alarms.alarm_memory_thresholds",
+    "AlarmPercentIoLimitThresholds": (
+        "cdk_auto_platform.models.alarms.alarm_percent_io_limit_thresholds"
+    ),
+    "AlarmBurstCreditBalanceThresholds": (
+        "cdk_auto_platform.models.alarms.alarm_burst_credit_balance_thresholds"
+    ),
+    "DatabaseBlueprint": "cdk_auto_platform.models.blueprints.database_blueprint",
+    "EcsFargateBlueprint": "cdk_auto_platform.models.blueprints.ecs_fargate_blueprint",
+    "FileSystemBlueprint": "cdk_auto_platform.models.blueprints.file_system_blueprint",
+    "ComputeTimeConfiguration": (
+        "cdk_auto_platform.models.compute.compute_time_configuration"
+    ),
+    "DeploymentConfiguration": (
+        "cdk_auto_platform.models.compute.deployment_configuration"
+    ),
+    "FargateCapacityProviders": "cdk_auto_platform.models.compute.fargate_capacity",
+    "FargateCapacity": "cdk_auto_platform.models.compute.fargate_capacity",
+    "FargateVirtualCpu": "cdk_auto_platform.models.compute.fargate_configuration",
+    "FargateConfiguration": "cdk_auto_platform.models.compute.fargate_configuration",
+    "FargateConfigurations": "cdk_auto_platform.models.compute.fargate_configuration",
+    "FargateTaskCompute": "cdk_auto_platform.models.compute.fargate_task_compute",
+    "LatencyPercentiles": "cdk_auto_platform.models.compute.latency_scaling_rule",
+    "LatencyScalingStep": "cdk_auto_platform.models.compute.latency_scaling_rule",
+    "LatencyScalingRule": "cdk_auto_platform.models.compute.latency_scaling_rule",
+    "ListenerRuleConfiguration": (
+        "cdk_auto_platform.models.compute.listener_rule_configuration"
+    ),
+    "LoadBalancingAlgorithms": (
+        "cdk_auto_platform.models.compute.load_balancing_configuration"
+    ),
+    "LoadBalancingConfiguration": (
+        "cdk_auto_platform.models.compute.load_balancing_configuration"
+    ),
+    "OperatingSystem": "cdk_auto_platform.models.compute.operating_system",
+    "CapacityWindow": "cdk_auto_platform.models.compute.scaling_rule",
+    "ScalingPolicies": "cdk_auto_platform.models.compute.scaling_rule",
+    "ScalingPolicyOverride": "cdk_auto_platform.models.compute.scaling_rule",
+    "ScalingRule": "cdk_auto_platform.models.compute.scaling_rule",
+    "ServiceConnectConfiguration": (
+        "cdk_auto_platform.models.compute.service_connect_configuration"
+    ),
+    "TargetProtocolVersions": "cdk_auto_platform.models.compute.service_protocol",
+    "ServiceProtocol": "cdk_auto_platform.models.compute.service_protocol",
+    "UlimitNames": "cdk_auto_platform.models.containers.container_tuning",
+    "ContainerUlimit": "cdk_auto_platform.models.containers.container_tuning",
+    "ScratchMount": "cdk_auto_platform.models.containers.container_tuning",
+    "ContainerTuning": "cdk_auto_platform.models.containers.container_tuning",
+    "DockerCacheModes": "cdk_auto_platform.models.containers.docker_build_options",
+    "DockerBuildOptions": "cdk_auto_platform.models.containers.docker_build_options",
+    "EcsFargateTypes": "cdk_auto_platform.models.containers.ecs_fargate_types",
+    "ImageAcceleration": "cdk_auto_platform.models.containers.image_acceleration",
+    "LatencyStatistics": "cdk_auto_platform.models.containers.otel_collector",
+    "OtelCollector": "cdk_auto_platform.models.containers.otel_collector",
+    "RegistryTypes": "cdk_auto_platform.models.containers.registry_types",
+    "UpstreamRegistries": "cdk_auto_platform.models.containers.upstream_registries",
+    "DatabaseMatrix": "cdk_auto_platform.models.database.database_matrix",
+    "DatabasePrivileges": "cdk_auto_platform.models.database.database_privileges",
+    "EngineTypes": "cdk_auto_platform.models.database.engine_types",
+    "InstanceFamily": "cdk_auto_platform.models.database.instance_family",
+    "InstanceSize": "cdk_auto_platform.models.database.instance_size",
+    "RdsCapacity": "cdk_auto_platform.models.database.rds_capacity",
+    "RdsPerformance": "cdk_auto_platform.models.database.rds_performance",
+    "ServiceUserSecret": "cdk_auto_platform.models.database.service_user_secret",
+    "AppEnvironment": "cdk_auto_platform.models.environments.app_environment",
+    "OidcProviders": "cdk_auto_platform.models.iam.oidc_providers",
+    "PermissionAction": "cdk_auto_platform.models.modules.permission_action",
+    "PugModule": "cdk_auto_platform.models.modules.pug_module",
+    "RuntimeIEventSource": (
+        "cdk_auto_platform.models.modules.runtime.runtime_event_source"
+    ),
+    "RuntimeIFunction": "cdk_auto_platform.models.modules.runtime.runtime_function",
+    "RuntimeIRule": "cdk_auto_platform.models.modules.runtime.runtime_rule",
+    "RuntimeIRuleTarget": (
+        "cdk_auto_platform.models.modules.runtime.runtime_rule_target"
+    ),
+    "Colors": "cdk_auto_platform.models.monitoring.colors",
+    "DrawableService": "cdk_auto_platform.models.monitoring.drawable_service",
+    "TrackableService": "cdk_auto_platform.models.monitoring.trackable_service",
+    "FileSystemAccessPoint": (
+        "cdk_auto_platform.models.storage.file_system_access_point"
+    ),
+    "EfsThroughputModes": "cdk_auto_platform.models.storage.file_system_performance",
+    "EfsPerformanceModes": "cdk_auto_platform.models.storage.file_system_performance",
+    "FileSystemPerformance": (
+        "cdk_auto_platform.models.storage.file_system_performance"
+    ),
+    "CrossPlatform": "cdk_auto_platform.models.tenants.cross_platform",
+    "MsTeamsSecrets": "cdk_auto_platform.models.tenants.cross_platform",
+    "InfrastructureTypes": "cdk_auto_platform.models.tenants.infrastructure_types",
+    "TenantBase": "cdk_auto_platform.models.tenants.tenant_base",
+    "IpPrivateRanges": "cdk_auto_platform.models.vpc.ip_ranges_types",
+    "PrefixListCidr": "cdk_auto_platform.models.vpc.prefix_list_cidr",
+    # endregion
+    # region: modules
+    "ContainerImageParams": "cdk_auto_platform.modules.container_image.infrastructure",
+    "ContainerImagePug": "cdk_auto_platform.modules.container_image.infrastructure",
+    "LambdaPlatform": "cdk_auto_platform.modules.custom_lambda.infrastructure",
+    "LambdaConfig": "cdk_auto_platform.modules.custom_lambda.infrastructure",
+    "LambdaParams": "cdk_auto_platform.modules.custom_lambda.infrastructure",
+    "LambdaPug": "cdk_auto_platform.modules.custom_lambda.infrastructure",
+    "EcrRegistryPug": "cdk_auto_platform.modules.ecr_registry.infrastructure",
+    "EcsFargateServiceParams": (
+        "cdk_auto_platform.modules.ecs_fargate_service.infrastructure"
+    ),
+    "EcsFargateServicePug": (
+        "cdk_auto_platform.modules.ecs_fargate_service.infrastructure"
+    ),
+    "LogGroupParams": (
+        "cdk_auto_platform.modules.ecs_fargate_task_definition.infrastructure"
+    ),
+    "FileSystemParams": (
+        "cdk_auto_platform.modules.ecs_fargate_task_definition.infrastructure"
+    ),
+    "EcsFargateTaskDefinitionParams": (
+        "cdk_auto_platform.modules.ecs_fargate_task_definition.infrastructure"
+    ),
+    "EcsFargateTaskDefinitionPug": (
+        "cdk_auto_platform.modules.ecs_fargate_task_definition.infrastructure"
+    ),
+    "EcsScheduledFargateTaskParams": (
+        "cdk_auto_platform.modules.ecs_scheduled_fargate_task.infrastructure"
+    ),
+    "EcsScheduledFargateTaskPug": (
+        "cdk_auto_platform.modules.ecs_scheduled_fargate_task.infrastructure"
+    ),
+    "CronTriggerParams": "cdk_auto_platform.modules.events.cron_trigger.infrastructure",
+    "CronTrigger": "cdk_auto_platform.modules.events.cron_trigger.infrastructure",
+    "LambdaSourceParams": (
+        "cdk_auto_platform.modules.events.lambda_source.infrastructure"
+    ),
+    "LambdaSourcePug": "cdk_auto_platform.modules.events.lambda_source.infrastructure",
+    "LogGroupPug": "cdk_auto_platform.modules.logs.log_group.infrastructure",
+    # endregion
+    # region: packages
+    "ApplicationDashboard": (
+        "cdk_auto_platform.packages.application_dashboard.infrastructure"
+    ),
+    "ApplicationManager": (
+        "cdk_auto_platform.packages.application_manager.infrastructure"
+    ),
+    "ApplicationMonitoring": (
+        "cdk_auto_platform.packages.application_monitoring.infrastructure"
+    ),
+    "CodeArtifactDomain": (
+        "cdk_auto_platform.packages.code_artifact_domain.infrastructure"
+    ),
+    "CodeArtifactRepository": (
+        "cdk_auto_platform.packages.code_artifact_repository.infrastructure"
+    ),
+    "Databases": "cdk_auto_platform.packages.databases.infrastructure",
+    "EcsCluster": "cdk_auto_platform.packages.ecs_cluster.infrastructure",
+    "EcsScheduledTask": "cdk_auto_platform.packages.ecs_scheduled_task.infrastructure",
+    "EcsService": "cdk_auto_platform.packages.ecs_service.infrastructure",
+    "FactoryDatabases": "cdk_auto_platform.packages.factory_databases.infrastructure",
+    "FederatedDns": "cdk_auto_platform.packages.federated_dns.infrastructure",
+    "BitBucketOidcParams": (
+        "cdk_auto_platform.packages.iam.bitbucket_oidc.infrastructure"
+    ),
+    "BitBucketOidc": "cdk_auto_platform.packages.iam.bitbucket_oidc.infrastructure",
+    "GitHubOidc": "cdk_auto_platform.packages.iam.github_oidc.infrastructure",
+    "InstanceKeyPair": "cdk_auto_platform.packages.instance_key_pair.infrastructure",
+    "OperationsSizeT4g": (
+        "cdk_auto_platform.packages.instance_operations.infrastructure"
+    ),
+    "OperationsSizeM7g": (
+        "cdk_auto_platform.packages.instance_operations.infrastructure"
+    ),
+    "InstanceSelector": "cdk_auto_platform.packages.instance_operations.infrastructure",
+    "InstanceOperations": (
+        "cdk_auto_platform.packages.instance_operations.infrastructure"
+    ),
+    "Networking": "cdk_auto_platform.packages.networking.infrastructure",
+    "PowerBiBastion": "cdk_auto_platform.packages.power_bi_bastion.infrastructure",
+    "PullThroughCache": "cdk_auto_platform.packages.pull_through_cache.infrastructure",
+    "SharedFileSystem": "cdk_auto_platform.packages.shared_file_system.infrastructure",
+    "SharedLoadBalancer": (
+        "cdk_auto_platform.packages.shared_load_balancer.infrastructure"
+    ),
+    # endregion
+    # region: stacks
+    "BaseCoreStack": "cdk_auto_platform.stacks.base.core_stack.component",
+    "BaseSharedStack": "cdk_auto_platform.stacks.base.shared_stack.component",
+    "OneTimeEc2ConfigStack": (
+        "cdk_auto_platform.stacks.one_time.ec2_config_stack.component"
+    ),
+    "OidcParams": "cdk_auto_platform.stacks.one_time.pipelines_iam_stack.component",
+    "OneTimePipelinesIamStack": (
+        "cdk_auto_platform.stacks.one_time.pipelines_iam_stack.component"
+    ),
+    # endregion
+}
+
+__all__ = ["__version__", "__author__", "__email__", *_EXPORTS]
+
+
+def __getattr__(name: str):
+    module_path = _EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_path), name)
+    globals()[name] = value
+    return value
+
 
-__all__ = ["__version__", "__author__", "__email__"]
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -1,85 +1,159 @@
 from enum import Enum
+from typing import Optional, Union
 
 # region: aws-cdk
-from aws_cdk.aws_elasticloadbalancingv2 import HttpCodeElb
+from aws_cdk.aws_cloudwatch import Metric
 from aws_cdk.aws_ecs_patterns import ApplicationLoadBalancedFargateService
 from aws_cdk.aws_logs import LogGroup
 from aws_cdk.aws_rds import DatabaseInstance
 # endregion
 
 # region: iden-q-auto-platform
+from cdk_auto_platform.build.metric_registry_builder import (
+    DatabaseMetrics,
+    FargateServiceMetrics,
+    FileSystemMetrics,
+    LoadBalancerMetrics,
+    MetricRegistryBuilder,
+    MetricSpec,
+    ServiceConnectMetrics,
+    TargetGroupMetrics,
+    TaskStartupMetrics,
+)
+from cdk_auto_platform.models.containers.otel_collector import (
+    LatencyStatistics,
+    OtelCollector,
+)
 from cdk_auto_platform.models.monitoring.colors import Colors
+from cdk_auto_platform.models.tenants.tenant_base import TenantBase
+from cdk_auto_platform.modules.ecs_fargate_service_connect.infrastructure import (
+    ServiceConnectFargateService,
+)
+from cdk_auto_platform.modules.ecs_fargate_shared_service.infrastructure import (
+    SharedLoadBalancedFargateService,
+)
+from cdk_auto_platform.modules.ecs_fargate_task_definition.infrastructure import (
+    get_telemetry_service_name,
+)
 from cdk_auto_platform.packages.application_dashboard.infrastructure import (
     DrawableService,
 )
+from cdk_auto_platform.packages.shared_file_system.infrastructure import (
+    SharedFileSystem,
+)
 # endregion
 
+SERVICE_LOAD_BALANCER_METRICS = [
+    LoadBalancerMetrics.REQUEST_COUNT,
+    LoadBalancerMetrics.TARGET_RESPONSE_TIME,
+    LoadBalancerMetrics.ACTIVE_CONNECTION_COUNT,
+    LoadBalancerMetrics.NEW_CONNECTION_COUNT,
+    LoadBalancerMetrics.PROCESSED_BYTES,
+    LoadBalancerMetrics.HTTP_CODE_ELB_5XX_COUNT,
+    LoadBalancerMetrics.HTTP_CODE_ELB_4XX_COUNT,
+]
+SERVICE_CONNECT_METRICS = [
+    ServiceConnectMetrics.REQUEST_COUNT,
+    ServiceConnectMetrics.TARGET_RESPONSE_TIME,
+    ServiceConnectMetrics.ACTIVE_CONNECTION_COUNT,
+    ServiceConnectMetrics.NEW_CONNECTION_COUNT,
+    ServiceConnectMetrics.PROCESSED_BYTES,
+    ServiceConnectMetrics.HTTP_CODE_TARGET_5XX_COUNT,
+    ServiceConnectMetrics.HTTP_CODE_TARGET_4XX_COUNT,
+]
+SERVICE_TARGET_GROUP_METRICS = [
+    TargetGroupMetrics.REQUEST_COUNT,
+    TargetGroupMetrics.TARGET_RESPONSE_TIME,
+    TargetGroupMetrics.HEALTHY_HOST_COUNT,
+    TargetGroupMetrics.UNHEALTHY_HOST_COUNT,
+    TargetGroupMetrics.HTTP_CODE_TARGET_5XX_COUNT,
+    TargetGroupMetrics.HTTP_CODE_TARGET_4XX_COUNT,
+]
+TASK_STARTUP_METRICS = [
+    TaskStartupMetrics.TASK_STARTUP_TIME,
+    TaskStartupMetrics.IMAGE_PULL_TIME,
+]
+SERVICE_METRICS = [
+    FargateServiceMetrics.CPU_UTILIZATION,
+    FargateServiceMetrics.MEMORY_UTILIZATION,
+]
+LATENCY_COLORS = {
+    LatencyStatistics.P50: Colors.LATENCY_P50_COLOR,
+    LatencyStatistics.P90: Colors.LATENCY_P90_COLOR,
+    LatencyStatistics.P99: Colors.LATENCY_P99_COLOR,
+}
+DATABASE_METRICS = [
+    DatabaseMetrics.CPU_UTILIZATION,
+    DatabaseMetrics.FREE_STORAGE_SPACE,
+    DatabaseMetrics.FREEABLE_MEMORY,
+    DatabaseMetrics.READ_IOPS,
+    DatabaseMetrics.WRITE_IOPS,
+]
+FILE_SYSTEM_THROUGHPUT_METRICS = [
+    FileSystemMetrics.PERMITTED_THROUGHPUT,
+    FileSystemMetrics.METERED_IO_BYTES,
+]
+
 
-class DrawableServicesBuilder:
+class DrawableServicesBuilder(MetricRegistryBuilder):
     def _build_drawable_services(
             self,
             services: dict[
                 Enum,
-                ApplicationLoadBalancedFargateService
+                Union[
+                    ApplicationLoadBalancedFargateService,
+                    ServiceConnectFargateService,
+                    SharedLoadBalancedFargateService
+                ]
             ],
             log_groups: dict[Enum, LogGroup],
-            databases: dict[Enum, DatabaseInstance]
+            databases: dict[Enum, DatabaseInstance],
+            tenant: TenantBase,
+            file_systems: Optional[dict[Enum, SharedFileSystem]] = None
     ):
         self.drawable_services = []
         for service, service_instance in services.items():
+            load_balancer = service_instance.load_balancer
+            fargate_service = service_instance.service
+            blueprint = tenant.ecs_fargate_blueprints[service]
+            # The latency histograms exported by the OTel collector sidecar
+            latency_metrics = (
+                self._get_latency_metrics(tenant, service, blueprint.otel_collector)
+                if blueprint.otel_collector
+                else []
+            )
+            # Published by the task startup metrics function of the cluster
+            startup_metrics = (
+                self._get_task_startup_metrics(service, service_instance)
+                if blueprint.image_acceleration
+                else []
+            )
+            if isinstance(service_instance, ServiceConnectFargateService):
+                traffic_metrics = self._get_service_connect_metrics(
+                    service, service_instance
+                )
+            elif isinstance(service_instance, SharedLoadBalancedFargateService):
+                # The load balancer metrics add up every service of the ALB
+                traffic_metrics = [
+                    self.metric_registry.get_labeled(
+                        service, service_instance.target_group.metrics, spec
+                    )
+                    for spec in SERVICE_TARGET_GROUP_METRICS
+                ]
+            else:
+                traffic_metrics = [
+                    self.metric_registry.get_labeled(service, load_balancer, spec)
+                    for spec in SERVICE_LOAD_BALANCER_METRICS
+                ]
             self.drawable_services.extend([
                 DrawableService(
                     service,
-                    [
-                        service_instance.
-                        load_balancer.
-                        metric_request_count(
-                            color=Colors.REQUEST_COUNT_COLOR
-                        ),
-                        service_instance.
-                        load_balancer.
-                        metric_target_response_time(
-                            color=Colors.RESPONSE_TIME_COLOR
-                        ),
-                        service_instance.
-                        load_balancer.
-                        metric_active_connection_count(
-                            color=Colors.ACTIVE_CONNECTION_COUNT_COLOR
-                        ),
-                        service_instance.
-                        load_balancer.
-                        metric_new_connection_count(
-                            color=Colors.NEW_CONNECTION_COUNT_COLOR
-                        ),
-                        service_instance.
-                        load_balancer.
-                        metric_processed_bytes(
-                            color=Colors.PROCESSED_BYTES_COLOR
-                        ),
-                        service_instance.
-                        load_balancer.
-                        metric_http_code_elb(
-                            code=HttpCodeElb.ELB_5XX_COUNT,
-                            color=Colors.HTTP_CODE_ELB_5XX_COUNT_COLOR
-                        ),
-                        service_instance.
-                        load_balancer.
-                        metric_http_code_elb(
-                            code=HttpCodeElb.ELB_4XX_COUNT,
-                            color=Colors.HTTP_CODE_ELB_4XX_COUNT_COLOR
-                        ),
-                        service_instance.
-                        service.
-                        metric_cpu_utilization(
-                            color=Colors.CPU_UTILIZATION_COLOR
-                        ),
-                        service_instance.
-                        service.
-                        metric_memory_utilization(
-                            color=Colors.MEMORY_UTILIZATION_COLOR
-                        )
-                    ],
-                    log_groups.get(service)
+                    traffic_metrics + [
+                        self.metric_registry.get_labeled(service, fargate_service, spec)
+                        for spec in SERVICE_METRICS
+                    ] + latency_metrics + startup_metrics,
+                    log_groups.get(service),
+                    is_labeled=True
                 )
             ])
 
@@ -88,26 +162,107 @@ class DrawableServicesBuilder:
                 DrawableService(
                     service,
                     [
-                        db_instance.
-                        metric_cpu_utilization(
-                            color=Colors.CPU_UTILIZATION_COLOR
-                        ),
-                        db_instance.
-                        metric_free_storage_space(
-                            color=Colors.FREE_STORAGE_SPACE_COLOR
-                        ),
-                        db_instance.
-                        metric_freeable_memory(
-                            color=Colors.FREEABLE_MEMORY_COLOR
-                        ),
-                        db_instance.
-                        metric_read_iops(
-                            color=Colors.READ_IOPS_COLOR
-                        ),
-                        db_instance.
-                        metric_write_iops(
-                            color=Colors.WRITE_IOPS_COLOR
+                        self.metric_registry.get_labeled(service, db_instance, spec)
+                        for spec in DATABASE_METRICS
+                    ],
+                    is_labeled=True
+                )
+            ])
+
+        for file_system, shared_file_system in (file_systems or {}).items():
+            performance = shared_file_system.blueprint.performance
+            file_system_metrics = list(FILE_SYSTEM_THROUGHPUT_METRICS)
+            if performance.has_burst_credits:
+                file_system_metrics.insert(0, FileSystemMetrics.BURST_CREDIT_BALANCE)
+            if performance.has_io_limit:
+                file_system_metrics.insert(0, FileSystemMetrics.PERCENT_IO_LIMIT)
+            self.drawable_services.extend([
+                DrawableService(
+                    file_system,
+                    [
+                        self.metric_registry.get_labeled(
+                            file_system, shared_file_system, spec
                         )
-                    ]
+                        for spec in file_system_metrics
+                    ],
+                    is_labeled=True
                 )
             ])
+
+    def _get_service_connect_metrics(
+            self,
+            service: Enum,
+            service_instance: ServiceConnectFargateService
+    ) -> list[Metric]:
+        dimensions_map = {
+            "ClusterName": service_instance.cluster.cluster_name,
+            "ServiceName": service_instance.service.service_name,
+            "DiscoveryName": service_instance.discovery_name,
+        }
+        return [
+            self.metric_registry.get_labeled(
+                service,
+                Metric(
+                    namespace=spec.namespace,
+                    metric_name=spec.metric_name,
+                    dimensions_map=dimensions_map,
+                ),
+                spec,
+            )
+            for spec in SERVICE_CONNECT_METRICS
+        ]
+
+    def _get_task_startup_metrics(
+            self,
+            service: Enum,
+            service_instance: Union[
+                ApplicationLoadBalancedFargateService,
+                ServiceConnectFargateService,
+                SharedLoadBalancedFargateService
+            ]
+    ) -> list[Metric]:
+        dimensions_map = {
+            "ClusterName": service_instance.cluster.cluster_name,
+            "ServiceName": service_instance.service.service_name,
+        }
+        return [
+            self.metric_registry.get_labeled(
+                service,
+                Metric(
+                    namespace=spec.namespace,
+                    metric_name=spec.metric_name,
+                    dimensions_map=dimensions_map,
+                ),
+                spec,
+            )
+            for spec in TASK_STARTUP_METRICS
+        ]
+
+    def _get_latency_metrics(
+            self,
+            tenant: TenantBase,
+            service: Enum,
+            otel_collector: OtelCollector
+    ) -> list[Metric]:
+        latency_metric = Metric(
+            namespace=otel_collector.metrics_namespace,
+            metric_name=otel_collector.latency_metric_name,
+            dimensions_map={
+                "service.name": get_telemetry_service_name(tenant, service)
+            },
+        )
+        return [
+            self.metric_registry.get_labeled(
+                service,
+                latency_metric,
+                MetricSpec(
+                    "with_",
+                    f"{otel_collector.latency_metric_name} {statistic.value}",
+                    otel_collector.metrics_namespace,
+                    statistic.value,
+                    LATENCY_COLORS[statistic],
+                    factory_kwargs={"statistic": statistic.value},
+                ),
+            )
+            for statistic in otel_collector.latency_statistics
+        ]
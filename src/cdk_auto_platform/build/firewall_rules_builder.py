@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Optional
+from typing import Optional, Union
 
 # region aws_cdk
 from aws_cdk.aws_ecs_patterns import (
@@ -12,6 +12,12 @@ from aws_cdk.aws_ec2 import Port, PrefixList, Peer, SecurityGroup
 
 from cdk_auto_platform.models.tenants.tenant_base import TenantBase
 from cdk_auto_platform.models.environments.app_environment import AppEnvironment
+from cdk_auto_platform.modules.ecs_fargate_service_connect.infrastructure import (
+    ServiceConnectFargateService,
+)
+from cdk_auto_platform.modules.ecs_fargate_shared_service.infrastructure import (
+    SharedLoadBalancedFargateService,
+)
 
 
 class FirewallRulesBuilder:
@@ -20,7 +26,11 @@ class FirewallRulesBuilder:
             tenant: TenantBase,
             services: dict[
                 Enum,
-                ApplicationLoadBalancedFargateService
+                Union[
+                    ApplicationLoadBalancedFargateService,
+                    ServiceConnectFargateService,
+                    SharedLoadBalancedFargateService
+                ]
             ],
             databases: dict[Enum, DatabaseInstance],
             prefix_list: PrefixList,
@@ -69,3 +79,30 @@ class FirewallRulesBuilder:
                         description=(
                             "Allow Power BI Bastion to connect to database")
                     )
+
+        FirewallRulesBuilder._build_service_connect_rules(services)
+
+    @staticmethod
+    def _build_service_connect_rules(
+            services: dict[
+                Enum,
+                Union[
+                    ApplicationLoadBalancedFargateService,
+                    ServiceConnectFargateService,
+                    SharedLoadBalancedFargateService
+                ]
+            ]
+    ):
+        # Service Connect clients reach the server tasks directly, not via ALB
+        for service, service_instance in services.items():
+            if not isinstance(service_instance, ServiceConnectFargateService):
+                continue
+            for client, client_instance in services.items():
+                if client == service:
+                    continue
+                service_instance.service.connections.allow_from(
+                    client_instance.service,
+                    Port.tcp(service_instance.port),
+                    (f"Allow {client.name} container to connect "
+                     f"to {service.name} through Service Connect")
+                )
@@ -0,0 +1,410 @@
+from enum import Enum
+from typing import Any, Optional
+
+# region: aws-cdk
+from aws_cdk import Duration
+from aws_cdk.aws_cloudwatch import Metric
+from aws_cdk.aws_elasticloadbalancingv2 import HttpCodeElb, HttpCodeTarget
+# endregion
+
+# region: iden-q-auto-platform
+from cdk_auto_platform.models.containers.image_acceleration import (
+    IMAGE_PULL_TIME_METRIC_NAME,
+    TASK_STARTUP_METRICS_NAMESPACE,
+    TASK_STARTUP_TIME_METRIC_NAME,
+)
+from cdk_auto_platform.models.monitoring.colors import Colors
+from cdk_auto_platform.models.storage.file_system_performance import (
+    EFS_METRICS_NAMESPACE,
+)
+# endregion
+
+DEFAULT_PERIOD_MINUTES = 5
+
+
+class MetricSpec:
+    def __init__(
+        self,
+        factory_name: str,
+        metric_name: str,
+        namespace: str,
+        statistic: str,
+        color: str,
+        period_minutes: Optional[int] = None,
+        factory_kwargs: Optional[dict[str, Any]] = None,
+    ):
+        self.factory_name = factory_name
+        self.metric_name = metric_name
+        self.namespace = namespace
+        self.statistic = statistic
+        self.color = color
+        self.period_minutes = period_minutes
+        self.factory_kwargs = factory_kwargs or {}
+
+    @property
+    def label(self) -> str:
+        return f"{self.metric_name} [{self.namespace}]"
+
+    def options(self, labeled: bool = False) -> dict[str, Any]:
+        options = dict(self.factory_kwargs)
+        if labeled:
+            options.update(color=self.color, label=self.label)
+        if self.period_minutes is not None:
+            options["period"] = Duration.minutes(self.period_minutes)
+        return options
+
+
+class LoadBalancerMetrics:
+    _NAMESPACE = "AWS/ApplicationELB"
+
+    REQUEST_COUNT = MetricSpec(
+        "metric_request_count",
+        "RequestCount",
+        _NAMESPACE,
+        "Sum",
+        Colors.REQUEST_COUNT_COLOR,
+    )
+    TARGET_RESPONSE_TIME = MetricSpec(
+        "metric_target_response_time",
+        "TargetResponseTime",
+        _NAMESPACE,
+        "Average",
+        Colors.RESPONSE_TIME_COLOR,
+    )
+    ACTIVE_CONNECTION_COUNT = MetricSpec(
+        "metric_active_connection_count",
+        "ActiveConnectionCount",
+        _NAMESPACE,
+        "Sum",
+        Colors.ACTIVE_CONNECTION_COUNT_COLOR,
+    )
+    NEW_CONNECTION_COUNT = MetricSpec(
+        "metric_new_connection_count",
+        "NewConnectionCount",
+        _NAMESPACE,
+        "Sum",
+        Colors.NEW_CONNECTION_COUNT_COLOR,
+    )
+    PROCESSED_BYTES = MetricSpec(
+        "metric_processed_bytes",
+        "ProcessedBytes",
+        _NAMESPACE,
+        "Sum",
+        Colors.PROCESSED_BYTES_COLOR,
+    )
+    HTTP_CODE_ELB_5XX_COUNT = MetricSpec(
+        "metric_http_code_elb",
+        "HTTPCode_ELB_5XX_Count",
+        _NAMESPACE,
+        "Sum",
+        Colors.HTTP_CODE_ELB_5XX_COUNT_COLOR,
+        factory_kwargs={"code": HttpCodeElb.ELB_5XX_COUNT},
+    )
+    HTTP_CODE_ELB_4XX_COUNT = MetricSpec(
+        "metric_http_code_elb",
+        "HTTPCode_ELB_4XX_Count",
+        _NAMESPACE,
+        "Sum",
+        Colors.HTTP_CODE_ELB_4XX_COUNT_COLOR,
+        factory_kwargs={"code": HttpCodeElb.ELB_4XX_COUNT},
+    )
+
+
+class TargetGroupMetrics:
+    """
+    Metrics of the target group of a service, built from its metrics
+    property. They isolate a service behind a shared ALB.
+    """
+
+    _NAMESPACE = "AWS/ApplicationELB"
+
+    REQUEST_COUNT = MetricSpec(
+        "request_count",
+        "RequestCount",
+        _NAMESPACE,
+        "Sum",
+        Colors.REQUEST_COUNT_COLOR,
+    )
+    TARGET_RESPONSE_TIME = MetricSpec(
+        "target_response_time",
+        "TargetResponseTime",
+        _NAMESPACE,
+        "Average",
+        Colors.RESPONSE_TIME_COLOR,
+    )
+    HEALTHY_HOST_COUNT = MetricSpec(
+        "healthy_host_count",
+        "HealthyHostCount",
+        _NAMESPACE,
+        "Average",
+        Colors.HEALTHY_HOST_COUNT_COLOR,
+    )
+    UNHEALTHY_HOST_COUNT = MetricSpec(
+        "unhealthy_host_count",
+        "UnHealthyHostCount",
+        _NAMESPACE,
+        "Average",
+        Colors.UNHEALTHY_HOST_COUNT_COLOR,
+    )
+    HTTP_CODE_TARGET_5XX_COUNT = MetricSpec(
+        "http_code_target",
+        "HTTPCode_Target_5XX_Count",
+        _NAMESPACE,
+        "Sum",
+        Colors.HTTP_CODE_ELB_5XX_COUNT_COLOR,
+        factory_kwargs={"code": HttpCodeTarget.TARGET_5XX_COUNT},
+    )
+    HTTP_CODE_TARGET_4XX_COUNT = MetricSpec(
+        "http_code_target",
+        "HTTPCode_Target_4XX_Count",
+        _NAMESPACE,
+        "Sum",
+        Colors.HTTP_CODE_ELB_4XX_COUNT_COLOR,
+        factory_kwargs={"code": HttpCodeTarget.TARGET_4XX_COUNT},
+    )
+
+
+class FargateServiceMetrics:
+    _NAMESPACE = "AWS/ECS"
+
+    CPU_UTILIZATION = MetricSpec(
+        "metric_cpu_utilization",
+        "CPUUtilization",
+        _NAMESPACE,
+        "Average",
+        Colors.CPU_UTILIZATION_COLOR,
+    )
+    MEMORY_UTILIZATION = MetricSpec(
+        "metric_memory_utilization",
+        "MemoryUtilization",
+        _NAMESPACE,
+        "Average",
+        Colors.MEMORY_UTILIZATION_COLOR,
+    )
+
+
+class ServiceConnectMetrics:
+    """
+    Metrics of the requests received by a Service Connect service. They are
+    built with Metric.with_ on a base metric of the service discovery name.
+    """
+
+    _NAMESPACE = "AWS/ECS"
+
+    REQUEST_COUNT = MetricSpec(
+        "with_",
+        "RequestCount",
+        _NAMESPACE,
+        "Sum",
+        Colors.REQUEST_COUNT_COLOR,
+        factory_kwargs={"statistic": "Sum"},
+    )
+    TARGET_RESPONSE_TIME = MetricSpec(
+        "with_",
+        "TargetResponseTime",
+        _NAMESPACE,
+        "Average",
+        Colors.RESPONSE_TIME_COLOR,
+        factory_kwargs={"statistic": "Average"},
+    )
+    ACTIVE_CONNECTION_COUNT = MetricSpec(
+        "with_",
+        "ActiveConnectionCount",
+        _NAMESPACE,
+        "Sum",
+        Colors.ACTIVE_CONNECTION_COUNT_COLOR,
+        factory_kwargs={"statistic": "Sum"},
+    )
+    NEW_CONNECTION_COUNT = MetricSpec(
+        "with_",
+        "NewConnectionCount",
+        _NAMESPACE,
+        "Sum",
+        Colors.NEW_CONNECTION_COUNT_COLOR,
+        factory_kwargs={"statistic": "Sum"},
+    )
+    PROCESSED_BYTES = MetricSpec(
+        "with_",
+        "ProcessedBytes",
+        _NAMESPACE,
+        "Sum",
+        Colors.PROCESSED_BYTES_COLOR,
+        factory_kwargs={"statistic": "Sum"},
+    )
+    HTTP_CODE_TARGET_5XX_COUNT = MetricSpec(
+        "with_",
+        "HTTPCode_Target_5XX_Count",
+        _NAMESPACE,
+        "Sum",
+        Colors.HTTP_CODE_ELB_5XX_COUNT_COLOR,
+        factory_kwargs={"statistic": "Sum"},
+    )
+    HTTP_CODE_TARGET_4XX_COUNT = MetricSpec(
+        "with_",
+        "HTTPCode_Target_4XX_Count",
+        _NAMESPACE,
+        "Sum",
+        Colors.HTTP_CODE_ELB_4XX_COUNT_COLOR,
+        factory_kwargs={"statistic": "Sum"},
+    )
+
+
+class TaskStartupMetrics:
+    """
+    Time from creation to running, and image pull time, of the new tasks of a
+    service. They are built with Metric.with_ on a base metric of the service.
+    """
+
+    _NAMESPACE = TASK_STARTUP_METRICS_NAMESPACE
+
+    TASK_STARTUP_TIME = MetricSpec(
+        "with_",
+        TASK_STARTUP_TIME_METRIC_NAME,
+        _NAMESPACE,
+        "p90",
+        Colors.TASK_STARTUP_TIME_COLOR,
+        factory_kwargs={"statistic": "p90"},
+    )
+    IMAGE_PULL_TIME = MetricSpec(
+        "with_",
+        IMAGE_PULL_TIME_METRIC_NAME,
+        _NAMESPACE,
+        "p90",
+        Colors.IMAGE_PULL_TIME_COLOR,
+        factory_kwargs={"statistic": "p90"},
+    )
+
+
+class DatabaseMetrics:
+    _NAMESPACE = "AWS/RDS"
+
+    CPU_UTILIZATION = MetricSpec(
+        "metric_cpu_utilization",
+        "CPUUtilization",
+        _NAMESPACE,
+        "Average",
+        Colors.CPU_UTILIZATION_COLOR,
+    )
+    FREE_STORAGE_SPACE = MetricSpec(
+        "metric_free_storage_space",
+        "FreeStorageSpace",
+        _NAMESPACE,
+        "Average",
+        Colors.FREE_STORAGE_SPACE_COLOR,
+    )
+    FREEABLE_MEMORY = MetricSpec(
+        "metric_freeable_memory",
+        "FreeableMemory",
+        _NAMESPACE,
+        "Average",
+        Colors.FREEABLE_MEMORY_COLOR,
+    )
+    READ_IOPS = MetricSpec(
+        "metric_read_iops",
+        "ReadIOPS",
+        _NAMESPACE,
+        "Average",
+        Colors.READ_IOPS_COLOR,
+    )
+    WRITE_IOPS = MetricSpec(
+        "metric_write_iops",
+        "WriteIOPS",
+        _NAMESPACE,
+        "Average",
+        Colors.WRITE_IOPS_COLOR,
+    )
+
+
+class FileSystemMetrics:
+    """
+    Metrics of a shared EFS file system, built with its metric method.
+    PercentIOLimit is only published in the generalPurpose performance mode,
+    BurstCreditBalance only matters in the bursting throughput mode.
+    """
+
+    _NAMESPACE = EFS_METRICS_NAMESPACE
+
+    PERCENT_IO_LIMIT = MetricSpec(
+        "metric",
+        "PercentIOLimit",
+        _NAMESPACE,
+        "Maximum",
+        Colors.PERCENT_IO_LIMIT_COLOR,
+        factory_kwargs={"metric_name": "PercentIOLimit", "statistic": "Maximum"},
+    )
+    BURST_CREDIT_BALANCE = MetricSpec(
+        "metric",
+        "BurstCreditBalance",
+        _NAMESPACE,
+        "Minimum",
+        Colors.BURST_CREDIT_BALANCE_COLOR,
+        factory_kwargs={"metric_name": "BurstCreditBalance", "statistic": "Minimum"},
+    )
+    PERMITTED_THROUGHPUT = MetricSpec(
+        "metric",
+        "PermittedThroughput",
+        _NAMESPACE,
+        "Average",
+        Colors.PERMITTED_THROUGHPUT_COLOR,
+        factory_kwargs={"metric_name": "PermittedThroughput", "statistic": "Average"},
+    )
+    METERED_IO_BYTES = MetricSpec(
+        "metric",
+        "MeteredIOBytes",
+        _NAMESPACE,
+        "Sum",
+        Colors.METERED_IO_BYTES_COLOR,
+        factory_kwargs={"metric_name": "MeteredIOBytes", "statistic": "Sum"},
+    )
+
+
+class MetricRegistry:
+    """
+    Builds every CloudWatch metric of a stack once, keyed by (service, metric
+    name, statistic, period). Alarms share the plain metric, while dashboards
+    get a variant with the label and colour of its spec applied at creation.
+    A label turns an alarm into a metric math alarm, so both are kept.
+    """
+
+    def __init__(self):
+        self._metrics: dict[tuple[Enum, str, str, int], Metric] = {}
+        self._labeled_metrics: dict[tuple[Enum, str, str, int], Metric] = {}
+
+    def get(self, service: Enum, source: Any, spec: MetricSpec) -> Metric:
+        return self._get_or_create(self._metrics, service, source, spec, False)
+
+    def get_labeled(self, service: Enum, source: Any, spec: MetricSpec) -> Metric:
+        return self._get_or_create(
+            self._labeled_metrics, service, source, spec, True
+        )
+
+    @staticmethod
+    def _get_or_create(
+        metrics: dict[tuple[Enum, str, str, int], Metric],
+        service: Enum,
+        source: Any,
+        spec: MetricSpec,
+        labeled: bool,
+    ) -> Metric:
+        key = (
+            service,
+            spec.metric_name,
+            spec.statistic,
+            spec.period_minutes or DEFAULT_PERIOD_MINUTES,
+        )
+        metric = metrics.get(key)
+        if metric is None:
+            metric = getattr(source, spec.factory_name)(**spec.options(labeled))
+            metrics[key] = metric
+        return metric
+
+    def __len__(self) -> int:
+        return len(self._metrics) + len(self._labeled_metrics)
+
+
+class MetricRegistryBuilder:
+    @property
+    def metric_registry(self) -> MetricRegistry:
+        if not hasattr(self, "_metric_registry"):
+            self._metric_registry = MetricRegistry()
+        return self._metric_registry
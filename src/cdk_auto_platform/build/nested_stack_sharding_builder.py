@@ -0,0 +1,36 @@
+from typing import Callable, TypeVar
+from constructs import Construct
+from aws_cdk import NestedStack, Stack
+
+from cdk_auto_platform.utils.synthesis.stack_sharding import ShardingPlan
+
+TPackage = TypeVar("TPackage", bound=Construct)
+
+
+class NestedStackShardingBuilder:
+    def _build_sharded(
+        self,
+        package_id: str,
+        build: Callable[[Construct], TPackage],
+        is_movable: bool = False,
+    ) -> TPackage:
+        """
+        is_movable lets the package be nested although it has explicitly
+        named resources, see Nested Stack Sharding in the README first.
+        """
+        stack: Stack = self  # type: ignore
+        if not hasattr(self, "_sharding_stack_path"):
+            self._sharding_stack_path = stack.node.path
+
+        plan = ShardingPlan.load()
+        if plan.is_nested(self._sharding_stack_path, package_id):
+            construct_id = f"{package_id}-nested"
+            package = build(NestedStack(stack, construct_id))
+        else:
+            package = build(stack)
+            construct_id = package.node.id
+
+        plan.register(
+            self._sharding_stack_path, package_id, construct_id, is_movable
+        )
+        return package
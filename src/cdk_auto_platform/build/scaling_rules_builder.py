@@ -1,5 +1,17 @@
 from enum import Enum
+from typing import Any
+from aws_cdk import Aws, Duration, TimeZone
+from aws_cdk import aws_applicationautoscaling as appscaling, aws_ecs as ecs
+from aws_cdk import aws_iam as iam
 from aws_cdk.aws_ecs_patterns import ApplicationLoadBalancedFargateService
+from cdk_auto_platform.models.compute.latency_scaling_rule import LatencyScalingRule
+from cdk_auto_platform.models.compute.scaling_rule import (
+    ScalingPolicies,
+    ScalingRule,
+)
+from cdk_auto_platform.modules.private.permission_actions.ecs_services import (
+    TaskProtectionPermissionAction,
+)
 from cdk_auto_platform.models.tenants.tenant_base import TenantBase
 
 
@@ -13,8 +25,10 @@ class ScalingRulesBuilder:
             ]):
         CPU_POLICY_NAME = "cpu-scaling"
         MEMORY_POLICY_NAME = "memory-scaling"
+        REQUEST_COUNT_POLICY_NAME = "request-count-scaling"
 
         for service, service_instance in services.items():
+            scaling_rule = tenant.ecs_fargate_blueprints[service].scaling_rule
             api_scaling = (
                 service_instance.
                 service.
@@ -36,7 +50,10 @@ class ScalingRulesBuilder:
                 target_utilization_percent=(
                     tenant.ecs_fargate_blueprints[service]
                     .scaling_rule.trigger_percent_cpu
-                )
+                ),
+                **ScalingRulesBuilder._get_target_tracking_settings(
+                    scaling_rule, ScalingPolicies.CPU
+                ),
             )
 
             api_scaling.scale_on_memory_utilization(
@@ -45,5 +62,138 @@ class ScalingRulesBuilder:
                 target_utilization_percent=(
                     tenant.ecs_fargate_blueprints[service]
                     .scaling_rule.trigger_percent_memory
+                ),
+                **ScalingRulesBuilder._get_target_tracking_settings(
+                    scaling_rule, ScalingPolicies.MEMORY
+                ),
+            )
+
+            if scaling_rule.requests_per_target is not None:
+                api_scaling.scale_on_request_count(
+                    REQUEST_COUNT_POLICY_NAME,
+                    policy_name=REQUEST_COUNT_POLICY_NAME,
+                    requests_per_target=scaling_rule.requests_per_target,
+                    target_group=service_instance.target_group,
+                    **ScalingRulesBuilder._get_target_tracking_settings(
+                        scaling_rule, ScalingPolicies.REQUEST_COUNT
+                    ),
                 )
+
+            if scaling_rule.latency_scaling is not None:
+                ScalingRulesBuilder._build_latency_scaling(
+                    api_scaling, service_instance, scaling_rule
+                )
+
+            ScalingRulesBuilder._build_capacity_windows(api_scaling, scaling_rule)
+
+            if scaling_rule.task_scale_in_protection:
+                ScalingRulesBuilder._build_task_scale_in_protection(
+                    service_instance, scaling_rule
+                )
+
+    @staticmethod
+    def _get_target_tracking_settings(
+            scaling_rule: ScalingRule,
+            policy: ScalingPolicies) -> dict[str, Any]:
+        # Unset cooldowns are left to the Application Auto Scaling defaults
+        settings = scaling_rule.get_policy_settings(policy)
+        target_tracking_settings: dict[str, Any] = {}
+        if settings.scale_in_cooldown_seconds is not None:
+            target_tracking_settings["scale_in_cooldown"] = Duration.seconds(
+                settings.scale_in_cooldown_seconds
+            )
+        if settings.scale_out_cooldown_seconds is not None:
+            target_tracking_settings["scale_out_cooldown"] = Duration.seconds(
+                settings.scale_out_cooldown_seconds
             )
+        if settings.disable_scale_in:
+            target_tracking_settings["disable_scale_in"] = True
+        return target_tracking_settings
+
+    @staticmethod
+    def _build_task_scale_in_protection(
+            service_instance: ApplicationLoadBalancedFargateService,
+            scaling_rule: ScalingRule):
+        # Tasks call the ECS agent endpoint ($ECS_AGENT_URI/task-protection/v1/state)
+        # while they process long-running requests
+        service_instance.task_definition.add_to_task_role_policy(
+            iam.PolicyStatement(
+                actions=TaskProtectionPermissionAction().actions,
+                resources=[
+                    f"arn:{Aws.PARTITION}:ecs:{Aws.REGION}:{Aws.ACCOUNT_ID}:task/"
+                    f"{service_instance.cluster.cluster_name}/*"
+                ],
+            )
+        )
+        default_container = service_instance.task_definition.default_container
+        default_container.add_environment("ECS_TASK_PROTECTION_ENABLED", "true")
+        default_container.add_environment(
+            "ECS_TASK_PROTECTION_EXPIRES_IN_MINUTES",
+            str(scaling_rule.task_scale_in_protection_minutes),
+        )
+
+    @staticmethod
+    def _build_capacity_windows(
+            api_scaling: ecs.ScalableTaskCount,
+            scaling_rule: ScalingRule):
+        time_zone = (
+            TimeZone.of(scaling_rule.capacity_windows_time_zone)
+            if scaling_rule.capacity_windows_time_zone
+            else None
+        )
+
+        for window in scaling_rule.capacity_windows:
+            api_scaling.scale_on_schedule(
+                f"{window.name}-window-start",
+                schedule=appscaling.Schedule.expression(window.start_schedule),
+                min_capacity=window.min_capacity,
+                max_capacity=window.max_capacity,
+                time_zone=time_zone,
+            )
+            api_scaling.scale_on_schedule(
+                f"{window.name}-window-end",
+                schedule=appscaling.Schedule.expression(window.end_schedule),
+                min_capacity=scaling_rule.min_capacity,
+                max_capacity=scaling_rule.max_capacity,
+                time_zone=time_zone,
+            )
+
+    @staticmethod
+    def _build_latency_scaling(
+            api_scaling: ecs.ScalableTaskCount,
+            service_instance: ApplicationLoadBalancedFargateService,
+            scaling_rule: ScalingRule):
+        latency_scaling: LatencyScalingRule = scaling_rule.latency_scaling
+        settings = scaling_rule.get_policy_settings(ScalingPolicies.LATENCY)
+        LATENCY_POLICY_NAME = f"latency-{latency_scaling.percentile.value}-scaling"
+
+        # TargetResponseTime is reported in seconds
+        scaling_steps = [
+            appscaling.ScalingInterval(
+                upper=latency_scaling.scale_in_threshold_milliseconds / 1000,
+                change=latency_scaling.scale_in_adjustment,
+            ),
+            *[
+                appscaling.ScalingInterval(
+                    lower=step.threshold_milliseconds / 1000,
+                    change=step.adjustment,
+                )
+                for step in latency_scaling.scale_out_steps
+            ],
+        ]
+
+        api_scaling.scale_on_metric(
+            LATENCY_POLICY_NAME,
+            metric=service_instance.target_group.metrics.target_response_time(
+                statistic=latency_scaling.percentile.value,
+                period=Duration.seconds(latency_scaling.period_seconds),
+            ),
+            scaling_steps=scaling_steps,
+            adjustment_type=appscaling.AdjustmentType.CHANGE_IN_CAPACITY,
+            evaluation_periods=latency_scaling.evaluation_periods,
+            cooldown=(
+                Duration.seconds(settings.scale_out_cooldown_seconds)
+                if settings.scale_out_cooldown_seconds is not None
+                else None
+            ),
+        )
@@ -11,6 +11,7 @@ from aws_cdk import (
 
 # region: iden-q-auto-platform
 from cdk_auto_platform.packages.secrets.parsers import parse_secrets_from_env
+from cdk_auto_platform.packages.secrets.secrets_store import SecretsStore
 from cdk_auto_platform.models.tenants.tenant_base import TenantBase
 # endregion
 
@@ -23,6 +24,10 @@ class ServiceSecretsBuilder(Construct):
         secret_names: type[Enum],
         is_db_secret_required: bool = False
     ):
+        SecretsStore.validate(
+            tenant.environment, {service_type: secret_names}, verbose=False
+        )
+
         SERVICE_SECRET_NAME = (
             f"{tenant.company}-{tenant.product.value}-{tenant.environment.value}-"
             f"{service_type.value}-service-secret"
@@ -5,6 +5,8 @@ from typing import Optional, Sequence
 # endregion
 
 # region: aws-cdk
+from aws_cdk import Token
+from aws_cdk.aws_iam import PolicyStatement
 from aws_cdk.aws_secretsmanager import Secret, ISecret
 from aws_cdk.aws_ecr import Repository
 from aws_cdk.aws_ecr_assets import Platform
@@ -12,34 +14,60 @@ from aws_cdk.aws_ecs import CpuArchitecture
 # endregion
 
 # region: iden-q-auto-platform
+from cdk_auto_platform.models.containers.docker_build_options import (
+    DockerBuildOptions,
+)
 from cdk_auto_platform.models.tenants.tenant_base import TenantBase
-from cdk_auto_platform.modules.ecr_registry.infrastructure import EcrRegistryPug
+from cdk_auto_platform.modules.ecr_registry.infrastructure import (
+    EcrRegistryPug,
+    get_ecr_registry_name,
+    get_repository_uri,
+    grant_image_asset_publishing
+)
 from cdk_auto_platform.modules.container_image.infrastructure import (
     RegistryTypes,
     ContainerImageParams,
     ContainerImagePug
 )
 from cdk_auto_platform.modules.logs.log_group.infrastructure import LogGroupPug
+from cdk_auto_platform.modules.private.permission_actions.ecr import (
+    PullThroughCachePermissionAction
+)
+from cdk_auto_platform.modules.soci_index_builder.infrastructure import (
+    SociIndexBuilderParams,
+    SociIndexBuilderPug
+)
 from cdk_auto_platform.modules.ecs_fargate_task_definition.infrastructure import (
     LogGroupParams,
     EcsFargateTaskDefinitionParams,
     EcsFargateTaskDefinitionPug,
     FileSystemParams
 )
+from cdk_auto_platform.packages.pull_through_cache.infrastructure import (
+    PullThroughCache
+)
 
 # endregion
 
 
 class _Amd64Architecture:
-    def __init__(self):
-        self.cpu_architecture = CpuArchitecture.X86_64
-        self.platform = Platform.LINUX_AMD64
+    @property
+    def cpu_architecture(self) -> CpuArchitecture:
+        return CpuArchitecture.X86_64
+
+    @property
+    def platform(self) -> Platform:
+        return Platform.LINUX_AMD64
 
 
 class _Arm64Architecture:
-    def __init__(self):
-        self.cpu_architecture = CpuArchitecture.ARM64
-        self.platform = Platform.LINUX_ARM64
+    @property
+    def cpu_architecture(self) -> CpuArchitecture:
+        return CpuArchitecture.ARM64
+
+    @property
+    def platform(self) -> Platform:
+        return Platform.LINUX_ARM64
 
 
 class EcsComputeArchitecture(Enum):
@@ -101,6 +129,8 @@ class ServiceTaskDefinitionBuilder(Construct):
         exclude: Optional[Sequence[str]] = None,
         service_environment: Optional[dict[str, str]] = None,
         ecr_registry: Optional[Repository] = None,
+        build_options: Optional[DockerBuildOptions] = None,
+        pull_through_cache: Optional[PullThroughCache] = None,
     ):
         if registry_type == RegistryTypes.ECR and not ecr_registry:
             self.ecr_registry = EcrRegistryPug(
@@ -113,6 +143,12 @@ class ServiceTaskDefinitionBuilder(Construct):
         else:
             self.ecr_registry = None
 
+        build_options = build_options or DockerBuildOptions()
+
+        image_acceleration = tenant.ecs_fargate_blueprints[
+            service_type
+        ].image_acceleration
+
         container_image_params = ContainerImageParams(
             service_type=service_type,
             registry_type=registry_type,
@@ -122,11 +158,50 @@ class ServiceTaskDefinitionBuilder(Construct):
             ecr_registry=self.ecr_registry,
             relative_path=relative_path,
             file=file,
-            exclude=exclude
+            exclude=exclude,
+            image_acceleration=image_acceleration,
+            build_options=build_options,
+            pull_through_cache_uris=(
+                pull_through_cache.repository_uris if pull_through_cache else None
+            )
         )
 
+        # The layer cache of the asset build is a tag of the ECR registry
+        if (
+            container_image_params.is_asset
+            and build_options.cache
+            and self.ecr_registry
+        ):
+            container_image_params.cache_repository_uri = (
+                self._get_cache_repository_uri(tenant, service_type, ecr_registry)
+            )
+
         self.container_image = ContainerImagePug(container_image_params).play()
 
+        if container_image_params.cache_repository_uri and isinstance(
+            self.ecr_registry, Repository
+        ):
+            grant_image_asset_publishing(self.ecr_registry)
+
+        if image_acceleration and image_acceleration.soci_index and self.ecr_registry:
+            soci_index_builder_params = SociIndexBuilderParams(
+                service_type=service_type,
+                ecr_registry=self.ecr_registry,
+                platform=ecs_compute_architecture.value.platform,
+                image_acceleration=image_acceleration,
+                cache_tag=(
+                    build_options.get_cache_tag(service_type.value)
+                    if build_options.cache
+                    else None
+                )
+            )
+
+            self.soci_index_builder = SociIndexBuilderPug(
+                self,
+                tenant,
+                soci_index_builder_params
+            ).play()
+
         self.log_group = LogGroupPug(
             self,
             tenant,
@@ -157,3 +232,33 @@ class ServiceTaskDefinitionBuilder(Construct):
             tenant,
             task_definition_params
         ).play()
+
+        if pull_through_cache and container_image_params.cached_image:
+            # The first pull of an image imports it from the upstream registry
+            self.task_definition.add_to_execution_role_policy(
+                PolicyStatement(
+                    actions=PullThroughCachePermissionAction().actions,
+                    resources=pull_through_cache.repository_arns
+                )
+            )
+            self.task_definition.add_to_execution_role_policy(
+                PolicyStatement(
+                    actions=["ecr:GetAuthorizationToken"],
+                    resources=["*"]
+                )
+            )
+            self.task_definition.node.add_dependency(pull_through_cache)
+
+    def _get_cache_repository_uri(
+        self,
+        tenant: TenantBase,
+        service_type: Enum,
+        ecr_registry: Optional[Repository] = None,
+    ) -> Optional[str]:
+        if ecr_registry is None:
+            return get_repository_uri(
+                self, get_ecr_registry_name(tenant, service_type)
+            )
+        if Token.is_unresolved(ecr_registry.repository_name):
+            return None
+        return get_repository_uri(self, ecr_registry.repository_name)
@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import Any, Optional
 
 # region: aws-cdk
 from aws_cdk.aws_ecs_patterns import ApplicationLoadBalancedFargateService
@@ -8,6 +9,13 @@ from aws_cdk.aws_cloudwatch import ComparisonOperator
 # endregion
 
 # region: iden-q-auto-platform
+from cdk_auto_platform.build.metric_registry_builder import (
+    DatabaseMetrics,
+    FargateServiceMetrics,
+    FileSystemMetrics,
+    MetricRegistryBuilder,
+    MetricSpec,
+)
 from cdk_auto_platform.packages.application_monitoring.infrastructure import (
     TrackableService
 )
@@ -18,14 +26,19 @@ from cdk_auto_platform.models.alarms import (
     AlarmMemoryThresholds,
     AlarmFreeStorageThresholds,
     AlarmFreeMemoryThresholds,
-    AlarmIopsThresholds
+    AlarmIopsThresholds,
+    AlarmPercentIoLimitThresholds,
+    AlarmBurstCreditBalanceThresholds
 )
 
 from cdk_auto_platform.models.tenants.tenant_base import TenantBase
+from cdk_auto_platform.packages.shared_file_system.infrastructure import (
+    SharedFileSystem
+)
 # endregion
 
 
-class TrackableServicesBuilder:
+class TrackableServicesBuilder(MetricRegistryBuilder):
     def _build_trackable_services(
             self,
             tenant: TenantBase,
@@ -33,40 +46,38 @@ class TrackableServicesBuilder:
                 Enum,
                 ApplicationLoadBalancedFargateService
             ],
-            databases: dict[Enum, DatabaseInstance]
+            databases: dict[Enum, DatabaseInstance],
+            file_systems: Optional[dict[Enum, SharedFileSystem]] = None
     ):
         trackable_services = []
         for service, service_instance in services.items():
+            fargate_service = service_instance.service
             trackable_services.extend([
-                TrackableService(
+                self._track(
                     service,
-                    service_instance.
-                    service.
-                    metric_cpu_utilization(),
+                    fargate_service,
+                    FargateServiceMetrics.CPU_UTILIZATION,
                     AlarmCpuThresholds.DANGER,
                 ),
-                TrackableService(
+                self._track(
                     service,
-                    service_instance.
-                    service.
-                    metric_cpu_utilization(),
+                    fargate_service,
+                    FargateServiceMetrics.CPU_UTILIZATION,
                     AlarmCpuThresholds.set_warning_threshold(
                         tenant.ecs_fargate_blueprints[service].
                         scaling_rule.trigger_percent_cpu
                     ),
                 ),
-                TrackableService(
+                self._track(
                     service,
-                    service_instance.
-                    service.
-                    metric_memory_utilization(),
+                    fargate_service,
+                    FargateServiceMetrics.MEMORY_UTILIZATION,
                     AlarmMemoryThresholds.DANGER,
                 ),
-                TrackableService(
+                self._track(
                     service,
-                    service_instance.
-                    service.
-                    metric_memory_utilization(),
+                    fargate_service,
+                    FargateServiceMetrics.MEMORY_UTILIZATION,
                     AlarmMemoryThresholds.set_warning_threshold(
                         tenant.ecs_fargate_blueprints[service]
                         .scaling_rule.trigger_percent_memory
@@ -83,64 +94,126 @@ class TrackableServicesBuilder:
             )
 
             db_trackable_services.extend([
-                TrackableService(
+                self._track(
                     service,
-                    db_instance.
-                    metric_cpu_utilization(),
+                    db_instance,
+                    DatabaseMetrics.CPU_UTILIZATION,
                     AlarmCpuThresholds.DANGER,
                 ),
-                TrackableService(
+                self._track(
                     service,
-                    db_instance.
-                    metric_cpu_utilization(),
+                    db_instance,
+                    DatabaseMetrics.CPU_UTILIZATION,
                     AlarmCpuThresholds.WARNING,
                 ),
-                TrackableService(
+                self._track(
                     service,
-                    db_instance.
-                    metric_free_storage_space(),
+                    db_instance,
+                    DatabaseMetrics.FREE_STORAGE_SPACE,
                     AlarmFreeStorageThresholds.DANGER,
-                    comparison_operator=ComparisonOperator.LESS_THAN_THRESHOLD
+                    ComparisonOperator.LESS_THAN_THRESHOLD
                 ),
-                TrackableService(
+                self._track(
                     service,
-                    db_instance.
-                    metric_free_storage_space(),
+                    db_instance,
+                    DatabaseMetrics.FREE_STORAGE_SPACE,
                     AlarmFreeStorageThresholds.WARNING,
-                    comparison_operator=ComparisonOperator.LESS_THAN_THRESHOLD
+                    ComparisonOperator.LESS_THAN_THRESHOLD
                 ),
-                TrackableService(
+                self._track(
                     service,
-                    db_instance.metric_freeable_memory(),
+                    db_instance,
+                    DatabaseMetrics.FREEABLE_MEMORY,
                     AlarmFreeMemoryThresholds.WARNING,
-                    comparison_operator=ComparisonOperator.LESS_THAN_THRESHOLD
+                    ComparisonOperator.LESS_THAN_THRESHOLD
                 ),
-                TrackableService(
+                self._track(
                     service,
-                    db_instance.metric_freeable_memory(),
+                    db_instance,
+                    DatabaseMetrics.FREEABLE_MEMORY,
                     AlarmFreeMemoryThresholds.DANGER,
-                    comparison_operator=ComparisonOperator.LESS_THAN_THRESHOLD
+                    ComparisonOperator.LESS_THAN_THRESHOLD
                 ),
-                TrackableService(
+                self._track(
                     service,
-                    db_instance.metric_read_iops(),
+                    db_instance,
+                    DatabaseMetrics.READ_IOPS,
                     AlarmIopsThresholds.WARNING
                 ),
-                TrackableService(
+                self._track(
                     service,
-                    db_instance.metric_read_iops(),
+                    db_instance,
+                    DatabaseMetrics.READ_IOPS,
                     AlarmIopsThresholds.DANGER
                 ),
-                TrackableService(
+                self._track(
                     service,
-                    db_instance.metric_write_iops(),
+                    db_instance,
+                    DatabaseMetrics.WRITE_IOPS,
                     AlarmIopsThresholds.WARNING
                 ),
-                TrackableService(
+                self._track(
                     service,
-                    db_instance.metric_write_iops(),
+                    db_instance,
+                    DatabaseMetrics.WRITE_IOPS,
                     AlarmIopsThresholds.DANGER
                 )
             ])
 
-        self.trackable_services = trackable_services + db_trackable_services
+        file_system_trackable_services = []
+        for file_system, shared_file_system in (file_systems or {}).items():
+            performance = shared_file_system.blueprint.performance
+
+            if performance.has_io_limit:
+                file_system_trackable_services.extend([
+                    self._track(
+                        file_system,
+                        shared_file_system,
+                        FileSystemMetrics.PERCENT_IO_LIMIT,
+                        AlarmPercentIoLimitThresholds.WARNING
+                    ),
+                    self._track(
+                        file_system,
+                        shared_file_system,
+                        FileSystemMetrics.PERCENT_IO_LIMIT,
+                        AlarmPercentIoLimitThresholds.DANGER
+                    )
+                ])
+
+            if performance.has_burst_credits:
+                file_system_trackable_services.extend([
+                    self._track(
+                        file_system,
+                        shared_file_system,
+                        FileSystemMetrics.BURST_CREDIT_BALANCE,
+                        AlarmBurstCreditBalanceThresholds.WARNING,
+                        ComparisonOperator.LESS_THAN_THRESHOLD
+                    ),
+                    self._track(
+                        file_system,
+                        shared_file_system,
+                        FileSystemMetrics.BURST_CREDIT_BALANCE,
+                        AlarmBurstCreditBalanceThresholds.DANGER,
+                        ComparisonOperator.LESS_THAN_THRESHOLD
+                    )
+                ])
+
+        self.trackable_services = (
+            trackable_services + db_trackable_services + file_system_trackable_services
+        )
+
+    def _track(
+            self,
+            service: Enum,
+            source: Any,
+            spec: MetricSpec,
+            threshold: Enum,
+            comparison_operator: Optional[ComparisonOperator] = None
+    ) -> TrackableService:
+        return TrackableService(
+            service,
+            self.metric_registry.get(service, source, spec),
+            threshold,
+            comparison_operator=comparison_operator,
+            metric_name=spec.metric_name
+        )
@@ -0,0 +1,102 @@
+"""
+Command line entry point of cdk_auto_platform.
+
+    cdk-auto-platform synth --app server/aws/cdk/app.py --jobs 4
+    cdk-auto-platform synth --app server/aws/cdk/app.py --incremental
+    cdk-auto-platform synth --app server/aws/cdk/app.py --jobs 1 --profile
+    cdk-auto-platform bench small medium
+"""
+
+import argparse
+import os
+import sys
+from typing import Optional, Sequence
+from cdk_auto_platform.utils.benchmarks.construct_profiler import (
+    DEFAULT_PROFILE_PATH,
+    PROFILE_ENVIRONMENT_VARIABLE,
+)
+from cdk_auto_platform.utils.benchmarks.synth_benchmark import (
+    DEFAULT_BASELINE_PATH,
+    run_benchmark,
+)
+from cdk_auto_platform.utils.synthesis.parallel_synthesizer import (
+    ParallelSynthesizer,
+)
+
+
+def _synth(args: argparse.Namespace) -> int:
+    outdir = args.outdir or os.environ.get("CDK_OUTDIR") or "cdk.out"
+    if args.profile:
+        os.environ[PROFILE_ENVIRONMENT_VARIABLE] = args.profile
+    ParallelSynthesizer(
+        args.app, outdir, args.jobs, args.plan, args.incremental
+    ).synth()
+    return 0
+
+
+def _bench(args: argparse.Namespace) -> int:
+    return run_benchmark(args.scenarios, args.baseline, args.update_baseline)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="cdk-auto-platform")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    synth = commands.add_parser(
+        "synth", help="Synthesize every tenant/environment target of a SynthPlan"
+    )
+    synth.add_argument(
+        "--app", default="server/aws/cdk/app.py", help="Path of the CDK app"
+    )
+    synth.add_argument(
+        "--plan", default="synth_plan", help="Name of the SynthPlan in the app"
+    )
+    synth.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes (default: CPU count, 1 synthesizes serially)",
+    )
+    synth.add_argument(
+        "--outdir", default=None, help="Cloud assembly folder (default: CDK_OUTDIR)"
+    )
+    synth.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse the assemblies of targets whose inputs did not change",
+    )
+    synth.add_argument(
+        "--profile",
+        nargs="?",
+        const=DEFAULT_PROFILE_PATH,
+        default=None,
+        help="Write a speedscope profile of the construct creation",
+    )
+    synth.set_defaults(handler=_synth)
+
+    bench = commands.add_parser(
+        "bench", help="Benchmark the synth of the reference tenants"
+    )
+    bench.add_argument(
+        "scenarios", nargs="*", help="Scenarios to run (default: all)"
+    )
+    bench.add_argument(
+        "--baseline", default=DEFAULT_BASELINE_PATH, help="Baseline JSON file"
+    )
+    bench.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Store the results as the new baseline instead of comparing",
+    )
+    bench.set_defaults(handler=_bench)
+
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
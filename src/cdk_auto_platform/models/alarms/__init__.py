@@ -1,14 +1,22 @@
-from cdk_auto_platform.models.alarms.alarm_cpu_thresholds import AlarmCpuThresholds
-from cdk_auto_platform.models.alarms.alarm_memory_thresholds import (
-    AlarmMemoryThresholds,
-)
-from cdk_auto_platform.models.alarms.alarm_free_storage_thresholds import (
-    AlarmFreeStorageThresholds,
-)
-from cdk_auto_platform.models.alarms.alarm_free_memory_thresholds import (
-    AlarmFreeMemoryThresholds,
-)
-from cdk_auto_platform.models.alarms.alarm_iops_thresholds import AlarmIopsThresholds
+from importlib import import_module
+
+_EXPORTS = {
+    "AlarmCpuThresholds": "cdk_auto_platform.models.alarms.alarm_cpu_thresholds",
+    "AlarmMemoryThresholds": "cdk_auto_platform.models.alarms.alarm_memory_thresholds",
+    "AlarmFreeStorageThresholds": (
+        "cdk_auto_platform.models.alarms.alarm_free_storage_thresholds"
+    ),
+    "AlarmFreeMemoryThresholds": (
+        "cdk_auto_platform.models.alarms.alarm_free_memory_thresholds"
+    ),
+    "AlarmIopsThresholds": "cdk_auto_platform.models.alarms.alarm_iops_thresholds",
+    "AlarmPercentIoLimitThresholds": (
+        "cdk_auto_platform.models.alarms.alarm_percent_io_limit_thresholds"
+    ),
+    "AlarmBurstCreditBalanceThresholds": (
+        "cdk_auto_platform.models.alarms.alarm_burst_credit_balance_thresholds"
+    ),
+}
 
 __all__ = [
     "AlarmCpuThresholds",
@@ -16,4 +24,20 @@ __all__ = [
     "AlarmFreeStorageThresholds",
     "AlarmFreeMemoryThresholds",
     "AlarmIopsThresholds",
+    "AlarmPercentIoLimitThresholds",
+    "AlarmBurstCreditBalanceThresholds",
 ]
+
+
+def __getattr__(name: str):
+    module_path = _EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
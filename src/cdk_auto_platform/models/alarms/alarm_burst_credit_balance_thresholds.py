@@ -0,0 +1,8 @@
+from enum import Enum
+
+BYTES_PER_GIBIBYTE = 1024**3
+
+
+class AlarmBurstCreditBalanceThresholds(Enum):
+    DANGER = 100 * BYTES_PER_GIBIBYTE
+    WARNING = 500 * BYTES_PER_GIBIBYTE
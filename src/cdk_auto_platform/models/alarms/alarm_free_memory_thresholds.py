@@ -1,7 +1,8 @@
-import aws_cdk as core
 from enum import Enum
 
+BYTES_PER_GIBIBYTE = 1024**3
+
 
 class AlarmFreeMemoryThresholds(Enum):
-    DANGER = core.Size.gibibytes(1).to_bytes()
-    WARNING = core.Size.gibibytes(1.5).to_bytes()
+    DANGER = 1 * BYTES_PER_GIBIBYTE
+    WARNING = int(1.5 * BYTES_PER_GIBIBYTE)
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class AlarmPercentIoLimitThresholds(Enum):
+    DANGER = 95
+    WARNING = 80
@@ -1,10 +1,27 @@
 from typing import Sequence, Optional
+from cdk_auto_platform.models.containers.container_tuning import ContainerTuning
 from cdk_auto_platform.models.containers.ecs_fargate_types import EcsFargateTypes
+from cdk_auto_platform.models.containers.image_acceleration import ImageAcceleration
+from cdk_auto_platform.models.containers.otel_collector import OtelCollector
+from cdk_auto_platform.models.compute.deployment_configuration import (
+    DeploymentConfiguration,
+)
+from cdk_auto_platform.models.compute.fargate_capacity import FargateCapacity
 from cdk_auto_platform.models.compute.fargate_task_compute import FargateTaskCompute
 from cdk_auto_platform.models.compute.compute_time_configuration import (
     ComputeTimeConfiguration,
 )
+from cdk_auto_platform.models.compute.listener_rule_configuration import (
+    ListenerRuleConfiguration,
+)
+from cdk_auto_platform.models.compute.load_balancing_configuration import (
+    LoadBalancingConfiguration,
+)
 from cdk_auto_platform.models.compute.scaling_rule import ScalingRule
+from cdk_auto_platform.models.compute.service_connect_configuration import (
+    ServiceConnectConfiguration,
+)
+from cdk_auto_platform.models.compute.service_protocol import ServiceProtocol
 
 
 class EcsFargateBlueprint:
@@ -18,6 +35,15 @@ class EcsFargateBlueprint:
         scaling_rule: Optional[ScalingRule] = None,
         desired_task_count: Optional[int] = None,
         schedule: Optional[str] = None,
+        capacity: Optional[FargateCapacity] = None,
+        container_tuning: Optional[ContainerTuning] = None,
+        otel_collector: Optional[OtelCollector] = None,
+        load_balancing: Optional[LoadBalancingConfiguration] = None,
+        protocol: Optional[ServiceProtocol] = None,
+        deployment: Optional[DeploymentConfiguration] = None,
+        service_connect: Optional[ServiceConnectConfiguration] = None,
+        listener_rule: Optional[ListenerRuleConfiguration] = None,
+        image_acceleration: Optional[ImageAcceleration] = None,
     ):
         self.ecs_fargate_type = ecs_fargate_type
         self.compute = compute
@@ -46,6 +72,83 @@ class EcsFargateBlueprint:
         self.entry_point = entry_point
 
         self.time_configuration = time_configuration
+        """
+        Capacity provider strategy (FARGATE/FARGATE_SPOT base and weights).
+        When not set, the tasks are launched on FARGATE without a strategy.
+        Example: FargateCapacity.spot_with_base(2) for a service,
+        FargateCapacity.spot_only() for a scheduled batch job.
+        """
+        self.capacity = capacity
+        """
+        Runtime settings of the container: ulimits, memory reservation, stop
+        timeout, init process and read-only root filesystem.
+        Example: ContainerTuning(
+            ulimits=[ContainerUlimit(name=UlimitNames.NOFILE, soft_limit=65536,
+                                     hard_limit=65536)],
+            stop_timeout_seconds=30,
+            init_process_enabled=True,
+        )
+        """
+        if container_tuning:
+            container_tuning.validate_compute(compute)
+        self.container_tuning = container_tuning
+        """
+        ADOT collector sidecar. The application gets the OTEL_* variables to
+        send OTLP to it, metrics go to CloudWatch (EMF) and traces to X-Ray.
+        The latency percentiles of services are added to the dashboard.
+        """
+        if otel_collector:
+            otel_collector.validate_compute(compute)
+        self.otel_collector = otel_collector
+        """
+        Target group attributes of a service: algorithm, slow start,
+        deregistration delay and stickiness. When not set, the ALB defaults
+        (round robin, 300 s deregistration delay) are kept.
+        Example: LoadBalancingConfiguration(deregistration_delay_seconds=15)
+        """
+        self.load_balancing = load_balancing
+        """
+        Target protocol version (HTTP1/HTTP2/GRPC) and container port of a
+        service. When not set, HTTP/1.1 on port 80.
+        Example: ServiceProtocol(
+            protocol_version=TargetProtocolVersions.GRPC,
+            container_port=50051,
+        )
+        """
+        self.protocol = protocol or ServiceProtocol()
+        """
+        Rolling deployment of a service: healthy percent bounds and the
+        deployment circuit breaker with rollback. The health check grace
+        period is part of the time_configuration.
+        Example: DeploymentConfiguration(max_healthy_percent=200)
+        """
+        self.deployment = deployment
+        """
+        Internal services with a Service Connect configuration are reached
+        through the Service Connect mesh of the cluster instead of an internal
+        ALB and a private DNS record.
+        Example: ServiceConnectConfiguration(per_request_timeout_seconds=30)
+        """
+        self.service_connect = service_connect
+        """
+        Services with a listener rule are attached to the shared ALB of the
+        tenant instead of getting their own, and keep their own target group,
+        health check and scaling.
+        Example: ListenerRuleConfiguration(priority=10, path_patterns=["/api/*"])
+        """
+        self.listener_rule = listener_rule
+        """
+        Faster image pulls of new tasks: zstd layers for the asset image or a
+        SOCI index pushed for each tagged image of the ECR registry. The task
+        startup time of services that set it is added to the dashboard.
+        Example: ImageAcceleration() for SOCI,
+        ImageAcceleration(zstd_compression=True, soci_index=False,
+        containerd_image_store=True) for zstd, which needs the containerd
+        image store of Docker.
+        """
+        if image_acceleration:
+            image_acceleration.validate_compute(compute)
+        self.image_acceleration = image_acceleration
         self._scaling_rule = scaling_rule
         self._desired_task_count = desired_task_count
         self._schedule = schedule
@@ -68,6 +171,12 @@ class EcsFargateBlueprint:
         else:
             raise ValueError(f"Invalid ECS Fargate type {self.ecs_fargate_type}")
 
+        if self.service_connect:
+            self._validate_service_connect()
+
+        if self.listener_rule:
+            self._validate_listener_rule()
+
     @property
     def scaling_rule(self) -> ScalingRule:
         assert (
@@ -94,6 +203,27 @@ class EcsFargateBlueprint:
 
         return self._schedule
 
+    def _validate_service_connect(self):
+        if self.ecs_fargate_type != EcsFargateTypes.SERVICE:
+            raise ValueError("service_connect is only supported by services")
+        # Service Connect services have no target group
+        if self.load_balancing:
+            raise ValueError("load_balancing is not supported with service_connect")
+        if (
+            self.scaling_rule.requests_per_target is not None
+            or self.scaling_rule.latency_scaling is not None
+        ):
+            raise ValueError(
+                "requests_per_target and latency_scaling are not supported with "
+                "service_connect"
+            )
+
+    def _validate_listener_rule(self):
+        if self.ecs_fargate_type != EcsFargateTypes.SERVICE:
+            raise ValueError("listener_rule is only supported by services")
+        if self.service_connect:
+            raise ValueError("listener_rule is not supported with service_connect")
+
     def _validate_cron_expression(self):
         if not self._schedule or not self._schedule.startswith("cron"):
             raise ValueError("Invalid cron expression")
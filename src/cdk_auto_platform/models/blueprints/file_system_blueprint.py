@@ -0,0 +1,19 @@
+from enum import Enum
+from typing import Optional
+
+from cdk_auto_platform.models.storage.file_system_access_point import (
+    FileSystemAccessPoint,
+)
+from cdk_auto_platform.models.storage.file_system_performance import (
+    FileSystemPerformance,
+)
+
+
+class FileSystemBlueprint:
+    def __init__(
+        self,
+        access_points: dict[Enum, FileSystemAccessPoint],
+        performance: Optional[FileSystemPerformance] = None,
+    ):
+        self.access_points = access_points
+        self.performance = performance or FileSystemPerformance()
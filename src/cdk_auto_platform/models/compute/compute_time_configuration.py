@@ -1,4 +1,3 @@
-import aws_cdk as core
 from pydantic import BaseModel, Field, model_validator, ConfigDict
 from typing import Optional
 
@@ -77,6 +76,21 @@ class ComputeTimeConfiguration(BaseModel):
         default=2, ge=2, le=10, description="Healthy threshold count for health checks"
     )
 
+    # health_check_grace_period
+    health_check_grace_period_seconds: Optional[int] = Field(
+        default=None,
+        ge=0,
+        le=60 * 60,
+        description="Seconds the service ignores failed health checks of new tasks",
+    )
+
+    health_check_grace_period_minutes: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=60,
+        description="Minutes the service ignores failed health checks of new tasks",
+    )
+
     @model_validator(mode="after")
     def convert_minutes_to_seconds(cls, values):
         minutes_to_seconds = [
@@ -96,6 +110,8 @@ class ComputeTimeConfiguration(BaseModel):
         if timeout_seconds is None:
             raise ValueError(f"{timeout_name} is required")
 
+        import aws_cdk as core
+
         return core.Duration.seconds(timeout_seconds)
 
     @property
@@ -121,3 +137,12 @@ class ComputeTimeConfiguration(BaseModel):
         return self._get_timeout_duration(
             self.health_check_timeout_seconds, "health_check_timeout_seconds"
         )
+
+    @property
+    def health_check_grace_period(self):
+        if self.health_check_grace_period_seconds is None:
+            return None
+
+        return self._get_timeout_duration(
+            self.health_check_grace_period_seconds, "health_check_grace_period_seconds"
+        )
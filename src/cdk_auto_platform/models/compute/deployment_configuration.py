@@ -0,0 +1,59 @@
+from pydantic import BaseModel, Field, model_validator, ConfigDict
+
+DEFAULT_MIN_HEALTHY_PERCENT = 100
+DEFAULT_MAX_HEALTHY_PERCENT = 200
+MAX_HEALTHY_PERCENT = 400
+
+
+class DeploymentConfiguration(BaseModel):
+    """
+    Rolling deployment of a service. The defaults start a full set of new
+    tasks next to the running ones (200%) and roll back to the previous task
+    definition when the new tasks keep failing to become healthy.
+    """
+
+    model_config = ConfigDict(validate_default=True, extra="forbid")
+
+    min_healthy_percent: int = Field(
+        default=DEFAULT_MIN_HEALTHY_PERCENT,
+        ge=0,
+        le=100,
+        description="Lower bound of running tasks during a deployment",
+    )
+
+    max_healthy_percent: int = Field(
+        default=DEFAULT_MAX_HEALTHY_PERCENT,
+        ge=100,
+        le=MAX_HEALTHY_PERCENT,
+        description="Upper bound of running tasks during a deployment",
+    )
+
+    circuit_breaker: bool = Field(
+        default=True,
+        description="Stop a deployment whose tasks keep failing to start",
+    )
+
+    rollback: bool = Field(
+        default=True,
+        description="Roll back to the last completed deployment when it stops",
+    )
+
+    @model_validator(mode="after")
+    def validate_deployment(cls, values) -> "DeploymentConfiguration":
+        if values.min_healthy_percent == 100 and values.max_healthy_percent == 100:
+            raise ValueError(
+                "min_healthy_percent must be lower than 100 or max_healthy_percent "
+                "greater than 100 for the deployment to replace tasks"
+            )
+        if values.rollback and not values.circuit_breaker:
+            raise ValueError("rollback requires the circuit_breaker")
+        return values
+
+    @property
+    def deployment_circuit_breaker(self):
+        if not self.circuit_breaker:
+            return None
+
+        from aws_cdk import aws_ecs as ecs
+
+        return ecs.DeploymentCircuitBreaker(enable=True, rollback=self.rollback)
@@ -0,0 +1,109 @@
+from enum import Enum
+from typing import Any
+from pydantic import BaseModel, Field, model_validator, ConfigDict
+
+MAX_CAPACITY_BASE = 100000
+MAX_CAPACITY_WEIGHT = 1000
+
+
+class FargateCapacityProviders(Enum):
+    FARGATE = "FARGATE"
+    FARGATE_SPOT = "FARGATE_SPOT"
+
+
+class FargateCapacity(BaseModel):
+    """
+    Capacity provider strategy of a service or scheduled task. The base tasks
+    always run on the base provider, the remaining tasks are split between
+    FARGATE and FARGATE_SPOT by weight.
+    """
+
+    model_config = ConfigDict(validate_default=True, extra="forbid")
+
+    base_provider: FargateCapacityProviders = Field(
+        default=FargateCapacityProviders.FARGATE,
+        description="Capacity provider of the base tasks",
+    )
+
+    base: int = Field(
+        default=0,
+        ge=0,
+        le=MAX_CAPACITY_BASE,
+        description="Tasks that always run on the base capacity provider",
+    )
+
+    fargate_weight: int = Field(
+        default=1,
+        ge=0,
+        le=MAX_CAPACITY_WEIGHT,
+        description="Relative share of the tasks placed on FARGATE",
+    )
+
+    fargate_spot_weight: int = Field(
+        default=0,
+        ge=0,
+        le=MAX_CAPACITY_WEIGHT,
+        description="Relative share of the tasks placed on FARGATE_SPOT",
+    )
+
+    @model_validator(mode="after")
+    def validate_weights(cls, values) -> "FargateCapacity":
+        if values.fargate_weight + values.fargate_spot_weight == 0:
+            raise ValueError(
+                "fargate_weight or fargate_spot_weight must be greater than 0"
+            )
+        return values
+
+    @classmethod
+    def on_demand(cls) -> "FargateCapacity":
+        return cls()
+
+    @classmethod
+    def spot_only(cls) -> "FargateCapacity":
+        """
+        Every task on FARGATE_SPOT, meant for interruptible batch jobs such as
+        scheduled tasks.
+        """
+        return cls(
+            base_provider=FargateCapacityProviders.FARGATE_SPOT,
+            fargate_weight=0,
+            fargate_spot_weight=1,
+        )
+
+    @classmethod
+    def spot_with_base(
+        cls, base: int, fargate_weight: int = 1, fargate_spot_weight: int = 3
+    ) -> "FargateCapacity":
+        """
+        Keeps base tasks on FARGATE and scales out mostly on FARGATE_SPOT.
+        """
+        return cls(
+            base=base,
+            fargate_weight=fargate_weight,
+            fargate_spot_weight=fargate_spot_weight,
+        )
+
+    @property
+    def strategy(self) -> list[dict[str, Any]]:
+        weights = {
+            FargateCapacityProviders.FARGATE: self.fargate_weight,
+            FargateCapacityProviders.FARGATE_SPOT: self.fargate_spot_weight,
+        }
+        strategy = []
+        for provider, weight in weights.items():
+            base = self.base if provider == self.base_provider else 0
+            if weight > 0 or base > 0:
+                strategy.append(
+                    {
+                        "capacity_provider": provider.value,
+                        "base": base,
+                        "weight": weight,
+                    }
+                )
+        return strategy
+
+    @property
+    def capacity_provider_strategies(self):
+        from aws_cdk import aws_ecs as ecs
+
+        return [ecs.CapacityProviderStrategy(**item) for item in self.strategy]
@@ -1,12 +1,17 @@
-from jsii import Number
+from typing import TYPE_CHECKING
 from cdk_auto_platform.models.compute.fargate_configuration import (
     OperatingSystem,
     FargateConfigurations,
 )
 
+if TYPE_CHECKING:
+    from jsii import Number
+
 
 class FargateTaskCompute:
-    def __init__(self, cpu: Number, memory_limit_mib: Number, os: OperatingSystem):
+    def __init__(
+        self, cpu: "Number", memory_limit_mib: "Number", os: OperatingSystem
+    ):
         """
         :param cpu: CPU value in vCPU.
         :param memory_limit_mib: Desired memory in MiB.
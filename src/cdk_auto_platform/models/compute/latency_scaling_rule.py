@@ -0,0 +1,88 @@
+from enum import Enum
+from pydantic import BaseModel, Field, model_validator, ConfigDict
+
+DEFAULT_LATENCY_PERIOD_SECONDS = 60
+DEFAULT_LATENCY_EVALUATION_PERIODS = 3
+MAX_LATENCY_MILLISECONDS = 4000 * 1000
+MAX_STEP_ADJUSTMENT = 30
+
+
+class LatencyPercentiles(Enum):
+    P90 = "p90"
+    P99 = "p99"
+
+
+class LatencyScalingStep(BaseModel):
+    model_config = ConfigDict(validate_default=True, extra="forbid")
+
+    threshold_milliseconds: int = Field(
+        ge=1,
+        le=MAX_LATENCY_MILLISECONDS,
+        description="Target response time from which the step applies",
+    )
+
+    adjustment: int = Field(
+        ge=1,
+        le=MAX_STEP_ADJUSTMENT,
+        description="Tasks added while the latency is above the threshold",
+    )
+
+
+class LatencyScalingRule(BaseModel):
+    """
+    Step scaling on the TargetResponseTime percentile of the service target
+    group. Each scale out step applies from its threshold up to the next one;
+    below scale_in_threshold_milliseconds tasks are removed.
+    """
+
+    model_config = ConfigDict(validate_default=True, extra="forbid")
+
+    percentile: LatencyPercentiles = Field(
+        default=LatencyPercentiles.P90,
+        description="Percentile of the target response time to scale on",
+    )
+
+    scale_out_steps: list[LatencyScalingStep] = Field(
+        min_length=1, description="Scale out steps by latency threshold"
+    )
+
+    scale_in_threshold_milliseconds: int = Field(
+        ge=1,
+        le=MAX_LATENCY_MILLISECONDS,
+        description="Target response time under which tasks are removed",
+    )
+
+    scale_in_adjustment: int = Field(
+        default=-1,
+        ge=-MAX_STEP_ADJUSTMENT,
+        le=-1,
+        description="Tasks removed while the latency is under the threshold",
+    )
+
+    period_seconds: int = Field(
+        default=DEFAULT_LATENCY_PERIOD_SECONDS,
+        ge=10,
+        le=60 * 60,
+        description="Period of the latency metric in seconds",
+    )
+
+    evaluation_periods: int = Field(
+        default=DEFAULT_LATENCY_EVALUATION_PERIODS,
+        ge=1,
+        le=10,
+        description="Periods the latency must breach a threshold to scale",
+    )
+
+    @model_validator(mode="after")
+    def validate_thresholds(cls, values) -> "LatencyScalingRule":
+        thresholds = [step.threshold_milliseconds for step in values.scale_out_steps]
+        if thresholds != sorted(set(thresholds)):
+            raise ValueError(
+                "scale_out_steps thresholds must be unique and in ascending order"
+            )
+        if values.scale_in_threshold_milliseconds >= thresholds[0]:
+            raise ValueError(
+                "scale_in_threshold_milliseconds must be lower than the first "
+                "scale out threshold"
+            )
+        return values
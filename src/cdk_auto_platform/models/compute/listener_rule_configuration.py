@@ -0,0 +1,63 @@
+from typing import Sequence
+from pydantic import BaseModel, Field, model_validator, ConfigDict
+
+MAX_LISTENER_RULE_PRIORITY = 50000
+MAX_CONDITION_VALUES = 5
+
+
+class ListenerRuleConfiguration(BaseModel):
+    """
+    Listener rule of a service attached to the shared ALB of its tenant.
+    Requests matching the host headers and path patterns of the rule are
+    routed to the target group of the service. When no host header is set,
+    the rule matches the DNS name of the service.
+    """
+
+    model_config = ConfigDict(validate_default=True, extra="forbid")
+
+    priority: int = Field(
+        ge=1,
+        le=MAX_LISTENER_RULE_PRIORITY,
+        description="Priority of the rule on the shared listener, unique per listener",
+    )
+
+    host_headers: list[str] = Field(
+        default=[],
+        description="Host headers routed to the service, its DNS name by default",
+    )
+
+    path_patterns: list[str] = Field(
+        default=[],
+        description="Path patterns routed to the service, e.g. /api/*",
+    )
+
+    @model_validator(mode="after")
+    def validate_conditions(cls, values) -> "ListenerRuleConfiguration":
+        # The default host header counts as one condition value
+        if (
+            max(len(values.host_headers), 1) + len(values.path_patterns)
+            > MAX_CONDITION_VALUES
+        ):
+            raise ValueError(
+                f"A listener rule supports at most {MAX_CONDITION_VALUES} host "
+                "headers and path patterns"
+            )
+        for path_pattern in values.path_patterns:
+            if not path_pattern.startswith("/") or len(path_pattern) > 128:
+                raise ValueError(
+                    f"Invalid path pattern {path_pattern}, it must start with / "
+                    "and be at most 128 characters"
+                )
+        return values
+
+    def get_conditions(self, default_host_header: str) -> Sequence:
+        from aws_cdk import aws_elasticloadbalancingv2 as elbv2
+
+        conditions = [
+            elbv2.ListenerCondition.host_headers(
+                self.host_headers or [default_host_header]
+            )
+        ]
+        if self.path_patterns:
+            conditions.append(elbv2.ListenerCondition.path_patterns(self.path_patterns))
+        return conditions
@@ -1,6 +1,11 @@
+from datetime import datetime
+from enum import Enum
+from typing import Optional
 from pydantic import BaseModel, Field, model_validator, ConfigDict
+from cdk_auto_platform.utils.validators.cron_expression import CronExpression
 
 from cdk_auto_platform.models.alarms import AlarmCpuThresholds, AlarmMemoryThresholds
+from cdk_auto_platform.models.compute.latency_scaling_rule import LatencyScalingRule
 
 DEFAULT_MIN_CAPACITY = 1
 DEFAULT_MAX_CAPACITY = 30
@@ -11,6 +16,93 @@ UPPER_GRADIENT = 10
 trigger_percent_cpu_default = AlarmCpuThresholds.WARNING.value
 trigger_percent_memory_default = AlarmMemoryThresholds.WARNING.value
 
+MAX_COOLDOWN_SECONDS = 60 * 60
+MAX_TASK_PROTECTION_MINUTES = 48 * 60
+DEFAULT_TASK_PROTECTION_MINUTES = 60
+
+
+class ScalingPolicies(Enum):
+    CPU = "cpu"
+    MEMORY = "memory"
+    REQUEST_COUNT = "request-count"
+    LATENCY = "latency"
+
+
+class ScalingPolicyOverride(BaseModel):
+    """
+    Cooldowns and scale in setting of a single scaling policy. Fields left
+    unset fall back to the ScalingRule. The latency step scaling policy has a
+    single cooldown, taken from scale_out_cooldown_seconds.
+    """
+
+    model_config = ConfigDict(validate_default=True, extra="forbid")
+
+    scale_in_cooldown_seconds: Optional[int] = Field(
+        default=None,
+        ge=0,
+        le=MAX_COOLDOWN_SECONDS,
+        description="Seconds after a scale in before another scale in",
+    )
+
+    scale_out_cooldown_seconds: Optional[int] = Field(
+        default=None,
+        ge=0,
+        le=MAX_COOLDOWN_SECONDS,
+        description="Seconds after a scale out before another scale out",
+    )
+
+    disable_scale_in: Optional[bool] = Field(
+        default=None,
+        description="Whether the policy only scales out",
+    )
+
+
+class CapacityWindow(BaseModel):
+    """
+    Capacity applied between two scheduled actions, for example to pre-warm a
+    service before a known peak. At end_schedule the capacity of the
+    ScalingRule is restored.
+    Example: CapacityWindow(
+        name="business-hours",
+        start_schedule="cron(45 7 ? * MON-FRI *)",
+        end_schedule="cron(0 20 ? * MON-FRI *)",
+        min_capacity=8,
+        max_capacity=30,
+    )
+    """
+
+    model_config = ConfigDict(validate_default=True, extra="forbid")
+
+    name: str = Field(
+        pattern=r"^[A-Za-z0-9-]+$",
+        description="Name of the window, used in the scheduled action names",
+    )
+
+    start_schedule: str = Field(description="Cron expression opening the window")
+
+    end_schedule: str = Field(description="Cron expression closing the window")
+
+    min_capacity: int = Field(
+        ge=DEFAULT_MIN_CAPACITY,
+        le=DEFAULT_MAX_CAPACITY,
+        description="Minimum number of instances during the window",
+    )
+
+    max_capacity: int = Field(
+        ge=DEFAULT_MIN_CAPACITY,
+        le=DEFAULT_MAX_CAPACITY,
+        description="Maximum number of instances during the window",
+    )
+
+    @model_validator(mode="after")
+    def validate_window(cls, values) -> "CapacityWindow":
+        if values.min_capacity > values.max_capacity:
+            raise ValueError("min_capacity must be less than or equal to max_capacity")
+        for schedule in (values.start_schedule, values.end_schedule):
+            if not CronExpression(schedule).occurrences():
+                raise ValueError(f"Cron expression {schedule} never fires")
+        return values
+
 
 class ScalingRule(BaseModel):
     model_config = ConfigDict(validate_default=True, extra="forbid")
@@ -43,6 +135,67 @@ class ScalingRule(BaseModel):
         description="Target memory usage to trigger scaling",
     )
 
+    requests_per_target: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=100000,
+        description="Target ALB requests per task per minute to trigger scaling",
+    )
+
+    latency_scaling: Optional[LatencyScalingRule] = Field(
+        default=None,
+        description="Step scaling on the target response time percentile",
+    )
+
+    capacity_windows: list[CapacityWindow] = Field(
+        default=[],
+        description="Scheduled capacity windows, which must not overlap",
+    )
+
+    capacity_windows_time_zone: Optional[str] = Field(
+        default=None,
+        description="IANA time zone of the capacity window schedules (UTC)",
+    )
+
+    scale_in_cooldown_seconds: Optional[int] = Field(
+        default=None,
+        ge=0,
+        le=MAX_COOLDOWN_SECONDS,
+        description="Seconds after a scale in before another scale in",
+    )
+
+    scale_out_cooldown_seconds: Optional[int] = Field(
+        default=None,
+        ge=0,
+        le=MAX_COOLDOWN_SECONDS,
+        description="Seconds after a scale out before another scale out",
+    )
+
+    disable_scale_in: bool = Field(
+        default=False,
+        description="Whether the target tracking policies only scale out",
+    )
+
+    policy_overrides: dict[ScalingPolicies, ScalingPolicyOverride] = Field(
+        default={},
+        description="Cooldowns and scale in setting per scaling policy",
+    )
+
+    task_scale_in_protection: bool = Field(
+        default=False,
+        description=(
+            "Allow the tasks to protect themselves from scale in through the "
+            "ECS agent task protection endpoint during long-running requests"
+        ),
+    )
+
+    task_scale_in_protection_minutes: int = Field(
+        default=DEFAULT_TASK_PROTECTION_MINUTES,
+        ge=1,
+        le=MAX_TASK_PROTECTION_MINUTES,
+        description="Default expiration of the task scale in protection",
+    )
+
     @model_validator(mode="after")
     def validate_capacity(cls, values) -> "ScalingRule":
         if values.min_capacity > values.max_capacity:
@@ -59,3 +212,90 @@ class ScalingRule(BaseModel):
             raise ValueError("trigger_percent_memory must be less than 80")
 
         return values
+
+    @model_validator(mode="after")
+    def validate_policy_overrides(cls, values) -> "ScalingRule":
+        configured = {
+            ScalingPolicies.CPU: True,
+            ScalingPolicies.MEMORY: True,
+            ScalingPolicies.REQUEST_COUNT: values.requests_per_target is not None,
+            ScalingPolicies.LATENCY: values.latency_scaling is not None,
+        }
+        for policy, override in values.policy_overrides.items():
+            if not configured[policy]:
+                raise ValueError(
+                    f"policy_overrides has {policy.value} but the policy is not "
+                    "configured"
+                )
+            if policy == ScalingPolicies.LATENCY and (
+                override.scale_in_cooldown_seconds is not None
+                or override.disable_scale_in is not None
+            ):
+                raise ValueError(
+                    "The latency policy only accepts scale_out_cooldown_seconds"
+                )
+        return values
+
+    def get_policy_settings(self, policy: ScalingPolicies) -> ScalingPolicyOverride:
+        override = self.policy_overrides.get(policy, ScalingPolicyOverride())
+        return ScalingPolicyOverride(
+            scale_in_cooldown_seconds=(
+                override.scale_in_cooldown_seconds
+                if override.scale_in_cooldown_seconds is not None
+                else self.scale_in_cooldown_seconds
+            ),
+            scale_out_cooldown_seconds=(
+                override.scale_out_cooldown_seconds
+                if override.scale_out_cooldown_seconds is not None
+                else self.scale_out_cooldown_seconds
+            ),
+            disable_scale_in=(
+                override.disable_scale_in
+                if override.disable_scale_in is not None
+                else self.disable_scale_in
+            ),
+        )
+
+    @model_validator(mode="after")
+    def validate_capacity_windows(cls, values) -> "ScalingRule":
+        names = [window.name for window in values.capacity_windows]
+        if len(names) != len(set(names)):
+            raise ValueError("capacity_windows names must be unique")
+
+        events = sorted(
+            (occurrence, is_start, window.name)
+            for window in values.capacity_windows
+            for is_start, schedule in (
+                (False, window.end_schedule),
+                (True, window.start_schedule),
+            )
+            for occurrence in CronExpression(schedule).occurrences()
+        )
+        # Windows still open at the end of the year are open when it starts
+        active = {
+            name
+            for name in names
+            if max(event for event in events if event[2] == name)[1]
+        }
+        ends: dict[datetime, set[str]] = {}
+        for occurrence, is_start, name in events:
+            if not is_start:
+                active.discard(name)
+                ends.setdefault(occurrence, set()).add(name)
+                continue
+            # Scheduled actions of the same minute run in no guaranteed order
+            coincident = ends.get(occurrence, set()) - {name}
+            if coincident:
+                raise ValueError(
+                    f"Capacity window {name} starts when "
+                    f"{', '.join(sorted(coincident))} ends at {occurrence:%a %H:%M}, "
+                    "leave at least a minute between them"
+                )
+            overlapping = active - {name}
+            if overlapping:
+                raise ValueError(
+                    f"Capacity window {name} overlaps with "
+                    f"{', '.join(sorted(overlapping))} at {occurrence:%a %H:%M}"
+                )
+            active.add(name)
+        return values
@@ -0,0 +1,71 @@
+from typing import Optional
+from pydantic import BaseModel, Field, model_validator, ConfigDict
+
+MAX_SERVICE_CONNECT_TIMEOUT_SECONDS = 60 * 60
+
+
+class ServiceConnectConfiguration(BaseModel):
+    """
+    Exposes an internal service through ECS Service Connect instead of an
+    internal ALB. The other services of the cluster call it through their
+    Envoy proxy at http://<dns_name>:<client_port>.
+    """
+
+    model_config = ConfigDict(validate_default=True, extra="forbid")
+
+    dns_name: Optional[str] = Field(
+        default=None,
+        pattern=r"^[a-z0-9]([a-z0-9.-]{0,61}[a-z0-9])?$",
+        description="Name the clients call, the service type value by default",
+    )
+
+    client_port: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=65535,
+        description="Port the clients call, the container port by default",
+    )
+
+    per_request_timeout_seconds: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=MAX_SERVICE_CONNECT_TIMEOUT_SECONDS,
+        description="Seconds the proxy waits for the response of a request",
+    )
+
+    idle_timeout_seconds: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=MAX_SERVICE_CONNECT_TIMEOUT_SECONDS,
+        description="Seconds an idle connection is kept open by the proxy",
+    )
+
+    @model_validator(mode="after")
+    def validate_timeouts(cls, values) -> "ServiceConnectConfiguration":
+        if (
+            values.per_request_timeout_seconds is not None
+            and values.idle_timeout_seconds is not None
+            and values.idle_timeout_seconds < values.per_request_timeout_seconds
+        ):
+            raise ValueError(
+                "idle_timeout_seconds must not be lower than "
+                "per_request_timeout_seconds"
+            )
+        return values
+
+    @property
+    def per_request_timeout(self):
+        return self._get_duration(self.per_request_timeout_seconds)
+
+    @property
+    def idle_timeout(self):
+        return self._get_duration(self.idle_timeout_seconds)
+
+    @staticmethod
+    def _get_duration(seconds: Optional[int]):
+        if seconds is None:
+            return None
+
+        import aws_cdk as core
+
+        return core.Duration.seconds(seconds)
@@ -0,0 +1,82 @@
+from enum import Enum
+from pydantic import BaseModel, Field, model_validator, ConfigDict
+
+DEFAULT_CONTAINER_PORT = 80
+DEFAULT_GRPC_HEALTH_PATH = "/grpc.health.v1.Health/Check"
+DEFAULT_HEALTHY_GRPC_CODES = "0"
+
+
+class TargetProtocolVersions(Enum):
+    HTTP1 = "HTTP1"
+    HTTP2 = "HTTP2"
+    GRPC = "GRPC"
+
+
+class ServiceProtocol(BaseModel):
+    """
+    Protocol between the ALB and the tasks of a service. HTTP2 and GRPC target
+    groups need an HTTPS listener, so internal services that use them are
+    exposed on 443 with the tenant certificate, which must then also cover the
+    private zone (*.internal.<federated dns>).
+    """
+
+    model_config = ConfigDict(validate_default=True, extra="forbid")
+
+    protocol_version: TargetProtocolVersions = Field(
+        default=TargetProtocolVersions.HTTP1,
+        description="Protocol version of the requests sent to the tasks",
+    )
+
+    container_port: int = Field(
+        default=DEFAULT_CONTAINER_PORT,
+        ge=1,
+        le=65535,
+        description="Port the container listens on",
+    )
+
+    grpc_health_path: str = Field(
+        default=DEFAULT_GRPC_HEALTH_PATH,
+        pattern=r"^/[^/]+/[^/]+$",
+        description="gRPC method called by the health check (/package.Service/Method)",
+    )
+
+    healthy_grpc_codes: str = Field(
+        default=DEFAULT_HEALTHY_GRPC_CODES,
+        pattern=r"^\d{1,2}(-\d{1,2})?(,\d{1,2}(-\d{1,2})?)*$",
+        description="gRPC status codes of a healthy target, e.g. 0 or 0-99",
+    )
+
+    @model_validator(mode="after")
+    def validate_grpc_codes(cls, values) -> "ServiceProtocol":
+        codes = [
+            int(code)
+            for code_range in values.healthy_grpc_codes.split(",")
+            for code in code_range.split("-")
+        ]
+        if any(code > 99 for code in codes):
+            raise ValueError("healthy_grpc_codes must be between 0 and 99")
+        return values
+
+    @property
+    def is_grpc(self) -> bool:
+        return self.protocol_version == TargetProtocolVersions.GRPC
+
+    @property
+    def requires_https(self) -> bool:
+        return self.protocol_version != TargetProtocolVersions.HTTP1
+
+    @property
+    def application_protocol_version(self):
+        from aws_cdk import aws_elasticloadbalancingv2 as elbv2
+
+        return elbv2.ApplicationProtocolVersion[self.protocol_version.value]
+
+    @property
+    def app_protocol(self):
+        from aws_cdk import aws_ecs as ecs
+
+        return {
+            TargetProtocolVersions.HTTP1: ecs.AppProtocol.http,
+            TargetProtocolVersions.HTTP2: ecs.AppProtocol.http2,
+            TargetProtocolVersions.GRPC: ecs.AppProtocol.grpc,
+        }[self.protocol_version]
@@ -0,0 +1,168 @@
+from enum import Enum
+from typing import Optional
+from pydantic import BaseModel, Field, model_validator, ConfigDict
+from cdk_auto_platform.models.compute.fargate_task_compute import FargateTaskCompute
+from cdk_auto_platform.models.compute.operating_system import OperatingSystem
+
+MAX_ULIMIT = 2**31 - 1
+MAX_NOFILE_ULIMIT = 1048576
+MIN_MEMORY_RESERVATION_MIB = 6
+MAX_STOP_TIMEOUT_SECONDS = 120
+
+
+class UlimitNames(Enum):
+    CORE = "core"
+    CPU = "cpu"
+    DATA = "data"
+    FSIZE = "fsize"
+    LOCKS = "locks"
+    MEMLOCK = "memlock"
+    MSGQUEUE = "msgqueue"
+    NICE = "nice"
+    NOFILE = "nofile"
+    NPROC = "nproc"
+    RSS = "rss"
+    RTPRIO = "rtprio"
+    RTTIME = "rttime"
+    SIGPENDING = "sigpending"
+    STACK = "stack"
+
+
+class ContainerUlimit(BaseModel):
+    model_config = ConfigDict(validate_default=True, extra="forbid")
+
+    name: UlimitNames = Field(description="Resource limited by the ulimit")
+
+    soft_limit: int = Field(ge=0, le=MAX_ULIMIT, description="Soft limit")
+
+    hard_limit: int = Field(ge=0, le=MAX_ULIMIT, description="Hard limit")
+
+    @model_validator(mode="after")
+    def validate_limits(cls, values) -> "ContainerUlimit":
+        if values.soft_limit > values.hard_limit:
+            raise ValueError(
+                f"The {values.name.value} soft_limit must not exceed its hard_limit"
+            )
+        if (
+            values.name == UlimitNames.NOFILE
+            and values.hard_limit > MAX_NOFILE_ULIMIT
+        ):
+            raise ValueError(
+                f"Fargate allows a nofile hard_limit up to {MAX_NOFILE_ULIMIT}"
+            )
+        return values
+
+    @property
+    def ulimit(self):
+        from aws_cdk import aws_ecs as ecs
+
+        return ecs.Ulimit(
+            name=ecs.UlimitName[self.name.name],
+            soft_limit=self.soft_limit,
+            hard_limit=self.hard_limit,
+        )
+
+
+class ScratchMount(BaseModel):
+    """
+    Writable path backed by a bind mount on the task ephemeral storage. Fargate
+    does not support tmpfs mounts, so these are the writable paths of a
+    container with a read-only root filesystem.
+    """
+
+    model_config = ConfigDict(validate_default=True, extra="forbid")
+
+    name: str = Field(
+        pattern=r"^[a-zA-Z0-9][a-zA-Z0-9_-]{0,254}$",
+        description="Volume name of the mount",
+    )
+
+    container_path: str = Field(
+        pattern=r"^/", description="Absolute path of the mount in the container"
+    )
+
+
+class ContainerTuning(BaseModel):
+    """
+    Runtime settings of the container of a task definition. Unset fields keep
+    the ECS defaults.
+    """
+
+    model_config = ConfigDict(validate_default=True, extra="forbid")
+
+    ulimits: list[ContainerUlimit] = Field(
+        default=[], description="Ulimits of the container, e.g. nofile"
+    )
+
+    memory_reservation_mib: Optional[int] = Field(
+        default=None,
+        ge=MIN_MEMORY_RESERVATION_MIB,
+        description="Soft memory limit of the container in MiB",
+    )
+
+    stop_timeout_seconds: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=MAX_STOP_TIMEOUT_SECONDS,
+        description="Seconds to wait after SIGTERM before the container is killed",
+    )
+
+    init_process_enabled: bool = Field(
+        default=False,
+        description="Run an init process that forwards signals and reaps zombies",
+    )
+
+    readonly_root_filesystem: bool = Field(
+        default=False, description="Mount the root filesystem as read-only"
+    )
+
+    scratch_mounts: list[ScratchMount] = Field(
+        default=[], description="Writable paths on the task ephemeral storage"
+    )
+
+    @model_validator(mode="after")
+    def validate_unique_names(cls, values) -> "ContainerTuning":
+        ulimit_names = [ulimit.name for ulimit in values.ulimits]
+        if len(ulimit_names) != len(set(ulimit_names)):
+            raise ValueError("ulimits names must be unique")
+
+        mount_names = [mount.name for mount in values.scratch_mounts]
+        mount_paths = [mount.container_path for mount in values.scratch_mounts]
+        if len(mount_names) != len(set(mount_names)) or len(mount_paths) != len(
+            set(mount_paths)
+        ):
+            raise ValueError("scratch_mounts names and container paths must be unique")
+        return values
+
+    def validate_compute(self, compute: FargateTaskCompute) -> None:
+        if (
+            self.memory_reservation_mib is not None
+            and self.memory_reservation_mib > int(compute.memory_limit_mib)
+        ):
+            raise ValueError(
+                f"memory_reservation_mib {self.memory_reservation_mib} exceeds the "
+                f"task memory of {compute.memory_limit_mib} MiB"
+            )
+
+        if compute.operating_system == OperatingSystem.WINDOWS and (
+            self.ulimits or self.init_process_enabled or self.readonly_root_filesystem
+        ):
+            raise ValueError(
+                "ulimits, init_process_enabled and readonly_root_filesystem are not "
+                "supported by Windows tasks"
+            )
+
+    @property
+    def container_options(self) -> dict:
+        from aws_cdk import Duration
+
+        options: dict = {}
+        if self.ulimits:
+            options["ulimits"] = [ulimit.ulimit for ulimit in self.ulimits]
+        if self.memory_reservation_mib is not None:
+            options["memory_reservation_mib"] = self.memory_reservation_mib
+        if self.stop_timeout_seconds is not None:
+            options["stop_timeout"] = Duration.seconds(self.stop_timeout_seconds)
+        if self.readonly_root_filesystem:
+            options["readonly_root_filesystem"] = True
+        return options
@@ -0,0 +1,83 @@
+from enum import Enum
+from typing import Any, Optional
+from pydantic import BaseModel, Field, ConfigDict
+
+DEFAULT_CACHE_TAG_SUFFIX = "buildcache"
+
+
+class DockerCacheModes(Enum):
+    MIN = "min"
+    MAX = "max"
+
+
+class DockerBuildOptions(BaseModel):
+    """
+    Build arguments, target stage and BuildKit registry cache of an image
+    asset. The cache is a tag of an ECR repository of the tenant, so builds on
+    ephemeral runners only rebuild the layers that changed. The cache is
+    opt-in: exporting it needs a BuildKit builder that supports registry
+    caches (docker-container driver or the containerd image store of Docker),
+    the default docker driver rejects it before the build starts.
+    """
+
+    model_config = ConfigDict(validate_default=True, extra="forbid")
+
+    build_args: dict[str, str] = Field(
+        default={}, description="Build arguments of the Dockerfile"
+    )
+
+    target: Optional[str] = Field(
+        default=None,
+        pattern=r"^[a-zA-Z0-9][a-zA-Z0-9_.-]*$",
+        description="Stage of a multi-stage Dockerfile to build",
+    )
+
+    cache: bool = Field(
+        default=False,
+        description="Import and export the layer cache from the ECR repository",
+    )
+
+    cache_tag: Optional[str] = Field(
+        default=None,
+        pattern=r"^[a-zA-Z0-9_][a-zA-Z0-9_.-]{0,127}$",
+        description="Tag of the cache, <service or lambda name>-buildcache by default",
+    )
+
+    cache_mode: DockerCacheModes = Field(
+        default=DockerCacheModes.MAX,
+        description="max also caches the layers of the intermediate stages",
+    )
+
+    def get_cache_tag(self, name: str) -> str:
+        return self.cache_tag or f"{name}-{DEFAULT_CACHE_TAG_SUFFIX}"
+
+    def get_asset_options(
+        self, name: str, cache_repository_uri: Optional[str] = None
+    ) -> dict[str, Any]:
+        options: dict[str, Any] = {
+            "build_args": self.build_args or None,
+            "target": self.target,
+        }
+        if not self.cache or cache_repository_uri is None:
+            return options
+
+        from aws_cdk import aws_ecr_assets as ecr_assets
+
+        cache_ref = f"{cache_repository_uri}:{self.get_cache_tag(name)}"
+        options["cache_from"] = [
+            ecr_assets.DockerCacheOption(type="registry", params={"ref": cache_ref})
+        ]
+        # ECR only accepts the cache as an OCI image manifest. A failed export
+        # (e.g. the repository is created by the same deployment) doesn't fail
+        # the build.
+        options["cache_to"] = ecr_assets.DockerCacheOption(
+            type="registry",
+            params={
+                "ref": cache_ref,
+                "mode": self.cache_mode.value,
+                "image-manifest": "true",
+                "oci-mediatypes": "true",
+                "ignore-error": "true",
+            },
+        )
+        return options
@@ -0,0 +1,102 @@
+from typing import Optional
+from pydantic import BaseModel, Field, model_validator, ConfigDict
+from cdk_auto_platform.models.compute.fargate_task_compute import FargateTaskCompute
+from cdk_auto_platform.models.compute.operating_system import OperatingSystem
+
+DEFAULT_SOCI_VERSION = "0.9.0"
+DEFAULT_ZSTD_COMPRESSION_LEVEL = 3
+DEFAULT_SOCI_MIN_LAYER_SIZE_MIB = 10
+TASK_STARTUP_METRICS_NAMESPACE = "EcsTaskStartup"
+TASK_STARTUP_TIME_METRIC_NAME = "TaskStartupTime"
+IMAGE_PULL_TIME_METRIC_NAME = "ImagePullTime"
+
+
+class ImageAcceleration(BaseModel):
+    """
+    Shortens the image pull of new tasks. Asset images can be built with zstd
+    layers, which Fargate decompresses faster than gzip, or get a SOCI index
+    pushed next to each tagged image of the ECR registry, so Fargate starts
+    the task before the layers are fully pulled. SOCI indexes gzip layers
+    only, both can't be combined on the same image. The time from task
+    creation to running is published for the services that set it.
+
+    zstd layers need the containerd image store of the Docker daemon that
+    publishes the asset: with the classic store, `docker push` silently
+    recompresses the image to gzip. The requirement is acknowledged with
+    containerd_image_store, zstd_compression is rejected without it.
+    """
+
+    model_config = ConfigDict(validate_default=True, extra="forbid")
+
+    zstd_compression: bool = Field(
+        default=False,
+        description="Build the asset image with zstd compressed layers",
+    )
+
+    containerd_image_store: bool = Field(
+        default=False,
+        description="The Docker daemon publishing the asset uses the containerd "
+        "image store, required by zstd_compression",
+    )
+
+    zstd_compression_level: int = Field(
+        default=DEFAULT_ZSTD_COMPRESSION_LEVEL,
+        ge=1,
+        le=22,
+        description="Level of the zstd compression, higher is smaller but slower",
+    )
+
+    soci_index: bool = Field(
+        default=True,
+        description="Push a SOCI index for each tagged image of the ECR registry",
+    )
+
+    soci_min_layer_size_mib: int = Field(
+        default=DEFAULT_SOCI_MIN_LAYER_SIZE_MIB,
+        ge=0,
+        description="Layers smaller than this size are pulled, not lazy-loaded",
+    )
+
+    soci_version: str = Field(
+        default=DEFAULT_SOCI_VERSION,
+        pattern=r"^\d+\.\d+\.\d+$",
+        description="Release of the soci-snapshotter CLI building the indexes",
+    )
+
+    @model_validator(mode="after")
+    def validate_acceleration(cls, values) -> "ImageAcceleration":
+        if values.zstd_compression and values.soci_index:
+            raise ValueError(
+                "soci_index requires gzip layers, it can't be combined with "
+                "zstd_compression"
+            )
+        if values.zstd_compression and not values.containerd_image_store:
+            raise ValueError(
+                "zstd_compression requires the containerd image store, docker "
+                "push recompresses the layers to gzip with the classic store. "
+                "Enable it in the Docker daemon and set containerd_image_store"
+            )
+        return values
+
+    def validate_compute(self, compute: FargateTaskCompute) -> None:
+        if compute.operating_system == OperatingSystem.WINDOWS and (
+            self.zstd_compression or self.soci_index
+        ):
+            raise ValueError(
+                "zstd_compression and soci_index are not supported by Windows tasks"
+            )
+
+    @property
+    def docker_outputs(self) -> Optional[list[str]]:
+        if not self.zstd_compression:
+            return None
+
+        # force-compression recompresses the gzip layers of the base image
+        return [
+            "type=image,oci-mediatypes=true,compression=zstd,"
+            f"compression-level={self.zstd_compression_level},force-compression=true"
+        ]
+
+    @property
+    def soci_min_layer_size_bytes(self) -> int:
+        return self.soci_min_layer_size_mib * 1024 * 1024
@@ -0,0 +1,153 @@
+import re
+from enum import Enum
+from pydantic import BaseModel, Field, ConfigDict
+from cdk_auto_platform.models.compute.fargate_task_compute import FargateTaskCompute
+from cdk_auto_platform.models.compute.operating_system import OperatingSystem
+
+DEFAULT_COLLECTOR_IMAGE = "public.ecr.aws/aws-observability/aws-otel-collector:v0.40.0"
+DEFAULT_METRICS_NAMESPACE = "ApplicationTelemetry"
+DEFAULT_LATENCY_METRIC_NAME = "http.server.request.duration"
+OTLP_GRPC_PORT = 4317
+OTLP_HTTP_PORT = 4318
+HEALTH_CHECK_PORT = 13133
+
+
+class LatencyStatistics(Enum):
+    P50 = "p50"
+    P90 = "p90"
+    P99 = "p99"
+
+
+class OtelCollector(BaseModel):
+    """
+    ADOT collector sidecar of a task. The application sends OTLP to localhost,
+    metrics are exported to CloudWatch as EMF and traces to X-Ray. The latency
+    histogram of the service is kept with the service.name dimension only, so
+    the dashboard can draw its percentiles. The application records its
+    histograms with exponential buckets: awsemf exports those as values and
+    counts, while the explicit buckets of the SDK default become statistic
+    sets CloudWatch can't compute percentiles from.
+    """
+
+    model_config = ConfigDict(validate_default=True, extra="forbid")
+
+    image: str = Field(
+        default=DEFAULT_COLLECTOR_IMAGE, description="Image of the collector"
+    )
+
+    cpu: int = Field(
+        default=128, ge=0, le=4096, description="CPU units reserved by the collector"
+    )
+
+    memory_reservation_mib: int = Field(
+        default=128, ge=6, description="Soft memory limit of the collector in MiB"
+    )
+
+    metrics_namespace: str = Field(
+        default=DEFAULT_METRICS_NAMESPACE,
+        min_length=1,
+        max_length=255,
+        description="CloudWatch namespace of the application metrics",
+    )
+
+    latency_metric_name: str = Field(
+        default=DEFAULT_LATENCY_METRIC_NAME,
+        min_length=1,
+        description="OTel histogram with the server request duration",
+    )
+
+    latency_statistics: list[LatencyStatistics] = Field(
+        default=[LatencyStatistics.P50, LatencyStatistics.P90, LatencyStatistics.P99],
+        description="Percentiles of the latency drawn in the dashboard",
+    )
+
+    traces_enabled: bool = Field(
+        default=True, description="Export the traces to X-Ray"
+    )
+
+    def validate_compute(self, compute: FargateTaskCompute) -> None:
+        if compute.operating_system != OperatingSystem.LINUX:
+            raise ValueError("The OTel collector sidecar requires a Linux task")
+        if self.cpu >= float(compute.cpu):
+            raise ValueError(
+                f"The OTel collector cpu {self.cpu} must be lower than the task "
+                f"cpu {compute.cpu}"
+            )
+        if self.memory_reservation_mib >= int(compute.memory_limit_mib):
+            raise ValueError(
+                f"The OTel collector memory_reservation_mib "
+                f"{self.memory_reservation_mib} must be lower than the task memory "
+                f"of {compute.memory_limit_mib} MiB"
+            )
+
+    def get_config(self, log_group_name: str) -> str:
+        pipelines = [
+            "    metrics:",
+            "      receivers: [otlp]",
+            "      processors: [resourcedetection, batch]",
+            "      exporters: [awsemf]",
+        ]
+        exporters = [
+            "  awsemf:",
+            f"    namespace: {self.metrics_namespace}",
+            f"    log_group_name: {log_group_name}",
+            "    log_stream_name: otel-{TaskId}",
+            "    resource_to_telemetry_conversion:",
+            "      enabled: true",
+            "    dimension_rollup_option: NoDimensionRollup",
+            "    metric_declarations:",
+            "      - dimensions: [[service.name]]",
+            "        metric_name_selectors:",
+            f"          - ^{re.escape(self.latency_metric_name)}$",
+        ]
+        if self.traces_enabled:
+            pipelines += [
+                "    traces:",
+                "      receivers: [otlp]",
+                "      processors: [resourcedetection, batch]",
+                "      exporters: [awsxray]",
+            ]
+            exporters += ["  awsxray: {}"]
+
+        return "\n".join(
+            [
+                "extensions:",
+                "  health_check:",
+                f"    endpoint: 0.0.0.0:{HEALTH_CHECK_PORT}",
+                "receivers:",
+                "  otlp:",
+                "    protocols:",
+                "      grpc:",
+                f"        endpoint: 0.0.0.0:{OTLP_GRPC_PORT}",
+                "      http:",
+                f"        endpoint: 0.0.0.0:{OTLP_HTTP_PORT}",
+                "processors:",
+                "  batch: {}",
+                "  resourcedetection:",
+                "    detectors: [env, ecs]",
+                "exporters:",
+                *exporters,
+                "service:",
+                "  extensions: [health_check]",
+                "  pipelines:",
+                *pipelines,
+            ]
+        )
+
+    def get_application_environment(
+        self, service_name: str, environment: str
+    ) -> dict[str, str]:
+        application_environment = {
+            "OTEL_EXPORTER_OTLP_ENDPOINT": f"http://localhost:{OTLP_GRPC_PORT}",
+            "OTEL_EXPORTER_OTLP_PROTOCOL": "grpc",
+            "OTEL_SERVICE_NAME": service_name,
+            "OTEL_RESOURCE_ATTRIBUTES": f"deployment.environment={environment}",
+            "OTEL_METRICS_EXPORTER": "otlp",
+            "OTEL_EXPORTER_OTLP_METRICS_DEFAULT_HISTOGRAM_AGGREGATION": (
+                "base2_exponential_bucket_histogram"
+            ),
+            "OTEL_TRACES_EXPORTER": "otlp" if self.traces_enabled else "none",
+        }
+        if self.traces_enabled:
+            application_environment["OTEL_PROPAGATORS"] = "tracecontext,baggage,xray"
+        return application_environment
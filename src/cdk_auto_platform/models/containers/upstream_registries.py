@@ -0,0 +1,70 @@
+from enum import Enum
+from typing import Optional
+
+DOCKER_HUB_HOSTS = ("docker.io", "index.docker.io", "registry-1.docker.io")
+
+
+class UpstreamRegistries(Enum):
+    """
+    Upstream registries an ECR pull-through cache rule can cache. The values
+    are the upstream registry names of the rules.
+    """
+
+    ECR_PUBLIC = "ecr-public"
+    DOCKER_HUB = "docker-hub"
+    QUAY = "quay"
+    GITHUB = "github-container-registry"
+    GITLAB = "gitlab-container-registry"
+    K8S = "k8s"
+
+    @property
+    def url(self) -> str:
+        return {
+            UpstreamRegistries.ECR_PUBLIC: "public.ecr.aws",
+            UpstreamRegistries.DOCKER_HUB: "registry-1.docker.io",
+            UpstreamRegistries.QUAY: "quay.io",
+            UpstreamRegistries.GITHUB: "ghcr.io",
+            UpstreamRegistries.GITLAB: "registry.gitlab.com",
+            UpstreamRegistries.K8S: "registry.k8s.io",
+        }[self]
+
+    @property
+    def short_name(self) -> str:
+        return {
+            UpstreamRegistries.ECR_PUBLIC: "ecr-public",
+            UpstreamRegistries.DOCKER_HUB: "docker-hub",
+            UpstreamRegistries.QUAY: "quay",
+            UpstreamRegistries.GITHUB: "ghcr",
+            UpstreamRegistries.GITLAB: "gitlab",
+            UpstreamRegistries.K8S: "k8s",
+        }[self]
+
+    @property
+    def requires_credentials(self) -> bool:
+        return self in (
+            UpstreamRegistries.DOCKER_HUB,
+            UpstreamRegistries.GITHUB,
+            UpstreamRegistries.GITLAB,
+        )
+
+    @staticmethod
+    def from_image(image: str) -> Optional[tuple["UpstreamRegistries", str]]:
+        """
+        Upstream registry and repository path of an image reference, e.g.
+        nginx:1.27 -> (DOCKER_HUB, library/nginx:1.27). None when the image is
+        not hosted by a supported upstream.
+        """
+        host, _, path = image.partition("/")
+        if not path or not ("." in host or ":" in host or host == "localhost"):
+            host, path = DOCKER_HUB_HOSTS[0], image
+
+        if host in DOCKER_HUB_HOSTS:
+            # Official images live in the library namespace of Docker Hub
+            if "/" not in path:
+                path = f"library/{path}"
+            return UpstreamRegistries.DOCKER_HUB, path
+
+        for upstream_registry in UpstreamRegistries:
+            if upstream_registry.url == host:
+                return upstream_registry, path
+        return None
@@ -1,8 +1,11 @@
-from aws_cdk.aws_rds import IEngine
+from typing import TYPE_CHECKING
 from cdk_auto_platform.models.database.engine_types import EngineTypes
 from cdk_auto_platform.models.database.instance_family import InstanceFamily
 from cdk_auto_platform.models.database.instance_size import InstanceSize
 
+if TYPE_CHECKING:
+    from aws_cdk.aws_rds import IEngine
+
 
 class RdsPerformance:
     VALID_CONFIGURATIONS = {
@@ -52,7 +55,7 @@ class RdsPerformance:
 
     def __init__(
         self,
-        engine: IEngine,
+        engine: "IEngine",
         instance_family: InstanceFamily,
         instance_size: InstanceSize,
     ):
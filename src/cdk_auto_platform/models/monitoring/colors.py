@@ -1,5 +1,10 @@
 class Colors:
     RESPONSE_TIME_COLOR = "#FF0000"  # Red - critical for user experience
+    LATENCY_P50_COLOR = "#FA8072"  # Salmon
+    LATENCY_P90_COLOR = "#FF4500"  # Orange Red
+    LATENCY_P99_COLOR = "#B22222"  # Firebrick
+    TASK_STARTUP_TIME_COLOR = "#8A2BE2"  # Blue Violet
+    IMAGE_PULL_TIME_COLOR = "#4B0082"  # Indigo
 
     REQUEST_COUNT_COLOR = "#4287f5"  # Blue - informational metric
     ACTIVE_CONNECTION_COUNT_COLOR = "#00FF00"  # Green
@@ -7,6 +12,8 @@ class Colors:
     PROCESSED_BYTES_COLOR = "#FFD700"  # Gold
     HTTP_CODE_ELB_5XX_COUNT_COLOR = "#8B0000"  # Dark Red - critical errors
     HTTP_CODE_ELB_4XX_COUNT_COLOR = "#FFA500"  # Orange - warning errors
+    HEALTHY_HOST_COUNT_COLOR = "#2E8B57"  # Sea Green
+    UNHEALTHY_HOST_COUNT_COLOR = "#800000"  # Maroon
 
     CPU_UTILIZATION_COLOR = "#FF69B4"  # Hot Pink
     MEMORY_UTILIZATION_COLOR = "#20B2AA"  # Light Sea Green
@@ -15,3 +22,8 @@ class Colors:
     FREEABLE_MEMORY_COLOR = "#DDA0DD"  # Plum
     READ_IOPS_COLOR = "#00CED1"  # Dark Turquoise
     WRITE_IOPS_COLOR = "#6495ED"  # Cornflower Blue
+
+    PERCENT_IO_LIMIT_COLOR = "#B8860B"  # Dark Goldenrod
+    BURST_CREDIT_BALANCE_COLOR = "#228B22"  # Forest Green
+    PERMITTED_THROUGHPUT_COLOR = "#708090"  # Slate Gray
+    METERED_IO_BYTES_COLOR = "#1E90FF"  # Dodger Blue
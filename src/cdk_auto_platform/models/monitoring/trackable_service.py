@@ -1,23 +1,33 @@
 from enum import Enum
 from abc import ABC
-from aws_cdk import aws_cloudwatch as cloudwatch
-from aws_cdk.aws_cloudwatch import ComparisonOperator
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from aws_cdk import aws_cloudwatch as cloudwatch
 
 
 class TrackableService(ABC):
     def __init__(
         self,
         service_type: Enum,
-        metric: cloudwatch.Metric,
+        metric: "cloudwatch.Metric",
         threshold: Enum,
-        comparison_operator: ComparisonOperator = (
-            ComparisonOperator.GREATER_THAN_THRESHOLD
-        ),
+        comparison_operator: Optional["cloudwatch.ComparisonOperator"] = None,
+        metric_name: Optional[str] = None,
     ):
         self.service_type = service_type
         self.metric = metric
+        self.metric_name = metric_name or metric.metric_name
         self.threshold = threshold
-        self.comparison_operator = comparison_operator
+        self.comparison_operator = (
+            comparison_operator or self._default_comparison_operator()
+        )
+
+    @staticmethod
+    def _default_comparison_operator() -> "cloudwatch.ComparisonOperator":
+        from aws_cdk.aws_cloudwatch import ComparisonOperator
+
+        return ComparisonOperator.GREATER_THAN_THRESHOLD
 
-    def set_alarm(self, alarm: cloudwatch.Alarm) -> None:
+    def set_alarm(self, alarm: "cloudwatch.Alarm") -> None:
         self.alarm = alarm
@@ -0,0 +1,65 @@
+from enum import Enum
+from typing import Optional
+from pydantic import BaseModel, Field, ConfigDict
+
+DEFAULT_POSIX_ID = 1000
+MAX_POSIX_ID = 4294967295
+DEFAULT_CONTAINER_PATH = "/mnt/efs"
+
+
+class FileSystemAccessPoint(BaseModel):
+    """
+    EFS access point of a service and the way its tasks mount it. Each
+    service is confined to its own root directory, created with the given
+    owner and permissions, and its files are written as the POSIX user of the
+    access point whatever the user of the container. With IAM authorization
+    the task role must be allowed to mount the file system.
+    """
+
+    model_config = ConfigDict(validate_default=True, extra="forbid")
+
+    root_directory: Optional[str] = Field(
+        default=None,
+        pattern=r"^/",
+        max_length=100,
+        description="Root directory of the access point, /<service type> if unset",
+    )
+
+    posix_uid: int = Field(
+        default=DEFAULT_POSIX_ID,
+        ge=0,
+        le=MAX_POSIX_ID,
+        description="User ID of the file operations and the root directory owner",
+    )
+
+    posix_gid: int = Field(
+        default=DEFAULT_POSIX_ID,
+        ge=0,
+        le=MAX_POSIX_ID,
+        description="Group ID of the file operations and the root directory owner",
+    )
+
+    permissions: str = Field(
+        default="750",
+        pattern=r"^[0-7]{3,4}$",
+        description="Octal permissions of the root directory when it is created",
+    )
+
+    container_path: str = Field(
+        default=DEFAULT_CONTAINER_PATH,
+        pattern=r"^/",
+        description="Path of the mount point in the container",
+    )
+
+    read_only: bool = Field(
+        default=False,
+        description="Mount the access point read-only",
+    )
+
+    iam_authorization: bool = Field(
+        default=True,
+        description="Authorize the mount with the task role",
+    )
+
+    def get_root_directory(self, service_type: Enum) -> str:
+        return self.root_directory or f"/{service_type.value}"
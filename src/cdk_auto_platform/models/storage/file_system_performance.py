@@ -0,0 +1,96 @@
+from enum import Enum
+from typing import Optional
+from pydantic import BaseModel, Field, model_validator, ConfigDict
+
+EFS_METRICS_NAMESPACE = "AWS/EFS"
+
+
+class EfsThroughputModes(Enum):
+    ELASTIC = "elastic"
+    PROVISIONED = "provisioned"
+    BURSTING = "bursting"
+
+    @property
+    def throughput_mode(self):
+        from aws_cdk.aws_efs import ThroughputMode
+
+        return {
+            EfsThroughputModes.ELASTIC: ThroughputMode.ELASTIC,
+            EfsThroughputModes.PROVISIONED: ThroughputMode.PROVISIONED,
+            EfsThroughputModes.BURSTING: ThroughputMode.BURSTING,
+        }[self]
+
+
+class EfsPerformanceModes(Enum):
+    GENERAL_PURPOSE = "generalPurpose"
+    MAX_IO = "maxIO"
+
+    @property
+    def performance_mode(self):
+        from aws_cdk.aws_efs import PerformanceMode
+
+        return {
+            EfsPerformanceModes.GENERAL_PURPOSE: PerformanceMode.GENERAL_PURPOSE,
+            EfsPerformanceModes.MAX_IO: PerformanceMode.MAX_IO,
+        }[self]
+
+
+class FileSystemPerformance(BaseModel):
+    """
+    Throughput and performance modes of an EFS file system. Elastic throughput
+    scales with the workload instead of spending the burst credits earned by
+    the stored size, so small file systems shared by busy services aren't
+    throttled. Provisioned throughput suits a steady, known load.
+    """
+
+    model_config = ConfigDict(validate_default=True, extra="forbid")
+
+    throughput_mode: EfsThroughputModes = Field(
+        default=EfsThroughputModes.ELASTIC,
+        description="How the throughput of the file system is allocated",
+    )
+
+    performance_mode: EfsPerformanceModes = Field(
+        default=EfsPerformanceModes.GENERAL_PURPOSE,
+        description="General purpose latency or max I/O operations per second",
+    )
+
+    provisioned_throughput_mibps: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Throughput of the provisioned mode in MiBps",
+    )
+
+    @model_validator(mode="after")
+    def validate_throughput(cls, values) -> "FileSystemPerformance":
+        is_provisioned = values.throughput_mode == EfsThroughputModes.PROVISIONED
+        if is_provisioned != (values.provisioned_throughput_mibps is not None):
+            raise ValueError(
+                "provisioned_throughput_mibps must be set with the provisioned "
+                "throughput mode only"
+            )
+        if (
+            values.throughput_mode == EfsThroughputModes.ELASTIC
+            and values.performance_mode != EfsPerformanceModes.GENERAL_PURPOSE
+        ):
+            raise ValueError(
+                "elastic throughput requires the generalPurpose performance mode"
+            )
+        return values
+
+    @property
+    def has_io_limit(self) -> bool:
+        return self.performance_mode == EfsPerformanceModes.GENERAL_PURPOSE
+
+    @property
+    def has_burst_credits(self) -> bool:
+        return self.throughput_mode == EfsThroughputModes.BURSTING
+
+    @property
+    def provisioned_throughput_per_second(self):
+        if self.provisioned_throughput_mibps is None:
+            return None
+
+        import aws_cdk as core
+
+        return core.Size.mebibytes(self.provisioned_throughput_mibps)
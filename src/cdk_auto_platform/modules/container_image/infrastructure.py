@@ -15,8 +15,16 @@ from aws_cdk import (
 # endregion
 
 # region iden-q-auto-platform
+from cdk_auto_platform.models.containers.docker_build_options import (
+    DockerBuildOptions,
+)
+from cdk_auto_platform.models.containers.image_acceleration import ImageAcceleration
 from cdk_auto_platform.models.containers.registry_types import RegistryTypes
+from cdk_auto_platform.models.containers.upstream_registries import (
+    UpstreamRegistries,
+)
 from cdk_auto_platform.models.modules.pug_module import PugModule
+from cdk_auto_platform.utils.assets.docker_build_context import DockerBuildContext
 from cdk_auto_platform.utils.configs import DeploymentConfig
 
 # endregion
@@ -33,6 +41,10 @@ class ContainerImageParams:
     relative_path: Optional[str] = None
     file: Optional[str] = None
     exclude: Optional[Sequence[str]] = None
+    image_acceleration: Optional[ImageAcceleration] = None
+    build_options: DockerBuildOptions
+    cache_repository_uri: Optional[str] = None
+    pull_through_cache_uris: Optional[dict[UpstreamRegistries, str]] = None
 
     def __init__(
         self,
@@ -47,6 +59,10 @@ class ContainerImageParams:
         relative_path: Optional[str] = None,
         file: Optional[str] = None,
         exclude: Optional[Sequence[str]] = None,
+        image_acceleration: Optional[ImageAcceleration] = None,
+        build_options: Optional[DockerBuildOptions] = None,
+        cache_repository_uri: Optional[str] = None,
+        pull_through_cache_uris: Optional[dict[UpstreamRegistries, str]] = None,
     ) -> None:
         self.service_type = service_type
         self.registry_type = registry_type
@@ -60,16 +76,57 @@ class ContainerImageParams:
         self.relative_path = relative_path
         self.file = file
         self.exclude = exclude
+        self.image_acceleration = image_acceleration
+        self.build_options = build_options or DockerBuildOptions()
+        self.cache_repository_uri = cache_repository_uri
+        """
+        Repository URIs of the pull-through cache rules, by upstream registry.
+        PUBLIC and PRIVATE images of a cached upstream are pulled from ECR.
+        """
+        self.pull_through_cache_uris = pull_through_cache_uris
+
+    @property
+    def is_asset(self) -> bool:
+        return self.is_first_deployment and self.relative_path is not None
+
+    @property
+    def cached_image(self) -> Optional[str]:
+        if self.is_asset or not self.pull_through_cache_uris:
+            return None
+
+        if self.registry_type == RegistryTypes.PRIVATE:
+            image = self.image_uri
+        elif self.registry_type == RegistryTypes.PUBLIC and self.image_tag:
+            image = f"{self.image_name}:{self.image_tag}"
+        else:
+            image = None
+
+        upstream_image = UpstreamRegistries.from_image(image) if image else None
+        if upstream_image is None:
+            return None
+        upstream_registry, path = upstream_image
+        if upstream_registry not in self.pull_through_cache_uris:
+            return None
+        return f"{self.pull_through_cache_uris[upstream_registry]}/{path}"
 
 
 class ContainerImagePug(PugModule[ecs.ContainerImage]):
     def __init__(self, params: ContainerImageParams):
         if params.is_first_deployment and params.relative_path is not None:
+            build_context = DockerBuildContext(params.relative_path, params.file)
             container_image = ecs.ContainerImage.from_asset(
-                params.relative_path,
+                build_context.directory,
                 file=params.file,
-                exclude=params.exclude,
+                exclude=build_context.exclude(params.exclude),
                 platform=params.platform,
+                outputs=(
+                    params.image_acceleration.docker_outputs
+                    if params.image_acceleration
+                    else None
+                ),
+                **params.build_options.get_asset_options(
+                    params.service_type.value, params.cache_repository_uri
+                ),
             )
         elif params.registry_type == RegistryTypes.ECR:
             if params.ecr_registry is None:
@@ -80,21 +137,34 @@ class ContainerImagePug(PugModule[ecs.ContainerImage]):
             container_image = ecs.ContainerImage.from_ecr_repository(
                 params.ecr_registry, tag=params.image_tag
             )
-        elif params.registry_type == RegistryTypes.PRIVATE:
-            if params.credentials is None:
-                raise ValueError("Credentials are not initialized")
+        else:
+            container_image = self._from_registry(params)
+
+        super().__init__(container_image)
+
+    @staticmethod
+    def _from_registry(params: ContainerImageParams) -> ecs.ContainerImage:
+        """
+        PRIVATE or PUBLIC image, pulled through the cache rule of its upstream
+        when there is one.
+        """
+        cached_image = params.cached_image
+        if params.registry_type == RegistryTypes.PRIVATE:
             if params.image_uri is None:
                 raise ValueError("Image URI is not initialized")
-            container_image = ecs.ContainerImage.from_registry(
+            if cached_image is not None:
+                # The credentials of the upstream are held by the cache rule
+                return ecs.ContainerImage.from_registry(cached_image)
+            if params.credentials is None:
+                raise ValueError("Credentials are not initialized")
+            return ecs.ContainerImage.from_registry(
                 params.image_uri, credentials=params.credentials
             )
-        else:
-            if params.image_name is None:
-                raise ValueError("Image name is not initialized")
-            if params.image_tag is None:
-                raise ValueError("Image tag is not initialized")
-            container_image = ecs.ContainerImage.from_registry(
-                f"{params.image_name}:{params.image_tag}"
-            )
 
-        super().__init__(container_image)
+        if params.image_name is None:
+            raise ValueError("Image name is not initialized")
+        if params.image_tag is None:
+            raise ValueError("Image tag is not initialized")
+        return ecs.ContainerImage.from_registry(
+            cached_image or f"{params.image_name}:{params.image_tag}"
+        )
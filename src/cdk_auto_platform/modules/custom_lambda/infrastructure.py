@@ -19,11 +19,19 @@ from aws_cdk import (
 
 
 # region: iden-q-auto-platform
+from cdk_auto_platform.models.containers.docker_build_options import (
+    DockerBuildOptions,
+)
 from cdk_auto_platform.models.modules.pug_module import PugModule
 from cdk_auto_platform.models.modules.runtime.runtime_function import (
     RuntimeIFunction,
 )
 from cdk_auto_platform.models.tenants.tenant_base import TenantBase
+from cdk_auto_platform.modules.ecr_registry.infrastructure import get_repository_uri
+from cdk_auto_platform.utils.assets.asset_fingerprint_cache import (
+    AssetFingerprintCache,
+)
+from cdk_auto_platform.utils.assets.docker_build_context import DockerBuildContext
 
 DEFAULT_MEMORY_SIZE_MB = 128
 DEFAULT_EPHEMERAL_STORAGE_SIZE_MB = 512
@@ -68,8 +76,10 @@ class LambdaParams:
     tenant_vpc: Optional[ec2.IVpc] = None
     vpc_subnets: Optional[ec2.SubnetSelection] = None
     security_groups: Optional[list[ec2.SecurityGroup]] = None
-    architecture: lambda_.Architecture = lambda_.Architecture.ARM_64
+    architecture: lambda_.Architecture
     tracing: lambda_.Tracing = lambda_.Tracing.ACTIVE
+    build_options: DockerBuildOptions
+    cache_registry: Optional[str] = None
 
     def __init__(
         self,
@@ -83,8 +93,10 @@ class LambdaParams:
         tenant_vpc: Optional[ec2.IVpc] = None,
         vpc_subnets: Optional[ec2.SubnetSelection] = None,
         security_groups: Optional[list[ec2.SecurityGroup]] = None,
-        architecture: lambda_.Architecture = lambda_.Architecture.ARM_64,
+        architecture: Optional[lambda_.Architecture] = None,
         tracing: lambda_.Tracing = lambda_.Tracing.ACTIVE,
+        build_options: Optional[DockerBuildOptions] = None,
+        cache_registry: Optional[str] = None,
     ) -> None:
         self.lambda_name = lambda_name
         self.lambda_platform = lambda_platform
@@ -99,8 +111,12 @@ class LambdaParams:
         self.tenant_vpc = tenant_vpc
         self.vpc_subnets = vpc_subnets
         self.security_groups = security_groups
-        self.architecture = architecture
+        self.architecture = architecture or lambda_.Architecture.ARM_64
         self.tracing = tracing
+        self.build_options = build_options or DockerBuildOptions()
+        # ECR repository of the build cache of a docker lambda, e.g. the registry
+        # of a service, that lets the image publishing role push to it
+        self.cache_registry = cache_registry
 
     def _validate_source_container(self):
         if self.relative_path is None and self.ecr_registry is None:
@@ -119,17 +135,32 @@ class LambdaParams:
                 if self.architecture == lambda_.Architecture.ARM_64
                 else ecr_assets.Platform.LINUX_AMD64
             )
+            build_context = DockerBuildContext(
+                ".", f"./{self.relative_path}/Dockerfile"
+            )
             return lambda_.Code.from_asset_image(
-                ".",
-                exclude=self.exclude,
+                build_context.directory,
+                exclude=build_context.exclude(self.exclude),
                 asset_name=f"{self.lambda_name}-image",
                 platform=platform,
-                file=f"./{self.relative_path}/Dockerfile",
+                file=build_context.file,
+                **self.build_options.get_asset_options(
+                    self.lambda_name,
+                    (
+                        get_repository_uri(construct, self.cache_registry)
+                        if self.cache_registry and self.build_options.cache
+                        else None
+                    ),
+                ),
             )
         elif self.relative_path and self.lambda_platform == LambdaPlatform.CODE:
             return lambda_.Code.from_asset(
                 self.relative_path,
                 exclude=self.exclude,
+                asset_hash=AssetFingerprintCache.default().fingerprint(
+                    self.relative_path, self.exclude
+                ),
+                asset_hash_type=core.AssetHashType.CUSTOM,
             )
         if self.ecr_registry:
             return lambda_.Code.from_ecr_image(
@@ -1,28 +1,71 @@
 # region: primitives
 from enum import Enum
+from typing import Optional
 from constructs import Construct
 
 # endregion
 
 # region: aws-cdk
 import aws_cdk as core
-from aws_cdk import aws_ecr as ecr
+from aws_cdk import aws_ecr as ecr, aws_iam as iam
 
 # endregion
 
 # region iden-q-auto-platform
 from cdk_auto_platform.models.modules.pug_module import PugModule
 from cdk_auto_platform.models.tenants.tenant_base import TenantBase
+from cdk_auto_platform.modules.private.permission_actions.ecr import (
+    PushImagePermissionAction,
+)
 
 # endregion
 
 
+def get_ecr_registry_name(tenant: TenantBase, service_type: Enum) -> str:
+    return (
+        f"{tenant.company}-{tenant.product.value}-{tenant.environment.value}-"
+        f"{service_type.value}-ecr-registry"
+    )
+
+
+def get_repository_uri(scope: Construct, repository_name: str) -> Optional[str]:
+    """
+    URI of a repository of the account and region of the stack, resolved at
+    synth time for the docker build of the assets. None when the stack is
+    environment agnostic or the name is a token.
+    """
+    stack = core.Stack.of(scope)
+    if any(
+        core.Token.is_unresolved(value)
+        for value in (stack.account, stack.region, repository_name)
+    ):
+        return None
+
+    return f"{stack.account}.dkr.ecr.{stack.region}.amazonaws.com/{repository_name}"
+
+
+def grant_image_asset_publishing(repository: ecr.Repository) -> None:
+    """
+    Lets the image publishing role of the CDK bootstrap push the build cache of
+    the assets to the repository.
+    """
+    synthesizer = core.DefaultStackSynthesizer
+    publishing_role_arn = core.Fn.sub(
+        synthesizer.DEFAULT_IMAGE_ASSET_PUBLISHING_ROLE_ARN,
+        {"Qualifier": synthesizer.DEFAULT_QUALIFIER},
+    )
+
+    repository.add_to_resource_policy(
+        iam.PolicyStatement(
+            principals=[iam.ArnPrincipal(publishing_role_arn)],
+            actions=PushImagePermissionAction().actions,
+        )
+    )
+
+
 class EcrRegistryPug(PugModule[ecr.Repository]):
     def __init__(self, scope: Construct, tenant: TenantBase, service_type: Enum):
-        ECR_REGISTRY_NAME = (
-            f"{tenant.company}-{tenant.product.value}-{tenant.environment.value}-"
-            f"{service_type.value}-ecr-registry"
-        )
+        ECR_REGISTRY_NAME = get_ecr_registry_name(tenant, service_type)
 
         registry = ecr.Repository(
             scope,
@@ -61,6 +61,51 @@ class EcsFargateServiceParams:
 # endregion
 
 
+def get_domain_name(tenant: TenantBase, service_type: Enum) -> str:
+    return (
+        service_type.value
+        if tenant.environment == AppEnvironment.PROD
+        else f"{service_type.value}-{tenant.environment.value}"
+    )
+
+
+def configure_target_group(
+    target_group: elbv2.ApplicationTargetGroup,
+    tenant: TenantBase,
+    service_type: Enum,
+) -> None:
+    """
+    Health check and load balancing attributes of the target group of a service.
+    """
+    blueprint = tenant.ecs_fargate_blueprints[service_type]
+    protocol = blueprint.protocol
+    time_configuration = blueprint.time_configuration
+
+    target_group.configure_health_check(
+        path=(
+            protocol.grpc_health_path
+            if protocol.is_grpc
+            else time_configuration.health_path
+        ),
+        healthy_http_codes=(
+            None if protocol.is_grpc else time_configuration.healthy_http_codes
+        ),
+        healthy_grpc_codes=(protocol.healthy_grpc_codes if protocol.is_grpc else None),
+        interval=time_configuration.health_check_interval,
+        timeout=time_configuration.health_check_timeout,
+        healthy_threshold_count=time_configuration.healthy_threshold_count,
+        unhealthy_threshold_count=time_configuration.unhealthy_threshold_count,
+    )
+
+    if blueprint.load_balancing:
+        for key, value in blueprint.load_balancing.attributes.items():
+            target_group.set_attribute(key, value)
+        if blueprint.load_balancing.stickiness_duration:
+            target_group.enable_cookie_stickiness(
+                blueprint.load_balancing.stickiness_duration
+            )
+
+
 class EcsFargateServicePug(
     PugModule[ecs_patterns.ApplicationLoadBalancedFargateService]
 ):
@@ -72,30 +117,38 @@ class EcsFargateServicePug(
             f"{tenant.environment.value}-{params.service_type.value}-container-service"
         )
 
+        capacity = tenant.ecs_fargate_blueprints[params.service_type].capacity
+        protocol = tenant.ecs_fargate_blueprints[params.service_type].protocol
+        deployment = tenant.ecs_fargate_blueprints[params.service_type].deployment
+
+        # HTTP2 and GRPC target groups are only allowed behind HTTPS listeners
+        IS_HTTPS = not params.is_internal or protocol.requires_https
+
         container_service = ecs_patterns.ApplicationLoadBalancedFargateService(
             scope,
             ECS_SERVICE_NAME,
             service_name=ECS_SERVICE_NAME,
             cluster=params.cluster,
             task_definition=params.task_definition,
-            listener_port=80 if params.is_internal else 443,
+            listener_port=443 if IS_HTTPS else 80,
             redirect_http=False if params.is_internal else True,
             public_load_balancer=False if params.is_internal else True,
-            certificate=None if params.is_internal else params.certificate,
+            certificate=params.certificate if IS_HTTPS else None,
             domain_zone=(
                 params.private_hosted_zone
                 if params.is_internal
                 else params.public_hosted_zone
             ),
-            domain_name=(
-                params.service_type.value
-                if tenant.environment == AppEnvironment.PROD
-                else f"{params.service_type.value}-{tenant.environment.value}"
-            ),
+            domain_name=get_domain_name(tenant, params.service_type),
             protocol=(
-                elbv2.ApplicationProtocol.HTTP
-                if params.is_internal
-                else elbv2.ApplicationProtocol.HTTPS
+                elbv2.ApplicationProtocol.HTTPS
+                if IS_HTTPS
+                else elbv2.ApplicationProtocol.HTTP
+            ),
+            protocol_version=(
+                protocol.application_protocol_version
+                if protocol.requires_https
+                else None
             ),
             task_subnets=ec2.SubnetSelection(subnet_type=params.subnet_type),
             assign_public_ip=(
@@ -107,27 +160,29 @@ class EcsFargateServicePug(
             platform_version=ecs.FargatePlatformVersion.LATEST,
             propagate_tags=ecs.PropagatedTagSource.TASK_DEFINITION,
             enable_ecs_managed_tags=True,
+            capacity_provider_strategies=(
+                capacity.capacity_provider_strategies if capacity else None
+            ),
+            health_check_grace_period=tenant.ecs_fargate_blueprints[
+                params.service_type
+            ].time_configuration.health_check_grace_period,
+            min_healthy_percent=(
+                deployment.min_healthy_percent if deployment else None
+            ),
+            max_healthy_percent=(
+                deployment.max_healthy_percent if deployment else None
+            ),
+            circuit_breaker=(
+                deployment.deployment_circuit_breaker if deployment else None
+            ),
         )
 
-        container_service.target_group.configure_health_check(
-            path=tenant.ecs_fargate_blueprints[
-                params.service_type
-            ].time_configuration.health_path,
-            healthy_http_codes=tenant.ecs_fargate_blueprints[
-                params.service_type
-            ].time_configuration.healthy_http_codes,
-            interval=tenant.ecs_fargate_blueprints[
-                params.service_type
-            ].time_configuration.health_check_interval,
-            timeout=tenant.ecs_fargate_blueprints[
-                params.service_type
-            ].time_configuration.health_check_timeout,
-            healthy_threshold_count=tenant.ecs_fargate_blueprints[
-                params.service_type
-            ].time_configuration.healthy_threshold_count,
-            unhealthy_threshold_count=tenant.ecs_fargate_blueprints[
-                params.service_type
-            ].time_configuration.unhealthy_threshold_count,
+        configure_target_group(
+            container_service.target_group, tenant, params.service_type
         )
 
+        if params.cluster.default_cloud_map_namespace:
+            # Client of the Service Connect services of the cluster
+            container_service.service.enable_service_connect()
+
         super().__init__(container_service)
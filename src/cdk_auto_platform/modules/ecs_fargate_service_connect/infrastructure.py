@@ -0,0 +1,155 @@
+# region: primitives
+from enum import Enum
+from typing import Optional
+from constructs import Construct
+
+# endregion
+
+# region: aws-cdk
+from aws_cdk import (
+    aws_ecs as ecs,
+    aws_ec2 as ec2,
+    aws_logs as logs,
+)
+
+# endregion
+
+# region iden-q-auto-platform
+from cdk_auto_platform.models.modules.pug_module import PugModule
+from cdk_auto_platform.models.tenants.tenant_base import TenantBase
+
+# endregion
+
+# region: iden-q-auto-platform -> ecs fargate service connect params
+
+
+class EcsFargateServiceConnectParams:
+    service_type: Enum
+    cluster: ecs.Cluster
+    task_definition: ecs.FargateTaskDefinition
+    log_group: logs.ILogGroup
+    subnet_type: ec2.SubnetType
+
+    def __init__(
+        self,
+        service_type: Enum,
+        cluster: ecs.Cluster,
+        task_definition: ecs.FargateTaskDefinition,
+        log_group: logs.ILogGroup,
+        subnet_type: Optional[ec2.SubnetType] = None,
+    ) -> None:
+        self.service_type = service_type
+        self.cluster = cluster
+        self.task_definition = task_definition
+        self.log_group = log_group
+        self.subnet_type = subnet_type or ec2.SubnetType.PRIVATE_WITH_EGRESS
+
+
+# endregion
+
+
+class ServiceConnectFargateService:
+    """
+    Fargate service reached through Service Connect. It mirrors the
+    attributes of ApplicationLoadBalancedFargateService used by the builders,
+    without load balancer nor target group.
+    """
+
+    load_balancer = None
+    target_group = None
+
+    def __init__(
+        self,
+        service: ecs.FargateService,
+        task_definition: ecs.FargateTaskDefinition,
+        cluster: ecs.Cluster,
+        discovery_name: str,
+        port: int,
+    ) -> None:
+        self.service = service
+        self.task_definition = task_definition
+        self.cluster = cluster
+        self.discovery_name = discovery_name
+        self.port = port
+
+
+def get_port_mapping_name(service_type: Enum) -> str:
+    return f"{service_type.value}"
+
+
+class EcsFargateServiceConnectPug(PugModule[ServiceConnectFargateService]):
+    def __init__(
+        self,
+        scope: Construct,
+        tenant: TenantBase,
+        params: EcsFargateServiceConnectParams,
+    ):
+        ECS_SERVICE_NAME = (
+            f"{tenant.company}-{tenant.product.value}-"
+            f"{tenant.environment.value}-{params.service_type.value}-container-service"
+        )
+
+        blueprint = tenant.ecs_fargate_blueprints[params.service_type]
+        service_connect = blueprint.service_connect
+        if service_connect is None:
+            raise ValueError(
+                f"service_connect is required for {params.service_type.value}"
+            )
+        capacity = blueprint.capacity
+        deployment = blueprint.deployment
+
+        DISCOVERY_NAME = params.service_type.value
+        CLIENT_PORT = service_connect.client_port or blueprint.protocol.container_port
+
+        service = ecs.FargateService(
+            scope,
+            ECS_SERVICE_NAME,
+            service_name=ECS_SERVICE_NAME,
+            cluster=params.cluster,
+            task_definition=params.task_definition,
+            vpc_subnets=ec2.SubnetSelection(subnet_type=params.subnet_type),
+            assign_public_ip=(
+                True if params.subnet_type == ec2.SubnetType.PUBLIC else False
+            ),
+            platform_version=ecs.FargatePlatformVersion.LATEST,
+            propagate_tags=ecs.PropagatedTagSource.TASK_DEFINITION,
+            enable_ecs_managed_tags=True,
+            capacity_provider_strategies=(
+                capacity.capacity_provider_strategies if capacity else None
+            ),
+            min_healthy_percent=(
+                deployment.min_healthy_percent if deployment else None
+            ),
+            max_healthy_percent=(
+                deployment.max_healthy_percent if deployment else None
+            ),
+            circuit_breaker=(
+                deployment.deployment_circuit_breaker if deployment else None
+            ),
+            service_connect_configuration=ecs.ServiceConnectProps(
+                services=[
+                    ecs.ServiceConnectService(
+                        port_mapping_name=get_port_mapping_name(params.service_type),
+                        discovery_name=DISCOVERY_NAME,
+                        dns_name=service_connect.dns_name or DISCOVERY_NAME,
+                        port=CLIENT_PORT,
+                        per_request_timeout=service_connect.per_request_timeout,
+                        idle_timeout=service_connect.idle_timeout,
+                    )
+                ],
+                log_driver=ecs.LogDrivers.aws_logs(
+                    stream_prefix="service-connect",
+                    log_group=params.log_group,
+                ),
+            ),
+        )
+
+        super().__init__(
+            ServiceConnectFargateService(
+                service=service,
+                task_definition=params.task_definition,
+                cluster=params.cluster,
+                discovery_name=DISCOVERY_NAME,
+                port=blueprint.protocol.container_port,
+            )
+        )
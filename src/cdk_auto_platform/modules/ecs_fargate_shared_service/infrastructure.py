@@ -0,0 +1,189 @@
+# region: primitives
+from enum import Enum
+from typing import Optional
+from constructs import Construct
+
+# endregion
+
+# region: aws-cdk
+from aws_cdk import (
+    aws_ecs as ecs,
+    aws_ec2 as ec2,
+    aws_elasticloadbalancingv2 as elbv2,
+    aws_route53 as route53,
+    aws_route53_targets as route53_targets,
+)
+
+# endregion
+
+# region iden-q-auto-platform
+from cdk_auto_platform.models.modules.pug_module import PugModule
+from cdk_auto_platform.models.tenants.tenant_base import TenantBase
+from cdk_auto_platform.modules.ecs_fargate_service.infrastructure import (
+    configure_target_group,
+    get_domain_name,
+)
+
+# endregion
+
+# region: iden-q-auto-platform -> ecs fargate shared service params
+
+
+class EcsFargateSharedServiceParams:
+    service_type: Enum
+    cluster: ecs.Cluster
+    task_definition: ecs.FargateTaskDefinition
+    load_balancer: elbv2.ApplicationLoadBalancer
+    listener: elbv2.ApplicationListener
+    domain_zone: route53.IHostedZone
+    subnet_type: ec2.SubnetType
+
+    def __init__(
+        self,
+        service_type: Enum,
+        cluster: ecs.Cluster,
+        task_definition: ecs.FargateTaskDefinition,
+        load_balancer: elbv2.ApplicationLoadBalancer,
+        listener: elbv2.ApplicationListener,
+        domain_zone: route53.IHostedZone,
+        subnet_type: Optional[ec2.SubnetType] = None,
+    ) -> None:
+        self.service_type = service_type
+        self.cluster = cluster
+        self.task_definition = task_definition
+        self.load_balancer = load_balancer
+        self.listener = listener
+        self.domain_zone = domain_zone
+        self.subnet_type = subnet_type or ec2.SubnetType.PRIVATE_WITH_EGRESS
+
+
+# endregion
+
+
+class SharedLoadBalancedFargateService:
+    """
+    Fargate service behind the shared ALB of its tenant. It mirrors the
+    attributes of ApplicationLoadBalancedFargateService used by the builders,
+    the target group being the one of its listener rule.
+    """
+
+    def __init__(
+        self,
+        service: ecs.FargateService,
+        task_definition: ecs.FargateTaskDefinition,
+        cluster: ecs.Cluster,
+        load_balancer: elbv2.ApplicationLoadBalancer,
+        listener: elbv2.ApplicationListener,
+        target_group: elbv2.ApplicationTargetGroup,
+    ) -> None:
+        self.service = service
+        self.task_definition = task_definition
+        self.cluster = cluster
+        self.load_balancer = load_balancer
+        self.listener = listener
+        self.target_group = target_group
+
+
+class EcsFargateSharedServicePug(PugModule[SharedLoadBalancedFargateService]):
+    def __init__(
+        self,
+        scope: Construct,
+        tenant: TenantBase,
+        params: EcsFargateSharedServiceParams,
+    ):
+        ECS_SERVICE_NAME = (
+            f"{tenant.company}-{tenant.product.value}-"
+            f"{tenant.environment.value}-{params.service_type.value}-container-service"
+        )
+
+        blueprint = tenant.ecs_fargate_blueprints[params.service_type]
+        listener_rule = blueprint.listener_rule
+        if listener_rule is None:
+            raise ValueError(
+                f"listener_rule is required for {params.service_type.value}"
+            )
+        capacity = blueprint.capacity
+        protocol = blueprint.protocol
+        deployment = blueprint.deployment
+
+        DOMAIN_NAME = get_domain_name(tenant, params.service_type)
+        # The application container is the first essential container
+        CONTAINER_NAME = params.task_definition.default_container.container_name
+
+        service = ecs.FargateService(
+            scope,
+            ECS_SERVICE_NAME,
+            service_name=ECS_SERVICE_NAME,
+            cluster=params.cluster,
+            task_definition=params.task_definition,
+            vpc_subnets=ec2.SubnetSelection(subnet_type=params.subnet_type),
+            assign_public_ip=(
+                True if params.subnet_type == ec2.SubnetType.PUBLIC else False
+            ),
+            platform_version=ecs.FargatePlatformVersion.LATEST,
+            propagate_tags=ecs.PropagatedTagSource.TASK_DEFINITION,
+            enable_ecs_managed_tags=True,
+            capacity_provider_strategies=(
+                capacity.capacity_provider_strategies if capacity else None
+            ),
+            health_check_grace_period=(
+                blueprint.time_configuration.health_check_grace_period
+            ),
+            min_healthy_percent=(
+                deployment.min_healthy_percent if deployment else None
+            ),
+            max_healthy_percent=(
+                deployment.max_healthy_percent if deployment else None
+            ),
+            circuit_breaker=(
+                deployment.deployment_circuit_breaker if deployment else None
+            ),
+        )
+
+        if params.cluster.default_cloud_map_namespace:
+            # Client of the Service Connect services of the cluster
+            service.enable_service_connect()
+
+        target_group = params.listener.add_targets(
+            f"{ECS_SERVICE_NAME}-target-group",
+            priority=listener_rule.priority,
+            conditions=listener_rule.get_conditions(
+                f"{DOMAIN_NAME}.{params.domain_zone.zone_name}"
+            ),
+            port=protocol.container_port,
+            protocol=elbv2.ApplicationProtocol.HTTP,
+            protocol_version=(
+                protocol.application_protocol_version
+                if protocol.requires_https
+                else None
+            ),
+            targets=[
+                service.load_balancer_target(
+                    container_name=CONTAINER_NAME,
+                    container_port=protocol.container_port,
+                )
+            ],
+        )
+
+        configure_target_group(target_group, tenant, params.service_type)
+
+        route53.ARecord(
+            scope,
+            f"{ECS_SERVICE_NAME}-dns",
+            zone=params.domain_zone,
+            record_name=DOMAIN_NAME,
+            target=route53.RecordTarget.from_alias(
+                route53_targets.LoadBalancerTarget(params.load_balancer)
+            ),
+        )
+
+        super().__init__(
+            SharedLoadBalancedFargateService(
+                service=service,
+                task_definition=params.task_definition,
+                cluster=params.cluster,
+                load_balancer=params.load_balancer,
+                listener=params.listener,
+                target_group=target_group,
+            )
+        )
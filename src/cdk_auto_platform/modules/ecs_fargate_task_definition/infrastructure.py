@@ -6,9 +6,11 @@ from constructs import Construct
 # endregion
 
 # region: aws-cdk
+import aws_cdk as core
 from aws_cdk import (
     aws_ecr as ecr,
     aws_ecs as ecs,
+    aws_iam as iam,
     aws_secretsmanager as secretsmanager,
     aws_efs as efs,
     aws_logs as logs,
@@ -17,9 +19,17 @@ from aws_cdk import (
 # endregion
 
 # region iden-q-auto-platform
+from cdk_auto_platform.models.containers.container_tuning import ContainerTuning
+from cdk_auto_platform.models.containers.otel_collector import OtelCollector
 from cdk_auto_platform.models.containers.registry_types import RegistryTypes
 from cdk_auto_platform.models.modules.pug_module import PugModule
 from cdk_auto_platform.models.tenants.tenant_base import TenantBase
+from cdk_auto_platform.modules.ecs_fargate_service_connect.infrastructure import (
+    get_port_mapping_name,
+)
+from cdk_auto_platform.modules.private.permission_actions.xray import (
+    PutTracesPermissionAction,
+)
 from cdk_auto_platform.packages.secrets.parsers import (
     parse_secrets_for_ecs,
     parse_database_secret_for_ecs,
@@ -29,6 +39,16 @@ from cdk_auto_platform.packages.secrets.names import DB_PASS, DB_USER
 # endregion
 
 
+def get_telemetry_service_name(tenant: TenantBase, service_type: Enum) -> str:
+    """
+    OTEL_SERVICE_NAME of a service, the service.name dimension of its metrics.
+    """
+    return (
+        f"{tenant.company}-{tenant.product.value}-{tenant.environment.value}-"
+        f"{service_type.value}"
+    )
+
+
 class LogGroupParams:
     log_group: logs.LogGroup
     log_group_name: str
@@ -42,16 +62,38 @@ class FileSystemParams:
     file_system: efs.FileSystem
     container_path: str
     read_only: bool
+    access_point: Optional[efs.IAccessPoint] = None
+    iam_authorization: bool = False
 
     def __init__(
         self,
         file_system: efs.FileSystem,
         container_path: Optional[str],
         read_only: bool,
+        access_point: Optional[efs.IAccessPoint] = None,
+        iam_authorization: bool = False,
     ) -> None:
         self.file_system = file_system
         self.container_path = container_path or "/mnt/efs"
         self.read_only = read_only
+        """
+        Access point the volume is mounted through, instead of the root of
+        the file system.
+        """
+        self.access_point = access_point
+        self.iam_authorization = iam_authorization
+
+    @property
+    def authorization_config(self) -> Optional[ecs.AuthorizationConfig]:
+        if self.access_point is None and not self.iam_authorization:
+            return None
+
+        return ecs.AuthorizationConfig(
+            access_point_id=(
+                self.access_point.access_point_id if self.access_point else None
+            ),
+            iam="ENABLED" if self.iam_authorization else None,
+        )
 
 
 class EcsFargateTaskDefinitionParams:
@@ -130,26 +172,35 @@ class EcsFargateTaskDefinitionPug(PugModule[ecs.FargateTaskDefinition]):
             db_secrets = parse_database_secret_for_ecs(params.service_db_secret, DB_USER, DB_PASS)  # type: ignore
             secrets.update(db_secrets)
 
-        DB_COMMAND_TIMEOUT = tenant.ecs_fargate_blueprints[
-            params.service_type
-        ].time_configuration.db_command_timeout_seconds
+        blueprint = tenant.ecs_fargate_blueprints[params.service_type]
 
-        params.service_environment.update(
-            {
-                "DB_COMMAND_TIMEOUT": str(DB_COMMAND_TIMEOUT),
-                "environment": tenant.environment.value,
-            }
-        )
+        # Copied so the params of the caller keep their own environment
+        service_environment = {
+            **params.service_environment,
+            "DB_COMMAND_TIMEOUT": str(
+                blueprint.time_configuration.db_command_timeout_seconds
+            ),
+            "environment": tenant.environment.value,
+        }
 
-        if params.file_system_params:
-            task_definition.add_volume(
-                name=params.file_system_params.file_system.node.id,
-                efs_volume_configuration=ecs.EfsVolumeConfiguration(
-                    file_system_id=params.file_system_params.file_system.file_system_id,
-                    transit_encryption="ENABLED",
-                ),
+        otel_collector: Optional[OtelCollector] = blueprint.otel_collector
+
+        if otel_collector:
+            service_environment.update(
+                otel_collector.get_application_environment(
+                    get_telemetry_service_name(tenant, params.service_type),
+                    tenant.environment.value,
+                )
             )
 
+        if params.file_system_params:
+            self._add_file_system_volume(task_definition, params.file_system_params)
+
+        container_tuning = blueprint.container_tuning
+        container_options = self._get_container_options(
+            scope, TASK_DEFINITION_NAME, container_tuning
+        )
+
         container = task_definition.add_container(
             CONTAINER_NAME,
             image=params.container_image,
@@ -157,24 +208,174 @@ class EcsFargateTaskDefinitionPug(PugModule[ecs.FargateTaskDefinition]):
                 stream_prefix=params.log_group_params.log_group_name,
                 log_group=params.log_group_params.log_group,
             ),
-            environment=params.service_environment,
+            environment=service_environment,
             secrets=secrets,
-            command=tenant.ecs_fargate_blueprints[params.service_type].command,
-            entry_point=tenant.ecs_fargate_blueprints[params.service_type].entry_point,
+            command=blueprint.command,
+            entry_point=blueprint.entry_point,
+            **container_options,
         )
 
-        container.add_port_mappings(ecs.PortMapping(container_port=80, host_port=80))
+        protocol = blueprint.protocol
+        CONTAINER_PORT = protocol.container_port
 
-        if params.file_system_params:
-            container.add_mount_points(
-                ecs.MountPoint(
-                    container_path=params.file_system_params.container_path,
-                    source_volume=params.file_system_params.file_system.node.id,
-                    read_only=params.file_system_params.read_only,
+        if blueprint.service_connect:
+            # Service Connect publishes named port mappings with their protocol
+            container.add_port_mappings(
+                ecs.PortMapping(
+                    name=get_port_mapping_name(params.service_type),
+                    container_port=CONTAINER_PORT,
+                    host_port=CONTAINER_PORT,
+                    app_protocol=protocol.app_protocol,
                 )
             )
+        else:
+            container.add_port_mappings(
+                ecs.PortMapping(container_port=CONTAINER_PORT, host_port=CONTAINER_PORT)
+            )
+
+        self._add_mount_points(
+            task_definition, container, params.file_system_params, container_tuning
+        )
+
+        if otel_collector:
+            self._add_otel_collector(
+                scope, tenant, params, task_definition, container, otel_collector
+            )
 
         if params.registry_type == RegistryTypes.ECR and params.ecr_registry:
             params.ecr_registry.grant_pull(task_definition.task_role)
 
         super().__init__(task_definition)
+
+    @staticmethod
+    def _add_file_system_volume(
+        task_definition: ecs.FargateTaskDefinition,
+        file_system_params: FileSystemParams,
+    ):
+        file_system = file_system_params.file_system
+        task_definition.add_volume(
+            name=file_system.node.id,
+            efs_volume_configuration=ecs.EfsVolumeConfiguration(
+                file_system_id=file_system.file_system_id,
+                transit_encryption="ENABLED",
+                authorization_config=file_system_params.authorization_config,
+            ),
+        )
+
+        if file_system_params.iam_authorization:
+            if file_system_params.read_only:
+                file_system.grant_read(task_definition.task_role)
+            else:
+                file_system.grant_read_write(task_definition.task_role)
+
+    @staticmethod
+    def _get_container_options(
+        scope: Construct,
+        task_definition_name: str,
+        container_tuning: Optional[ContainerTuning],
+    ) -> dict:
+        if not container_tuning:
+            return {}
+
+        container_options = container_tuning.container_options
+        if container_tuning.init_process_enabled:
+            container_options["linux_parameters"] = ecs.LinuxParameters(
+                scope,
+                f"{task_definition_name}-linux-parameters",
+                init_process_enabled=True,
+            )
+        return container_options
+
+    @staticmethod
+    def _add_mount_points(
+        task_definition: ecs.FargateTaskDefinition,
+        container: ecs.ContainerDefinition,
+        file_system_params: Optional[FileSystemParams],
+        container_tuning: Optional[ContainerTuning],
+    ):
+        if file_system_params:
+            container.add_mount_points(
+                ecs.MountPoint(
+                    container_path=file_system_params.container_path,
+                    source_volume=file_system_params.file_system.node.id,
+                    read_only=file_system_params.read_only,
+                )
+            )
+
+        if container_tuning:
+            for scratch_mount in container_tuning.scratch_mounts:
+                task_definition.add_volume(name=scratch_mount.name)
+                container.add_mount_points(
+                    ecs.MountPoint(
+                        container_path=scratch_mount.container_path,
+                        source_volume=scratch_mount.name,
+                        read_only=False,
+                    )
+                )
+
+    @staticmethod
+    def _add_otel_collector(
+        scope: Construct,
+        tenant: TenantBase,
+        params: EcsFargateTaskDefinitionParams,
+        task_definition: ecs.FargateTaskDefinition,
+        container: ecs.ContainerDefinition,
+        otel_collector: OtelCollector,
+    ):
+        METRICS_LOG_GROUP_NAME = (
+            f"{tenant.company}-{tenant.product.value}-{tenant.environment.value}-"
+            f"{params.service_type.value}-otel-metrics-log-group"
+        )
+
+        metrics_log_group = logs.LogGroup(
+            scope,
+            METRICS_LOG_GROUP_NAME,
+            log_group_name=METRICS_LOG_GROUP_NAME,
+            retention=logs.RetentionDays.ONE_MONTH,
+            removal_policy=core.RemovalPolicy.DESTROY,
+        )
+        metrics_log_group.grant_write(task_definition.task_role)
+
+        if otel_collector.traces_enabled:
+            task_definition.add_to_task_role_policy(
+                iam.PolicyStatement(
+                    actions=PutTracesPermissionAction().actions,
+                    resources=["*"],
+                )
+            )
+
+        COLLECTOR_CONTAINER_NAME = (
+            f"{tenant.company}-{tenant.product.value}-{tenant.environment.value}-"
+            "otel-collector-container"
+        )
+
+        collector_container = task_definition.add_container(
+            COLLECTOR_CONTAINER_NAME,
+            image=ecs.ContainerImage.from_registry(otel_collector.image),
+            cpu=otel_collector.cpu,
+            memory_reservation_mib=otel_collector.memory_reservation_mib,
+            # Scheduled tasks stop once the application exits
+            essential=False,
+            logging=ecs.LogDrivers.aws_logs(
+                stream_prefix="otel-collector",
+                log_group=params.log_group_params.log_group,
+            ),
+            environment={
+                "AOT_CONFIG_CONTENT": otel_collector.get_config(METRICS_LOG_GROUP_NAME)
+            },
+            health_check=ecs.HealthCheck(
+                command=["CMD", "/healthcheck"],
+                interval=core.Duration.seconds(5),
+                timeout=core.Duration.seconds(5),
+                retries=5,
+                start_period=core.Duration.seconds(10),
+            ),
+        )
+
+        # The application starts once the collector accepts OTLP
+        container.add_container_dependencies(
+            ecs.ContainerDependency(
+                container=collector_container,
+                condition=ecs.ContainerDependencyCondition.HEALTHY,
+            )
+        )
@@ -11,11 +11,13 @@ from aws_cdk import (
     aws_ecs_patterns as ecs_patterns,
     aws_ec2 as ec2,
     aws_applicationautoscaling as appscaling,
+    aws_events as events,
 )
 
 # endregion
 
 # region: iden-q-auto-platform
+from cdk_auto_platform.models.compute.fargate_capacity import FargateCapacity
 from cdk_auto_platform.models.modules.pug_module import PugModule
 from cdk_auto_platform.models.tenants.tenant_base import TenantBase
 
@@ -79,4 +81,30 @@ class EcsScheduledFargateTaskPug(PugModule[ecs_patterns.ScheduledFargateTask]):
             },
         )
 
+        capacity = tenant.ecs_fargate_blueprints[params.service_type].capacity
+        if capacity:
+            self._apply_capacity_provider_strategy(scheduled_task, capacity)
+
         super().__init__(scheduled_task)
+
+    @staticmethod
+    def _apply_capacity_provider_strategy(
+        scheduled_task: ecs_patterns.ScheduledFargateTask, capacity: FargateCapacity
+    ):
+        # The EcsTask rule target has no capacity provider strategy property and
+        # EventBridge rejects a LaunchType next to a CapacityProviderStrategy.
+        rule: events.CfnRule = (
+            scheduled_task.event_rule.node.default_child  # type: ignore
+        )
+        rule.add_property_deletion_override("Targets.0.EcsParameters.LaunchType")
+        rule.add_property_override(
+            "Targets.0.EcsParameters.CapacityProviderStrategy",
+            [
+                {
+                    "CapacityProvider": item["capacity_provider"],
+                    "Base": item["base"],
+                    "Weight": item["weight"],
+                }
+                for item in capacity.strategy
+            ],
+        )
@@ -0,0 +1,63 @@
+# region: primitives
+from enum import Enum
+from constructs import Construct
+
+# endregion
+
+# region: aws-cdk
+from aws_cdk import (
+    aws_ec2 as ec2,
+    aws_efs as efs,
+)
+
+# endregion
+
+# region iden-q-auto-platform
+from cdk_auto_platform.models.modules.pug_module import PugModule
+from cdk_auto_platform.models.storage.file_system_performance import (
+    FileSystemPerformance,
+)
+from cdk_auto_platform.models.tenants.tenant_base import TenantBase
+
+# endregion
+
+
+class EfsFileSystemParams:
+    file_system_type: Enum
+    vpc: ec2.IVpc
+    performance: FileSystemPerformance
+
+    def __init__(
+        self,
+        file_system_type: Enum,
+        vpc: ec2.IVpc,
+        performance: FileSystemPerformance,
+    ) -> None:
+        self.file_system_type = file_system_type
+        self.vpc = vpc
+        self.performance = performance
+
+
+class EfsFileSystemPug(PugModule[efs.FileSystem]):
+    def __init__(
+        self, scope: Construct, tenant: TenantBase, params: EfsFileSystemParams
+    ):
+        FILE_SYSTEM_NAME = (
+            f"{tenant.company}-{tenant.product.value}-{tenant.environment.value}-"
+            f"{params.file_system_type.value}-file-system"
+        )
+
+        file_system = efs.FileSystem(
+            scope,
+            FILE_SYSTEM_NAME,
+            file_system_name=FILE_SYSTEM_NAME,
+            vpc=params.vpc,
+            encrypted=True,
+            throughput_mode=params.performance.throughput_mode.throughput_mode,
+            performance_mode=params.performance.performance_mode.performance_mode,
+            provisioned_throughput_per_second=(
+                params.performance.provisioned_throughput_per_second
+            ),
+        )
+
+        super().__init__(file_system)
@@ -0,0 +1,28 @@
+from cdk_auto_platform.models.modules.permission_action import PermissionAction
+
+
+class PushImagePermissionAction(PermissionAction):
+    def __init__(self) -> None:
+        actions = [
+            "ecr:BatchCheckLayerAvailability",
+            "ecr:BatchGetImage",
+            "ecr:GetDownloadUrlForLayer",
+            "ecr:InitiateLayerUpload",
+            "ecr:UploadLayerPart",
+            "ecr:CompleteLayerUpload",
+            "ecr:PutImage",
+        ]
+        super().__init__(actions)
+
+
+class PullThroughCachePermissionAction(PermissionAction):
+    def __init__(self) -> None:
+        actions = [
+            "ecr:BatchCheckLayerAvailability",
+            "ecr:BatchGetImage",
+            "ecr:GetDownloadUrlForLayer",
+            # The first pull of an image creates its repository in the cache
+            "ecr:BatchImportUpstreamImage",
+            "ecr:CreateRepository",
+        ]
+        super().__init__(actions)
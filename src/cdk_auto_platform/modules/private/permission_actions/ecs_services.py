@@ -5,3 +5,9 @@ class UpdateServicePermissionAction(PermissionAction):
     def __init__(self) -> None:
         actions = ["ecs:UpdateService"]
         super().__init__(actions)
+
+
+class TaskProtectionPermissionAction(PermissionAction):
+    def __init__(self) -> None:
+        actions = ["ecs:GetTaskProtection", "ecs:UpdateTaskProtection"]
+        super().__init__(actions)
@@ -0,0 +1,12 @@
+from cdk_auto_platform.models.modules.permission_action import PermissionAction
+
+
+class PutTracesPermissionAction(PermissionAction):
+    def __init__(self) -> None:
+        actions = [
+            "xray:PutTraceSegments",
+            "xray:PutTelemetryRecords",
+            "xray:GetSamplingRules",
+            "xray:GetSamplingTargets",
+        ]
+        super().__init__(actions)
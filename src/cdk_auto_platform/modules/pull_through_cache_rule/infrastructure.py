@@ -0,0 +1,86 @@
+# region: primitives
+from typing import Optional
+from constructs import Construct
+
+# endregion
+
+# region: aws-cdk
+from aws_cdk import (
+    aws_ecr as ecr,
+    aws_secretsmanager as secretsmanager,
+)
+
+# endregion
+
+# region iden-q-auto-platform
+from cdk_auto_platform.models.containers.upstream_registries import (
+    UpstreamRegistries,
+)
+from cdk_auto_platform.models.modules.pug_module import PugModule
+from cdk_auto_platform.models.tenants.tenant_base import TenantBase
+
+# endregion
+
+MAX_REPOSITORY_PREFIX_LENGTH = 30
+
+
+def get_repository_prefix(
+    tenant: TenantBase, upstream_registry: UpstreamRegistries
+) -> str:
+    repository_prefix = (
+        f"{tenant.product.value}-{tenant.environment.value}-"
+        f"{upstream_registry.short_name}"
+    )
+    if len(repository_prefix) > MAX_REPOSITORY_PREFIX_LENGTH:
+        raise ValueError(
+            f"Pull through cache prefix {repository_prefix} exceeds "
+            f"{MAX_REPOSITORY_PREFIX_LENGTH} characters"
+        )
+    return repository_prefix
+
+
+class PullThroughCacheRuleParams:
+    upstream_registry: UpstreamRegistries
+    credentials: Optional[secretsmanager.ISecret] = None
+
+    def __init__(
+        self,
+        upstream_registry: UpstreamRegistries,
+        credentials: Optional[secretsmanager.ISecret] = None,
+    ) -> None:
+        self.upstream_registry = upstream_registry
+        """
+        Secret with the username and accessToken of the upstream registry.
+        Its name must start with ecr-pullthroughcache/.
+        """
+        self.credentials = credentials
+        self._validate_credentials()
+
+    def _validate_credentials(self):
+        if self.upstream_registry.requires_credentials and self.credentials is None:
+            raise ValueError(
+                f"credentials are required to cache {self.upstream_registry.value}"
+            )
+
+
+class PullThroughCacheRulePug(PugModule[ecr.CfnPullThroughCacheRule]):
+    def __init__(
+        self,
+        scope: Construct,
+        tenant: TenantBase,
+        params: PullThroughCacheRuleParams,
+    ):
+        REPOSITORY_PREFIX = get_repository_prefix(tenant, params.upstream_registry)
+
+        rule = ecr.CfnPullThroughCacheRule(
+            scope,
+            f"{REPOSITORY_PREFIX}-pull-through-cache-rule",
+            ecr_repository_prefix=REPOSITORY_PREFIX,
+            upstream_registry=params.upstream_registry.value,
+            upstream_registry_url=params.upstream_registry.url,
+            credential_arn=(
+                params.credentials.secret_arn if params.credentials else None
+            ),
+        )
+
+        super().__init__(rule)
@@ -0,0 +1,161 @@
+# region: primitives
+from enum import Enum
+from typing import Optional
+from constructs import Construct
+
+# endregion
+
+# region: aws-cdk
+from aws_cdk import (
+    aws_codebuild as codebuild,
+    aws_ecr as ecr,
+    aws_ecr_assets as ecr_assets,
+    aws_events as events,
+    aws_events_targets as events_targets,
+)
+
+# endregion
+
+# region iden-q-auto-platform
+from cdk_auto_platform.models.containers.image_acceleration import ImageAcceleration
+from cdk_auto_platform.models.modules.pug_module import PugModule
+from cdk_auto_platform.models.tenants.tenant_base import TenantBase
+
+# endregion
+
+
+class SociIndexBuilderParams:
+    service_type: Enum
+    ecr_registry: ecr.Repository
+    platform: ecr_assets.Platform
+    image_acceleration: ImageAcceleration
+    cache_tag: Optional[str] = None
+
+    def __init__(
+        self,
+        service_type: Enum,
+        ecr_registry: ecr.Repository,
+        platform: ecr_assets.Platform,
+        image_acceleration: ImageAcceleration,
+        cache_tag: Optional[str] = None,
+    ) -> None:
+        self.service_type = service_type
+        self.ecr_registry = ecr_registry
+        self.platform = platform
+        self.image_acceleration = image_acceleration
+        self.cache_tag = cache_tag
+
+
+class SociIndexBuilderPug(PugModule[codebuild.Project]):
+    """
+    Builds and pushes the SOCI index of every tagged image pushed to the ECR
+    registry of a service, so Fargate lazy-loads its layers. The index itself
+    is pushed untagged and doesn't trigger a new build, nor does the build
+    cache tag.
+    """
+
+    def __init__(
+        self, scope: Construct, tenant: TenantBase, params: SociIndexBuilderParams
+    ):
+        SOCI_INDEX_BUILDER_NAME = (
+            f"{tenant.company}-{tenant.product.value}-{tenant.environment.value}-"
+            f"{params.service_type.value}-soci-index-builder"
+        )
+
+        project = codebuild.Project(
+            scope,
+            SOCI_INDEX_BUILDER_NAME,
+            project_name=SOCI_INDEX_BUILDER_NAME,
+            environment=codebuild.BuildEnvironment(
+                build_image=codebuild.LinuxBuildImage.STANDARD_7_0,
+                compute_type=codebuild.ComputeType.SMALL,
+                # containerd needs the privileged mode
+                privileged=True,
+            ),
+            environment_variables={
+                "SOCI_VERSION": codebuild.BuildEnvironmentVariable(
+                    value=params.image_acceleration.soci_version
+                ),
+                "PLATFORM": codebuild.BuildEnvironmentVariable(
+                    value=params.platform.platform
+                ),
+                "MIN_LAYER_SIZE": codebuild.BuildEnvironmentVariable(
+                    value=str(params.image_acceleration.soci_min_layer_size_bytes)
+                ),
+                "REPOSITORY_URI": codebuild.BuildEnvironmentVariable(
+                    value=params.ecr_registry.repository_uri
+                ),
+                "IMAGE_TAG": codebuild.BuildEnvironmentVariable(value="latest"),
+            },
+            build_spec=codebuild.BuildSpec.from_object(
+                {
+                    "version": "0.2",
+                    "phases": {
+                        "install": {
+                            "commands": [
+                                "curl -fsSL https://github.com/awslabs/"
+                                "soci-snapshotter/releases/download/v${SOCI_VERSION}/"
+                                "soci-snapshotter-${SOCI_VERSION}-linux-amd64.tar.gz"
+                                " | tar -xz -C /usr/local/bin soci",
+                                "nohup containerd > /tmp/containerd.log 2>&1 &",
+                                "sleep 5",
+                            ]
+                        },
+                        "build": {
+                            "commands": [
+                                "PASSWORD=$(aws ecr get-login-password)",
+                                "IMAGE=${REPOSITORY_URI}:${IMAGE_TAG}",
+                                "ctr image pull --platform ${PLATFORM} "
+                                "--user AWS:${PASSWORD} ${IMAGE}",
+                                "soci create --platform ${PLATFORM} "
+                                "--min-layer-size ${MIN_LAYER_SIZE} ${IMAGE}",
+                                "soci push --platform ${PLATFORM} "
+                                "--user AWS:${PASSWORD} ${IMAGE}",
+                            ]
+                        },
+                    },
+                }
+            ),
+        )
+
+        params.ecr_registry.grant_pull_push(project)
+
+        rule = events.Rule(
+            scope,
+            f"{SOCI_INDEX_BUILDER_NAME}-rule",
+            event_pattern=events.EventPattern(
+                source=["aws.ecr"],
+                detail_type=["ECR Image Action"],
+                detail={
+                    "action-type": ["PUSH"],
+                    "result": ["SUCCESS"],
+                    "repository-name": [params.ecr_registry.repository_name],
+                    "image-tag": [
+                        {"anything-but": [params.cache_tag]}
+                        if params.cache_tag
+                        else {"exists": True}
+                    ],
+                },
+            ),
+        )
+
+        rule.add_target(
+            events_targets.CodeBuildProject(
+                project,
+                event=events.RuleTargetInput.from_object(
+                    {
+                        "environmentVariablesOverride": [
+                            {
+                                "name": "IMAGE_TAG",
+                                "value": events.EventField.from_path(
+                                    "$.detail.image-tag"
+                                ),
+                                "type": "PLAINTEXT",
+                            }
+                        ]
+                    }
+                ),
+            )
+        )
+
+        super().__init__(project)
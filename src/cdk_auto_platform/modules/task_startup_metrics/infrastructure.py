@@ -0,0 +1,86 @@
+# region: primitives
+from constructs import Construct
+
+# endregion
+
+# region: aws-cdk
+import aws_cdk as core
+from aws_cdk import (
+    aws_ecs as ecs,
+    aws_events as events,
+    aws_events_targets as events_targets,
+    aws_lambda as lambda_,
+    aws_logs as logs,
+)
+
+# endregion
+
+# region iden-q-auto-platform
+from cdk_auto_platform.models.containers.image_acceleration import (
+    IMAGE_PULL_TIME_METRIC_NAME,
+    TASK_STARTUP_METRICS_NAMESPACE,
+    TASK_STARTUP_TIME_METRIC_NAME,
+)
+from cdk_auto_platform.models.modules.pug_module import PugModule
+from cdk_auto_platform.models.tenants.tenant_base import TenantBase
+from cdk_auto_platform.modules.task_startup_metrics.scripts import (
+    task_startup_metrics_handler,
+)
+
+# endregion
+
+
+class TaskStartupMetricsPug(PugModule[lambda_.Function]):
+    """
+    Publishes the time from creation to running, and the image pull time, of
+    every new task of the services of a cluster, from the ECS task state
+    change events. A task can send several RUNNING events, so the metrics are
+    meant for statistics rather than counts.
+    """
+
+    def __init__(self, scope: Construct, tenant: TenantBase, cluster: ecs.Cluster):
+        TASK_STARTUP_METRICS_NAME = (
+            f"{tenant.company}-{tenant.product.value}-{tenant.environment.value}-"
+            "task-startup-metrics"
+        )
+
+        function = lambda_.Function(
+            scope,
+            TASK_STARTUP_METRICS_NAME,
+            function_name=TASK_STARTUP_METRICS_NAME,
+            runtime=lambda_.Runtime.PYTHON_3_12,
+            architecture=lambda_.Architecture.ARM_64,
+            handler="index.handler",
+            code=lambda_.Code.from_inline(task_startup_metrics_handler),
+            timeout=core.Duration.seconds(10),
+            environment={
+                "METRICS_NAMESPACE": TASK_STARTUP_METRICS_NAMESPACE,
+                "TASK_STARTUP_TIME_METRIC_NAME": TASK_STARTUP_TIME_METRIC_NAME,
+                "IMAGE_PULL_TIME_METRIC_NAME": IMAGE_PULL_TIME_METRIC_NAME,
+            },
+            log_group=logs.LogGroup(
+                scope,
+                f"{TASK_STARTUP_METRICS_NAME}-log-group",
+                retention=logs.RetentionDays.ONE_MONTH,
+                removal_policy=core.RemovalPolicy.DESTROY,
+            ),
+        )
+
+        rule = events.Rule(
+            scope,
+            f"{TASK_STARTUP_METRICS_NAME}-rule",
+            event_pattern=events.EventPattern(
+                source=["aws.ecs"],
+                detail_type=["ECS Task State Change"],
+                detail={
+                    "clusterArn": [cluster.cluster_arn],
+                    "lastStatus": ["RUNNING"],
+                    "desiredStatus": ["RUNNING"],
+                    "group": [{"prefix": "service:"}],
+                },
+            ),
+        )
+
+        rule.add_target(events_targets.LambdaFunction(function))
+
+        super().__init__(function)
@@ -0,0 +1,44 @@
+# flake8: noqa
+
+task_startup_metrics_handler = """import json
+import os
+import time
+from datetime import datetime
+
+
+def _seconds(start, end):
+    return (datetime.fromisoformat(end) - datetime.fromisoformat(start)).total_seconds()
+
+
+def handler(event, context):
+    detail = event["detail"]
+    group = detail.get("group", "")
+    if not group.startswith("service:") or "startedAt" not in detail:
+        return
+
+    metrics = {
+        os.environ["TASK_STARTUP_TIME_METRIC_NAME"]: _seconds(
+            detail["createdAt"], detail["startedAt"]
+        )
+    }
+    if "pullStartedAt" in detail and "pullStoppedAt" in detail:
+        metrics[os.environ["IMAGE_PULL_TIME_METRIC_NAME"]] = _seconds(
+            detail["pullStartedAt"], detail["pullStoppedAt"]
+        )
+
+    # Embedded metric format, extracted by CloudWatch from the function logs
+    print(json.dumps({
+        "_aws": {
+            "Timestamp": int(time.time() * 1000),
+            "CloudWatchMetrics": [{
+                "Namespace": os.environ["METRICS_NAMESPACE"],
+                "Dimensions": [["ClusterName", "ServiceName"]],
+                "Metrics": [{"Name": name, "Unit": "Seconds"} for name in metrics],
+            }],
+        },
+        "ClusterName": detail["clusterArn"].split("/")[-1],
+        "ServiceName": group.split(":", 1)[1],
+        "TaskArn": detail["taskArn"],
+        **metrics,
+    }))
+"""
@@ -48,6 +48,10 @@ class ApplicationDashboard(Construct):
 
             modified_metrics: list[cloudwatch.Metric] = []
             for metric in drawable_service.metrics:
+                if drawable_service.is_labeled:
+                    modified_metrics.append(metric)
+                    continue
+
                 label = f"{metric.metric_name} [{metric.namespace}]"
                 modified_metric = metric.with_(label=label)
 
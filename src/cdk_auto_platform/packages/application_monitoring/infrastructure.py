@@ -2,6 +2,7 @@ from typing import Any
 
 from constructs import Construct
 from aws_cdk import (
+    AssetHashType,
     Aws,
     aws_sns as sns,
     aws_cloudwatch as cloudwatch,
@@ -18,6 +19,9 @@ from cdk_auto_platform.models.tenants.cross_platform import (
 from cdk_auto_platform.packages.secrets.parsers import parse_secrets_from_env
 from cdk_auto_platform.models.monitoring.trackable_service import TrackableService
 from cdk_auto_platform.models.tenants.tenant_base import TenantBase
+from cdk_auto_platform.utils.assets.asset_fingerprint_cache import (
+    AssetFingerprintCache,
+)
 
 
 class ApplicationMonitoring(Construct):
@@ -51,11 +55,11 @@ class ApplicationMonitoring(Construct):
             f"{tenant.company}-{tenant.product.value}-{trackable_service.threshold.name.lower()}-"
             f"{tenant.environment.value}-"
             f"{trackable_service.service_type.value}-"
-            f"{trackable_service.metric.metric_name}-alarm"
+            f"{trackable_service.metric_name}-alarm"
         )
 
         ALARM_DESCRIPTION = (
-            f"{trackable_service.metric.metric_name} "
+            f"{trackable_service.metric_name} "
             f"{trackable_service.comparison_operator.value} "
             f"{trackable_service.threshold.value}"
         )
@@ -104,13 +108,16 @@ class ApplicationMonitoring(Construct):
             f"{tenant.company}-{tenant.product.value}-{tenant.environment.value}-"
             f"{CrossPlatform.MS_TEAMS.value}-notifier"
         )
+        notifier_path = f"src/services/apps/{CrossPlatform.MS_TEAMS.value}-notifier"
         ms_teams_notifier_lambda = lambda_.Function(
             self,
             notifier_id,
             runtime=lambda_.Runtime.PYTHON_3_8,
             handler="index.handler",
             code=lambda_.Code.from_asset(
-                f"src/services/apps/{CrossPlatform.MS_TEAMS.value}-notifier"
+                notifier_path,
+                asset_hash=AssetFingerprintCache.default().fingerprint(notifier_path),
+                asset_hash_type=AssetHashType.CUSTOM,
             ),
             environment={
                 "SECRET_NAME": ms_teams_secret.secret_name,
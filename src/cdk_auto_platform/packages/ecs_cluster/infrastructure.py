@@ -4,9 +4,13 @@ from constructs import Construct
 from aws_cdk import (
     aws_ecs as ecs,
     aws_ec2 as ec2,
+    aws_servicediscovery as servicediscovery,
 )
 
 from cdk_auto_platform.models.tenants.tenant_base import TenantBase
+from cdk_auto_platform.modules.task_startup_metrics.infrastructure import (
+    TaskStartupMetricsPug,
+)
 
 
 class EcsCluster(Construct):
@@ -22,4 +26,42 @@ class EcsCluster(Construct):
             cluster_name=ECS_CLUSTER_NAME,
             vpc=tenant_vpc,
             container_insights=True,
+            enable_fargate_capacity_providers=(
+                self._uses_capacity_providers(tenant) or None
+            ),
+            default_cloud_map_namespace=(
+                ecs.CloudMapNamespaceOptions(
+                    name=(
+                        f"{tenant.company}-{tenant.product.value}-"
+                        f"{tenant.environment.value}"
+                    ),
+                    type=servicediscovery.NamespaceType.HTTP,
+                    use_for_service_connect=True,
+                )
+                if self._uses_service_connect(tenant)
+                else None
+            ),
+        )
+
+        if self._uses_image_acceleration(tenant):
+            self.task_startup_metrics = TaskStartupMetricsPug(
+                self, tenant, self.tenant_ecs_cluster
+            ).play()
+
+    @staticmethod
+    def _uses_capacity_providers(tenant: TenantBase) -> bool:
+        return any(
+            blueprint.capacity for blueprint in tenant.ecs_fargate_blueprints.values()
+        )
+
+    @staticmethod
+    def _uses_service_connect(tenant: TenantBase) -> bool:
+        return any(
+            blueprint.service_connect for blueprint in tenant.ecs_fargate_blueprints.values()
+        )
+
+    @staticmethod
+    def _uses_image_acceleration(tenant: TenantBase) -> bool:
+        return any(
+            blueprint.image_acceleration for blueprint in tenant.ecs_fargate_blueprints.values()
         )
@@ -12,6 +12,9 @@ from aws_cdk.aws_secretsmanager import ISecret
 # endregion
 
 # region: iden-q-auto-platform
+from cdk_auto_platform.models.containers.docker_build_options import (
+    DockerBuildOptions,
+)
 from cdk_auto_platform.models.tenants.tenant_base import TenantBase
 from cdk_auto_platform.build.service_secrets_builder import ServiceSecretsBuilder
 from cdk_auto_platform.build.service_task_definition_builder import (
@@ -24,6 +27,9 @@ from cdk_auto_platform.modules.ecs_scheduled_fargate_task.infrastructure import
     EcsScheduledFargateTaskParams,
     EcsScheduledFargateTaskPug,
 )
+from cdk_auto_platform.packages.pull_through_cache.infrastructure import (
+    PullThroughCache,
+)
 
 # endregion
 
@@ -48,6 +54,8 @@ class EcsScheduledTask(ServiceSecretsBuilder, ServiceTaskDefinitionBuilder, Cons
         service_environment: Optional[dict[str, str]] = None,
         registry_credentials: Optional[ISecret] = None,
         file_system_params: Optional[FileSystemParams] = None,
+        build_options: Optional[DockerBuildOptions] = None,
+        pull_through_cache: Optional[PullThroughCache] = None,
         **kwargs,
     ):
         CONSTRUCT_ID = (
@@ -76,6 +84,8 @@ class EcsScheduledTask(ServiceSecretsBuilder, ServiceTaskDefinitionBuilder, Cons
             file,
             exclude,
             service_environment,
+            build_options=build_options,
+            pull_through_cache=pull_through_cache,
         )
 
         scheduled_task_params = EcsScheduledFargateTaskParams(
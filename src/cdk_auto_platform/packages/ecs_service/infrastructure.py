@@ -13,6 +13,14 @@ from cdk_auto_platform.modules.ecs_fargate_service.infrastructure import (
     EcsFargateServiceParams,
     EcsFargateServicePug,
 )
+from cdk_auto_platform.modules.ecs_fargate_service_connect.infrastructure import (
+    EcsFargateServiceConnectParams,
+    EcsFargateServiceConnectPug,
+)
+from cdk_auto_platform.modules.ecs_fargate_shared_service.infrastructure import (
+    EcsFargateSharedServiceParams,
+    EcsFargateSharedServicePug,
+)
 
 from aws_cdk import aws_ecs as ecs, aws_ec2 as ec2
 
@@ -20,7 +28,16 @@ from aws_cdk import aws_ecs as ecs, aws_ec2 as ec2
 from aws_cdk.aws_secretsmanager import ISecret
 
 from cdk_auto_platform.packages.federated_dns.infrastructure import FederatedDns
+from cdk_auto_platform.packages.pull_through_cache.infrastructure import (
+    PullThroughCache,
+)
+from cdk_auto_platform.packages.shared_load_balancer.infrastructure import (
+    SharedLoadBalancer,
+)
 
+from cdk_auto_platform.models.containers.docker_build_options import (
+    DockerBuildOptions,
+)
 from cdk_auto_platform.models.tenants.tenant_base import TenantBase
 
 
@@ -59,6 +76,9 @@ class EcsService(
         service_environment: Optional[dict[str, str]] = None,
         registry_credentials: Optional[ISecret] = None,
         file_system_params: Optional[FileSystemParams] = None,
+        build_options: Optional[DockerBuildOptions] = None,
+        shared_load_balancer: Optional[SharedLoadBalancer] = None,
+        pull_through_cache: Optional[PullThroughCache] = None,
     ):
         CONSTRUCT_ID = (
             "ecs-service" if is_unique else f"ecs-service-{service_type.value}"
@@ -87,20 +107,87 @@ class EcsService(
             file,
             exclude,
             service_environment,
+            build_options=build_options,
+            pull_through_cache=pull_through_cache,
         )
 
-        service_params = EcsFargateServiceParams(
-            service_type=service_type,
-            cluster=cluster,
-            task_definition=self.task_definition,
-            is_internal=is_internal if is_internal else False,
-            certificate=None if is_internal else tenant_dns.certificate,
-            public_hosted_zone=tenant_dns.main_zone,
-            private_hosted_zone=tenant_dns.private_zone,
-            subnet_type=subnet_type,
-        )
-
-        self.service = EcsFargateServicePug(self, tenant, service_params).play()
-
-        if is_unique:
+        listener_rule = tenant.ecs_fargate_blueprints[service_type].listener_rule
+        if bool(listener_rule) != bool(shared_load_balancer):
+            raise ValueError(
+                f"listener_rule and shared_load_balancer of {service_type.value} "
+                "must be set together"
+            )
+
+        if shared_load_balancer and listener_rule:
+            self._validate_shared_load_balancer(
+                tenant, service_type, shared_load_balancer, bool(is_internal)
+            )
+            shared_load_balancer.reserve_priority(listener_rule.priority, service_type)
+
+            # Host-routed listener rule on the shared ALB of the tenant
+            shared_service_params = EcsFargateSharedServiceParams(
+                service_type=service_type,
+                cluster=cluster,
+                task_definition=self.task_definition,
+                load_balancer=shared_load_balancer.load_balancer,
+                listener=shared_load_balancer.listener,
+                domain_zone=shared_load_balancer.domain_zone,
+                subnet_type=subnet_type,
+            )
+
+            self.service = EcsFargateSharedServicePug(
+                self, tenant, shared_service_params
+            ).play()
+        elif tenant.ecs_fargate_blueprints[service_type].service_connect:
+            if not is_internal:
+                raise ValueError(
+                    f"service_connect requires {service_type.value} to be internal"
+                )
+
+            # Internal calls go through the Service Connect mesh, without ALB
+            service_connect_params = EcsFargateServiceConnectParams(
+                service_type=service_type,
+                cluster=cluster,
+                task_definition=self.task_definition,
+                log_group=self.log_group,
+                subnet_type=subnet_type,
+            )
+
+            self.service = EcsFargateServiceConnectPug(
+                self, tenant, service_connect_params
+            ).play()
+        else:
+            service_params = EcsFargateServiceParams(
+                service_type=service_type,
+                cluster=cluster,
+                task_definition=self.task_definition,
+                is_internal=is_internal if is_internal else False,
+                certificate=tenant_dns.certificate,
+                public_hosted_zone=tenant_dns.main_zone,
+                private_hosted_zone=tenant_dns.private_zone,
+                subnet_type=subnet_type,
+            )
+
+            self.service = EcsFargateServicePug(self, tenant, service_params).play()
+
+        if is_unique and self.service.load_balancer:
             self._build_log_access_logs(self.service.load_balancer, service_type.value)
+
+    @staticmethod
+    def _validate_shared_load_balancer(
+        tenant: TenantBase,
+        service_type: Enum,
+        shared_load_balancer: SharedLoadBalancer,
+        is_internal: bool,
+    ):
+        if shared_load_balancer.is_internal != is_internal:
+            raise ValueError(
+                f"{service_type.value} and its shared load balancer must both be "
+                "internal or public"
+            )
+        protocol = tenant.ecs_fargate_blueprints[service_type].protocol
+        if protocol.requires_https and not shared_load_balancer.is_https:
+            raise ValueError(
+                f"{protocol.protocol_version.value} target of {service_type.value} "
+                "requires an HTTPS shared load balancer"
+            )
@@ -0,0 +1,69 @@
+from typing import Optional, Sequence
+
+from constructs import Construct
+
+from aws_cdk import Aws, aws_ecr as ecr
+from aws_cdk.aws_secretsmanager import ISecret
+
+from cdk_auto_platform.models.containers.upstream_registries import (
+    UpstreamRegistries,
+)
+from cdk_auto_platform.models.tenants.tenant_base import TenantBase
+from cdk_auto_platform.modules.pull_through_cache_rule.infrastructure import (
+    PullThroughCacheRuleParams,
+    PullThroughCacheRulePug,
+    get_repository_prefix,
+)
+
+
+class PullThroughCache(Construct):
+    """
+    ECR pull-through cache rules of a tenant, one per upstream registry, in
+    the region of the tenant. Tasks of PUBLIC and PRIVATE images hosted by one
+    of these upstreams pull them from the cache, so the pulls stay in the
+    region and don't count against the rate limits of the upstream.
+    """
+
+    def __init__(
+        self,
+        scope: Construct,
+        tenant: TenantBase,
+        upstream_registries: Sequence[UpstreamRegistries],
+        credentials: Optional[dict[UpstreamRegistries, ISecret]] = None,
+        **kwargs,
+    ):
+        super().__init__(scope, "pull-through-cache", **kwargs)
+
+        credentials = credentials or {}
+        self.rules: dict[UpstreamRegistries, ecr.CfnPullThroughCacheRule] = {}
+        self.repository_prefixes: dict[UpstreamRegistries, str] = {}
+        for upstream_registry in upstream_registries:
+            rule_params = PullThroughCacheRuleParams(
+                upstream_registry=upstream_registry,
+                credentials=credentials.get(upstream_registry),
+            )
+
+            self.rules[upstream_registry] = PullThroughCacheRulePug(
+                self, tenant, rule_params
+            ).play()
+            self.repository_prefixes[upstream_registry] = get_repository_prefix(
+                tenant, upstream_registry
+            )
+
+    @property
+    def repository_uris(self) -> dict[UpstreamRegistries, str]:
+        return {
+            upstream_registry: (
+                f"{Aws.ACCOUNT_ID}.dkr.ecr.{Aws.REGION}.{Aws.URL_SUFFIX}/"
+                f"{repository_prefix}"
+            )
+            for upstream_registry, repository_prefix in self.repository_prefixes.items()
+        }
+
+    @property
+    def repository_arns(self) -> list[str]:
+        return [
+            f"arn:{Aws.PARTITION}:ecr:{Aws.REGION}:{Aws.ACCOUNT_ID}:repository/"
+            f"{repository_prefix}/*"
+            for repository_prefix in self.repository_prefixes.values()
+        ]
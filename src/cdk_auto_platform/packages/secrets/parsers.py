@@ -1,4 +1,3 @@
-import os
 from enum import Enum
 import aws_cdk as core
 from aws_cdk import (
@@ -9,10 +8,7 @@ from aws_cdk import (
 from typing import Optional
 
 from cdk_auto_platform.models.tenants.tenant_base import TenantBase
-from cdk_auto_platform.utils.validators.environment_validator import (
-    EnvironmentValidator,
-)
-from cdk_auto_platform.utils.configs import PathConfig
+from cdk_auto_platform.packages.secrets.secrets_store import SecretsStore
 
 
 def parse_secrets_from_env(
@@ -20,20 +16,13 @@ def parse_secrets_from_env(
     service_type: Enum,
     secret_names: type[Enum],
 ) -> dict[str, core.SecretValue] | None:
-    env_path = (
-        f"{PathConfig.get_folder_environment_config_path()}/"
-        f"{tenant.environment.value}/{service_type.value}.env"
+    service_values = SecretsStore.resolve(
+        tenant.environment, service_type, secret_names
     )
-    EnvironmentValidator.validate(env_path)
-    environment_json: dict[str, core.SecretValue] = {}
-
-    for secret_name in secret_names:
-        secret_value = os.getenv(secret_name.value)
-        if secret_value is None:
-            raise Exception(f"Secret not found in environment: {secret_name.value}")
-        environment_json[secret_name.value] = core.SecretValue.plain_text(secret_value)
-
-    return environment_json
+    return {
+        key: core.SecretValue.plain_text(value)
+        for key, value in service_values.items()
+    }
 
 
 def parse_secrets_for_ecs(
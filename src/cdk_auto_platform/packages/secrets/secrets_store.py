@@ -0,0 +1,153 @@
+import os
+from enum import Enum
+from typing import Mapping, Optional
+
+from cdk_auto_platform.utils.configs import ConfigSnapshot, PathConfig
+
+DOT_ENV_EXTENSION = ".env"
+
+
+class MissingSecretsError(Exception):
+    def __init__(self, environment: str, missing: Mapping[str, list[str]]):
+        self.environment = environment
+        self.missing = dict(missing)
+        details = "; ".join(
+            f"{service}: {', '.join(keys)}" for service, keys in self.missing.items()
+        )
+        super().__init__(
+            f"Secrets not found in {environment} environment: {details}"
+        )
+
+
+class SecretsStore:
+    """
+    Index of the service secret files under `.config/<environment>/`, keyed by
+    (environment, service type, key). Every `*.env` file of an environment is
+    parsed once through ConfigSnapshot and the folder is indexed again only
+    when a file is added, removed or modified, which is checked once per call
+    rather than once per key. Nothing is read from or written into os.environ,
+    which keeps services isolated and parallel synth safe.
+    """
+
+    _index: dict[tuple[str, str, str], str] = {}
+    _services: dict[str, frozenset[str]] = {}
+    _signatures: dict[str, tuple[tuple[str, int], ...]] = {}
+
+    @classmethod
+    def get(
+        cls, environment: Enum, service_type: Enum, key: str
+    ) -> Optional[str]:
+        cls._ensure_indexed(environment.value)
+        return cls._lookup(environment, service_type, key)
+
+    @classmethod
+    def resolve(
+        cls, environment: Enum, service_type: Enum, secret_names: type[Enum]
+    ) -> dict[str, str]:
+        cls._ensure_indexed(environment.value)
+        values = {
+            secret_name.value: cls._lookup(environment, service_type, secret_name.value)
+            for secret_name in secret_names
+        }
+        missing = [key for key, value in values.items() if value is None]
+        if missing:
+            raise MissingSecretsError(
+                environment.value, {cls._describe(environment, service_type): missing}
+            )
+        return values  # type: ignore
+
+    @classmethod
+    def missing(
+        cls, environment: Enum, requirements: Mapping[Enum, type[Enum]]
+    ) -> dict[str, list[str]]:
+        cls._ensure_indexed(environment.value)
+        missing: dict[str, list[str]] = {}
+        for service_type, secret_names in requirements.items():
+            keys = [
+                secret_name.value
+                for secret_name in secret_names
+                if cls._lookup(environment, service_type, secret_name.value) is None
+            ]
+            if keys:
+                missing[cls._describe(environment, service_type)] = keys
+        return missing
+
+    @classmethod
+    def validate(
+        cls,
+        environment: Enum,
+        requirements: Mapping[Enum, type[Enum]],
+        verbose: bool = True,
+    ) -> None:
+        missing = cls.missing(environment, requirements)
+        if missing:
+            for service, keys in missing.items():
+                print(
+                    f"\033[1;31m❌ Missing secrets of {service}: "
+                    f"{', '.join(keys)}\033[0m"
+                )
+            raise MissingSecretsError(environment.value, missing)
+        if not verbose:
+            return
+        print(
+            f"\033[1;32m🟢 Secrets validated: \033[1;33m{environment.value} "
+            f"({len(requirements)} services)\033[0m"
+        )
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._index = {}
+        cls._services = {}
+        cls._signatures = {}
+
+    @classmethod
+    def _ensure_indexed(cls, environment: str) -> None:
+        folder = cls._get_environment_folder(environment)
+        signature = cls._get_signature(folder)
+        if cls._signatures.get(environment) == signature:
+            return
+
+        cls._index = {
+            key: value for key, value in cls._index.items() if key[0] != environment
+        }
+        services = []
+        for file_name, _ in signature:
+            service = file_name[: -len(DOT_ENV_EXTENSION)]
+            services.append(service)
+            values = ConfigSnapshot.load(os.path.join(folder, file_name))
+            for key, value in values.items():
+                cls._index[(environment, service, key)] = value
+
+        cls._services[environment] = frozenset(services)
+        cls._signatures[environment] = signature
+
+    @classmethod
+    def _lookup(cls, environment: Enum, service_type: Enum, key: str) -> Optional[str]:
+        return cls._index.get((environment.value, service_type.value, key))
+
+    @classmethod
+    def _describe(cls, environment: Enum, service_type: Enum) -> str:
+        if service_type.value in cls._services.get(environment.value, frozenset()):
+            return service_type.value
+        file_name = f"{service_type.value}{DOT_ENV_EXTENSION}"
+        return f"{service_type.value} ({file_name} not found)"
+
+    @staticmethod
+    def _get_environment_folder(environment: str) -> str:
+        return os.path.join(
+            PathConfig.get_folder_environment_config_path(), environment
+        )
+
+    @staticmethod
+    def _get_signature(folder: str) -> tuple[tuple[str, int], ...]:
+        try:
+            entries = list(os.scandir(folder))
+        except FileNotFoundError:
+            return ()
+        return tuple(
+            sorted(
+                (entry.name, entry.stat().st_mtime_ns)
+                for entry in entries
+                if entry.name.endswith(DOT_ENV_EXTENSION) and entry.is_file()
+            )
+        )
@@ -0,0 +1,99 @@
+from enum import Enum
+
+from constructs import Construct
+
+from aws_cdk import (
+    aws_cloudwatch as cloudwatch,
+    aws_ec2 as ec2,
+    aws_efs as efs,
+)
+
+from cdk_auto_platform.models.blueprints.file_system_blueprint import (
+    FileSystemBlueprint,
+)
+from cdk_auto_platform.models.storage.file_system_performance import (
+    EFS_METRICS_NAMESPACE,
+)
+from cdk_auto_platform.models.tenants.tenant_base import TenantBase
+from cdk_auto_platform.modules.ecs_fargate_task_definition.infrastructure import (
+    FileSystemParams,
+)
+from cdk_auto_platform.modules.efs_file_system.infrastructure import (
+    EfsFileSystemParams,
+    EfsFileSystemPug,
+)
+
+
+class SharedFileSystem(Construct):
+    """
+    EFS file system shared by the services of a tenant. Each service of the
+    blueprint gets its own access point, and mounts it with the
+    FileSystemParams of get_file_system_params.
+    """
+
+    def __init__(
+        self,
+        scope: Construct,
+        tenant: TenantBase,
+        tenant_vpc: ec2.Vpc,
+        file_system_type: Enum,
+        blueprint: FileSystemBlueprint,
+        **kwargs,
+    ):
+        super().__init__(scope, f"file-system-{file_system_type.value}", **kwargs)
+
+        self.file_system_type = file_system_type
+        self.blueprint = blueprint
+
+        file_system_params = EfsFileSystemParams(
+            file_system_type=file_system_type,
+            vpc=tenant_vpc,
+            performance=blueprint.performance,
+        )
+
+        self.file_system = EfsFileSystemPug(self, tenant, file_system_params).play()
+
+        # Tasks of every subnet of the VPC reach the mount targets over NFS
+        self.file_system.connections.allow_default_port_from(
+            ec2.Peer.ipv4(tenant_vpc.vpc_cidr_block)
+        )
+
+        self.access_points: dict[Enum, efs.AccessPoint] = {}
+        for service_type, access_point in blueprint.access_points.items():
+            POSIX_UID = str(access_point.posix_uid)
+            POSIX_GID = str(access_point.posix_gid)
+
+            self.access_points[service_type] = self.file_system.add_access_point(
+                f"{service_type.value}-access-point",
+                path=access_point.get_root_directory(service_type),
+                create_acl=efs.Acl(
+                    owner_uid=POSIX_UID,
+                    owner_gid=POSIX_GID,
+                    permissions=access_point.permissions,
+                ),
+                posix_user=efs.PosixUser(uid=POSIX_UID, gid=POSIX_GID),
+            )
+
+    def get_file_system_params(self, service_type: Enum) -> FileSystemParams:
+        if service_type not in self.access_points:
+            raise ValueError(
+                f"{service_type.value} has no access point on the "
+                f"{self.file_system_type.value} file system"
+            )
+
+        access_point = self.blueprint.access_points[service_type]
+        return FileSystemParams(
+            file_system=self.file_system,
+            container_path=access_point.container_path,
+            read_only=access_point.read_only,
+            access_point=self.access_points[service_type],
+            iam_authorization=access_point.iam_authorization,
+        )
+
+    def metric(self, metric_name: str, **kwargs) -> cloudwatch.Metric:
+        return cloudwatch.Metric(
+            namespace=EFS_METRICS_NAMESPACE,
+            metric_name=metric_name,
+            dimensions_map={"FileSystemId": self.file_system.file_system_id},
+            **kwargs,
+        )
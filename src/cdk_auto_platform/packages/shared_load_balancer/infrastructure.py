@@ -0,0 +1,87 @@
+from enum import Enum
+from typing import Optional
+
+from constructs import Construct
+
+import aws_cdk as core
+from aws_cdk import (
+    aws_ecs as ecs,
+    aws_elasticloadbalancingv2 as elbv2,
+    aws_route53 as route53,
+)
+
+from cdk_auto_platform.models.tenants.tenant_base import TenantBase
+from cdk_auto_platform.packages.federated_dns.infrastructure import FederatedDns
+
+
+class SharedLoadBalancer(Construct):
+    """
+    ALB shared by the services of a tenant. Each service attaches its own
+    target group to the listener through a host-header/path-pattern rule,
+    requests matching no rule get a 404.
+    """
+
+    def __init__(
+        self,
+        scope: Construct,
+        tenant: TenantBase,
+        cluster: ecs.Cluster,
+        tenant_dns: FederatedDns,
+        is_internal: bool = False,
+        is_https: Optional[bool] = None,
+        idle_timeout: Optional[core.Duration] = None,
+        **kwargs,
+    ):
+        CONSTRUCT_ID = (
+            "shared-internal-load-balancer"
+            if is_internal
+            else "shared-load-balancer"
+        )
+        super().__init__(scope, CONSTRUCT_ID, **kwargs)
+
+        self.is_internal = is_internal
+        # HTTP2 and GRPC target groups are only allowed behind HTTPS listeners
+        self.is_https = not is_internal if is_https is None else is_https
+        self.domain_zone: route53.IHostedZone = (
+            tenant_dns.private_zone if is_internal else tenant_dns.main_zone
+        )
+        self._priorities: dict[int, Enum] = {}
+
+        LOAD_BALANCER_NAME = (
+            f"{tenant.company}-{tenant.product.value}-"
+            f"{tenant.environment.value}-{CONSTRUCT_ID}"
+        )
+
+        self.load_balancer = elbv2.ApplicationLoadBalancer(
+            self,
+            LOAD_BALANCER_NAME,
+            vpc=cluster.vpc,
+            internet_facing=not is_internal,
+            idle_timeout=idle_timeout,
+        )
+
+        self.listener = self.load_balancer.add_listener(
+            f"{LOAD_BALANCER_NAME}-listener",
+            port=443 if self.is_https else 80,
+            protocol=(
+                elbv2.ApplicationProtocol.HTTPS
+                if self.is_https
+                else elbv2.ApplicationProtocol.HTTP
+            ),
+            certificates=[tenant_dns.certificate] if self.is_https else None,
+            default_action=elbv2.ListenerAction.fixed_response(
+                404, content_type="text/plain", message_body="Not Found"
+            ),
+        )
+
+        # An HTTP listener already holds port 80, the redirect would clash
+        if self.is_https and not is_internal:
+            self.load_balancer.add_redirect()
+
+    def reserve_priority(self, priority: int, service_type: Enum) -> None:
+        if priority in self._priorities:
+            raise ValueError(
+                f"Listener rule priority {priority} of {service_type.value} is "
+                f"already used by {self._priorities[priority].value}"
+            )
+        self._priorities[priority] = service_type
@@ -0,0 +1,158 @@
+import fnmatch
+import hashlib
+import json
+import os
+from typing import Iterator, Optional, Sequence
+
+DEFAULT_CACHE_PATH = ".cdk.cache/asset-fingerprints.json"
+CACHE_PATH_ENVIRONMENT_VARIABLE = "CDK_ASSET_FINGERPRINT_CACHE"
+_CACHE_VERSION = 1
+_CHUNK_SIZE = 1024 * 1024
+
+
+class AssetFingerprintCache:
+    """
+    On-disk cache of asset file hashes keyed by absolute path, modification
+    time and size. A directory fingerprint combines the relative path and the
+    cached hash of every non-excluded file, so unchanged files are never read
+    again across synths. The fingerprint is meant to be used as a custom asset
+    hash, which spares the jsii kernel from fingerprinting the asset itself.
+    Asset sources are tracked per process so incremental synth can tell when
+    the assets of a target changed.
+    """
+
+    _default: Optional["AssetFingerprintCache"] = None
+    tracked: dict[str, list[str]] = {}
+
+    def __init__(self, path: str):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._is_dirty = False
+        self._files: dict[str, list] = {}
+        if os.path.exists(path):
+            try:
+                with open(path) as file:
+                    content = json.load(file)
+                if content.get("version") == _CACHE_VERSION:
+                    self._files = content.get("files", {})
+            except (OSError, ValueError):
+                self._files = {}
+
+    @classmethod
+    def default(cls) -> "AssetFingerprintCache":
+        if cls._default is None:
+            cls._default = cls(
+                os.environ.get(CACHE_PATH_ENVIRONMENT_VARIABLE, DEFAULT_CACHE_PATH)
+            )
+        return cls._default
+
+    @classmethod
+    def track(cls, directory: str, exclude: Optional[Sequence[str]] = None) -> None:
+        cls.tracked[os.path.abspath(directory)] = list(exclude or [])
+
+    @classmethod
+    def reset_tracked(cls) -> None:
+        cls.tracked = {}
+
+    def fingerprint(
+        self, directory: str, exclude: Optional[Sequence[str]] = None
+    ) -> str:
+        self.track(directory, exclude)
+        patterns = list(exclude or [])
+        digest = hashlib.sha256()
+        digest.update(json.dumps(patterns).encode())
+        for relative_path, absolute_path in self._walk(directory, patterns):
+            digest.update(relative_path.encode())
+            digest.update(b"\0")
+            digest.update(self.hash_file(absolute_path).encode())
+        self.save()
+        return digest.hexdigest()
+
+    def save(self) -> None:
+        if not self._is_dirty:
+            return
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        temporary_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temporary_path, "w") as file:
+            json.dump({"version": _CACHE_VERSION, "files": self._files}, file)
+        os.replace(temporary_path, self.path)
+        self._is_dirty = False
+
+    def hash_file(self, absolute_path: str) -> str:
+        stat = os.stat(absolute_path)
+        entry = self._files.get(absolute_path)
+        if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == (
+            stat.st_size
+        ):
+            self.hits += 1
+            return entry[2]
+
+        self.misses += 1
+        file_hash = hashlib.sha256()
+        with open(absolute_path, "rb") as file:
+            for chunk in iter(lambda: file.read(_CHUNK_SIZE), b""):
+                file_hash.update(chunk)
+        self._files[absolute_path] = [
+            stat.st_mtime_ns,
+            stat.st_size,
+            file_hash.hexdigest(),
+        ]
+        self._is_dirty = True
+        return file_hash.hexdigest()
+
+    @classmethod
+    def _walk(
+        cls, directory: str, patterns: Sequence[str]
+    ) -> Iterator[tuple[str, str]]:
+        root = os.path.abspath(directory)
+        negations = [
+            pattern[1:].strip("/") for pattern in patterns if pattern.startswith("!")
+        ]
+        for current, folders, files in os.walk(root):
+            relative_folder = os.path.relpath(current, root)
+            if relative_folder == ".":
+                relative_folder = ""
+            folders[:] = sorted(
+                folder
+                for folder in folders
+                if not cls._is_excluded(
+                    os.path.join(relative_folder, folder), patterns
+                )
+                or cls._may_include(os.path.join(relative_folder, folder), negations)
+            )
+            for file_name in sorted(files):
+                relative_path = os.path.join(relative_folder, file_name)
+                if not cls._is_excluded(relative_path, patterns):
+                    yield relative_path, os.path.join(current, file_name)
+
+    @staticmethod
+    def _may_include(relative_folder: str, negations: Sequence[str]) -> bool:
+        parts = relative_folder.split(os.sep)
+        for negation in negations:
+            negation_parts = negation.split("/")
+            if len(negation_parts) == 1 or fnmatch.fnmatch(
+                relative_folder, "/".join(negation_parts[: len(parts)])
+            ):
+                return True
+        return False
+
+    @staticmethod
+    def _is_excluded(relative_path: str, patterns: Sequence[str]) -> bool:
+        is_excluded = False
+        for pattern in patterns:
+            is_negation = pattern.startswith("!")
+            pattern = pattern[1:] if is_negation else pattern
+            pattern = pattern.strip("/")
+            candidates = [relative_path]
+            if "/" not in pattern:
+                candidates.append(os.path.basename(relative_path))
+            parts = relative_path.split(os.sep)
+            candidates.extend(
+                os.path.join(*parts[:index]) for index in range(1, len(parts))
+            )
+            if any(fnmatch.fnmatch(candidate, pattern) for candidate in candidates):
+                is_excluded = not is_negation
+        return is_excluded
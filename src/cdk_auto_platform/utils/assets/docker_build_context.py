@@ -0,0 +1,145 @@
+import json
+import os
+import re
+import shlex
+from typing import Optional, Sequence
+from cdk_auto_platform.utils.assets.asset_fingerprint_cache import (
+    AssetFingerprintCache,
+)
+
+DEFAULT_DOCKERFILE = "Dockerfile"
+DOCKER_IGNORE_FILE = ".dockerignore"
+
+_CONTEXT_INSTRUCTION = re.compile(r"^(COPY|ADD|RUN)\s+(.*)$", re.IGNORECASE)
+
+
+class DockerBuildContext:
+    """
+    Minimal Docker build context derived from the COPY/ADD sources (and the
+    RUN bind mounts) of a Dockerfile. The generated exclude list ignores the
+    whole context except those sources, so the asset only hashes and stages
+    the files the image is built from. When a source cannot be resolved at
+    synth time (build args, the whole context), or when the .dockerignore
+    re-includes files with negations, the context is not narrowed.
+    """
+
+    def __init__(self, directory: str, file: Optional[str] = None):
+        self.directory = directory
+        self.file = os.path.normpath(file or DEFAULT_DOCKERFILE)
+        self._sources: Optional[list[str]] = None
+        self._is_parsed = False
+
+    @property
+    def dockerfile_path(self) -> str:
+        return os.path.join(self.directory, self.file)
+
+    @property
+    def sources(self) -> Optional[list[str]]:
+        if not self._is_parsed:
+            self._sources = self._parse_sources()
+            self._is_parsed = True
+        return self._sources
+
+    def exclude(self, extra: Optional[Sequence[str]] = None) -> Optional[list[str]]:
+        dockerignore = self._read_dockerignore()
+        # An allowlist .dockerignore would be overridden by the narrowing
+        if self.sources is None or any(
+            pattern.startswith("!") for pattern in dockerignore
+        ):
+            exclude = list(extra) if extra is not None else None
+        else:
+            exclude = [
+                "*",
+                *[f"!{source}" for source in [*self.sources, self.file]],
+                *dockerignore,
+                *(extra or []),
+            ]
+        AssetFingerprintCache.track(self.directory, exclude)
+        return exclude
+
+    def _parse_sources(self) -> Optional[list[str]]:
+        if not os.path.isfile(self.dockerfile_path):
+            return None
+
+        sources: set[str] = set()
+        for instruction, arguments in self._read_instructions():
+            tokens = self._tokenize(arguments)
+            if tokens is None:
+                return None
+
+            for candidate in self._candidate_sources(instruction, tokens):
+                if "://" in candidate or candidate.startswith("git@"):
+                    continue
+                source = os.path.normpath(candidate.lstrip("/"))
+                if "$" in source or source == "." or source.startswith(".."):
+                    return None
+                sources.add(source)
+
+        return sorted(sources)
+
+    @staticmethod
+    def _tokenize(arguments: str) -> Optional[list[str]]:
+        if arguments.startswith("["):
+            try:
+                return json.loads(arguments)
+            except json.JSONDecodeError:
+                return None
+        try:
+            return shlex.split(arguments)
+        except ValueError:
+            return arguments.split()
+
+    @classmethod
+    def _candidate_sources(cls, instruction: str, tokens: list[str]) -> list[str]:
+        if instruction == "RUN":
+            return cls._bind_mount_sources(tokens)
+        # Heredocs and other stages don't read the build context
+        if any(token.startswith(("<<", "--from")) for token in tokens):
+            return []
+        return [token for token in tokens if not token.startswith("--")][:-1]
+
+    def _read_instructions(self) -> list[tuple[str, str]]:
+        with open(self.dockerfile_path) as file:
+            lines = file.read().splitlines()
+
+        instructions = []
+        current = ""
+        for line in lines:
+            stripped = line.strip()
+            if not current and (not stripped or stripped.startswith("#")):
+                continue
+            if stripped.endswith("\\"):
+                current += stripped[:-1] + " "
+                continue
+            current += stripped
+            match = _CONTEXT_INSTRUCTION.match(current)
+            if match:
+                instructions.append((match.group(1).upper(), match.group(2).strip()))
+            current = ""
+        return instructions
+
+    @staticmethod
+    def _bind_mount_sources(tokens: list[str]) -> list[str]:
+        sources = []
+        for token in tokens:
+            if not token.startswith("--mount="):
+                continue
+            options = dict(
+                option.split("=", 1) if "=" in option else (option, "")
+                for option in token[len("--mount="):].split(",")
+            )
+            # bind is the default type of a mount
+            if options.get("type", "bind") == "bind" and "from" not in options:
+                sources.append(options.get("source", options.get("src", ".")))
+        return sources
+
+    def _read_dockerignore(self) -> list[str]:
+        path = os.path.join(self.directory, DOCKER_IGNORE_FILE)
+        if not os.path.isfile(path):
+            return []
+        with open(path) as file:
+            return [
+                line.strip()
+                for line in file
+                if line.strip() and not line.strip().startswith("#")
+            ]
@@ -0,0 +1,348 @@
+"""
+Opt-in profiler of the construct creation of a synth.
+
+Every PugModule construction and play(), every _build_* method of the builder
+mixins and every package/stack constructor of the library is timed. Frames
+nest like the calls that create them (and therefore like the construct tree),
+constructs are labelled with their construct path and every frame gets the
+jsii round trips it made. Enable it with the environment variable or the
+context flag, both set to the output path (or to 1 for the default path):
+
+    CDK_CONSTRUCT_PROFILE=cdk.profile.json python server/aws/cdk/app.py
+    cdk synth -c cdk-auto-platform:profile=cdk.profile.json
+
+The output is a speedscope file (https://www.speedscope.app) with a wall time
+profile and a jsii call profile, plus a top-N text summary next to it.
+"""
+
+import atexit
+import functools
+import importlib
+import json
+import os
+import time
+from typing import Any, Callable, Optional
+from cdk_auto_platform.models.modules.pug_module import PugModule
+from cdk_auto_platform.utils.benchmarks.jsii_call_counter import JsiiCallCounter
+
+PROFILE_ENVIRONMENT_VARIABLE = "CDK_CONSTRUCT_PROFILE"
+PROFILE_TOP_ENVIRONMENT_VARIABLE = "CDK_CONSTRUCT_PROFILE_TOP"
+PROFILE_CONTEXT = "cdk-auto-platform:profile"
+DEFAULT_PROFILE_PATH = "cdk.profile.json"
+DEFAULT_TOP = 25
+
+_CONTEXT_ENVIRONMENT_VARIABLE = "CDK_CONTEXT_JSON"
+_CONTEXT_OVERFLOW_ENVIRONMENT_VARIABLE = "CONTEXT_OVERFLOW_LOCATION_ENV"
+_INSTRUMENTED_FOLDERS = ("build", "modules", "packages", "stacks")
+_SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+_WRAPPED_ATTRIBUTE = "__cdk_auto_platform_profiled__"
+
+
+class ProfileFrame:
+    def __init__(self, kind: str, start: float, jsii_start: int):
+        self.kind = kind
+        self.name = kind
+        self.start = start
+        self.end = start
+        self.jsii_start = jsii_start
+        self.jsii_calls = 0
+        self.children: list["ProfileFrame"] = []
+
+    @property
+    def milliseconds(self) -> float:
+        return (self.end - self.start) * 1000
+
+    @property
+    def self_milliseconds(self) -> float:
+        return self.milliseconds - sum(child.milliseconds for child in self.children)
+
+    @property
+    def self_jsii_calls(self) -> int:
+        return self.jsii_calls - sum(child.jsii_calls for child in self.children)
+
+
+class ConstructProfiler:
+    """
+    Records the frames of the instrumented calls of the current process. The
+    construct path lookups made to label frames run over jsii too, so their
+    time and round trips are taken out of the profile.
+    """
+
+    path: Optional[str] = None
+    frames: list[ProfileFrame] = []
+    _stack: list[ProfileFrame] = []
+    _origin: float = 0.0
+    _overhead: float = 0.0
+
+    @classmethod
+    def install_from_environment(cls, suffix: Optional[str] = None) -> bool:
+        if cls.is_enabled():
+            return True
+        path = os.environ.get(PROFILE_ENVIRONMENT_VARIABLE) or cls._read_context()
+        if not path or path.lower() in ("0", "false"):
+            return False
+        if path.lower() in ("1", "true"):
+            path = DEFAULT_PROFILE_PATH
+        if suffix:
+            stem, extension = os.path.splitext(path)
+            path = f"{stem}.{suffix}{extension or '.json'}"
+        cls.install(path)
+        return True
+
+    @classmethod
+    def install(cls, path: str) -> None:
+        if cls.path is None:
+            JsiiCallCounter.install()
+            cls._instrument_library()
+            cls._origin = time.perf_counter()
+            atexit.register(cls.write)
+        cls.path = path
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return cls.path is not None
+
+    @classmethod
+    def span(cls, kind: str, function: Callable[[], Any]) -> Any:
+        if not cls.is_enabled():
+            return function()
+        frame = cls._enter(kind)
+        try:
+            return function()
+        finally:
+            cls._exit(frame)
+
+    @classmethod
+    def write(cls) -> None:
+        if cls.path is None or not cls.frames:
+            return
+        folder = os.path.dirname(cls.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(cls.path, "w") as file:
+            json.dump(cls.to_speedscope(), file)
+
+        summary = cls.summary(
+            int(os.environ.get(PROFILE_TOP_ENVIRONMENT_VARIABLE, DEFAULT_TOP))
+        )
+        with open(f"{os.path.splitext(cls.path)[0]}.txt", "w") as file:
+            file.write(summary + "\n")
+        print(summary)
+        print(f"\033[1;36m✨ Construct profile: \033[1;33m{cls.path}\033[0m")
+
+    @classmethod
+    def to_speedscope(cls) -> dict[str, Any]:
+        frame_names: list[str] = []
+        frame_indexes: dict[str, int] = {}
+        events: list[dict[str, Any]] = []
+        samples: list[list[int]] = []
+        weights: list[int] = []
+
+        def frame_index(name: str) -> int:
+            if name not in frame_indexes:
+                frame_indexes[name] = len(frame_names)
+                frame_names.append(name)
+            return frame_indexes[name]
+
+        def visit(frame: ProfileFrame, stack: list[int]) -> None:
+            index = frame_index(frame.name)
+            events.append({"type": "O", "frame": index, "at": cls._at(frame.start)})
+            for child in frame.children:
+                visit(child, [*stack, index])
+            events.append({"type": "C", "frame": index, "at": cls._at(frame.end)})
+            if frame.self_jsii_calls > 0:
+                samples.append([*stack, index])
+                weights.append(frame.self_jsii_calls)
+
+        for frame in cls.frames:
+            visit(frame, [])
+
+        return {
+            "$schema": _SPEEDSCOPE_SCHEMA,
+            "name": os.path.basename(cls.path or DEFAULT_PROFILE_PATH),
+            "exporter": "cdk_auto_platform",
+            "activeProfileIndex": 0,
+            "shared": {"frames": [{"name": name} for name in frame_names]},
+            "profiles": [
+                {
+                    "type": "evented",
+                    "name": "Wall time",
+                    "unit": "milliseconds",
+                    "startValue": cls._at(cls.frames[0].start),
+                    "endValue": cls._at(cls.frames[-1].end),
+                    "events": events,
+                },
+                {
+                    "type": "sampled",
+                    "name": "jsii calls",
+                    "unit": "none",
+                    "startValue": 0,
+                    "endValue": sum(weights),
+                    "samples": samples,
+                    "weights": weights,
+                },
+            ],
+        }
+
+    @classmethod
+    def summary(cls, top: int = DEFAULT_TOP) -> str:
+        totals: dict[str, list[float]] = {}
+
+        def visit(frame: ProfileFrame, active: set[str]) -> None:
+            total = totals.setdefault(frame.kind, [0, 0.0, 0.0, 0, 0])
+            total[0] += 1
+            total[2] += frame.self_milliseconds
+            total[4] += frame.self_jsii_calls
+            if frame.kind not in active:
+                total[1] += frame.milliseconds
+                total[3] += frame.jsii_calls
+            for child in frame.children:
+                visit(child, active | {frame.kind})
+
+        for frame in cls.frames:
+            visit(frame, set())
+
+        ranked = sorted(totals.items(), key=lambda item: item[1][2], reverse=True)
+        lines = [
+            f"{'frame':<64}  {'calls':>6}  {'total ms':>10}  {'self ms':>10}  "
+            f"{'jsii':>7}  {'self jsii':>9}"
+        ]
+        for kind, (calls, total_ms, self_ms, jsii, self_jsii) in ranked[:top]:
+            lines.append(
+                f"{kind[:64]:<64}  {calls:>6}  {total_ms:>10.1f}  {self_ms:>10.1f}  "
+                f"{jsii:>7}  {self_jsii:>9}"
+            )
+        return "\n".join(lines)
+
+    @classmethod
+    def _enter(cls, kind: str) -> ProfileFrame:
+        frame = ProfileFrame(kind, cls._now(), JsiiCallCounter.calls)
+        (cls._stack[-1].children if cls._stack else cls.frames).append(frame)
+        cls._stack.append(frame)
+        return frame
+
+    @classmethod
+    def _exit(cls, frame: ProfileFrame, construct: Any = None) -> None:
+        frame.end = cls._now()
+        frame.jsii_calls = JsiiCallCounter.calls - frame.jsii_start
+        if construct is not None:
+            frame.name = f"{frame.kind} {cls._get_construct_path(construct)}"
+        cls._stack.pop()
+
+    @classmethod
+    def _get_construct_path(cls, construct: Any) -> str:
+        start = time.perf_counter()
+        calls = JsiiCallCounter.calls
+        try:
+            path = construct.node.path
+        except Exception:
+            path = "?"
+        JsiiCallCounter.calls = calls
+        cls._overhead += time.perf_counter() - start
+        return path
+
+    @classmethod
+    def _now(cls) -> float:
+        return time.perf_counter() - cls._overhead
+
+    @classmethod
+    def _at(cls, timestamp: float) -> float:
+        return round((timestamp - cls._origin) * 1000, 3)
+
+    @classmethod
+    def _read_context(cls) -> Optional[str]:
+        context: dict[str, Any] = {}
+        try:
+            context.update(json.loads(os.environ.get(_CONTEXT_ENVIRONMENT_VARIABLE)))
+        except (TypeError, ValueError):
+            pass
+        overflow_path = os.environ.get(_CONTEXT_OVERFLOW_ENVIRONMENT_VARIABLE)
+        if overflow_path and os.path.isfile(overflow_path):
+            with open(overflow_path) as file:
+                context.update(json.load(file))
+        value = context.get(PROFILE_CONTEXT)
+        return None if value is None else str(value)
+
+    @classmethod
+    def _instrument_library(cls) -> None:
+        from constructs import Construct
+
+        package_folder = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+        for folder in _INSTRUMENTED_FOLDERS:
+            for current, _, files in os.walk(os.path.join(package_folder, folder)):
+                for file_name in sorted(files):
+                    if not file_name.endswith(".py"):
+                        continue
+                    module_path = os.path.relpath(
+                        os.path.join(current, file_name[:-3]), package_folder
+                    )
+                    module = importlib.import_module(
+                        "cdk_auto_platform." + module_path.replace(os.sep, ".")
+                    )
+                    for value in list(vars(module).values()):
+                        if (
+                            isinstance(value, type)
+                            and value.__module__ == module.__name__
+                        ):
+                            cls._instrument_class(value, Construct)
+
+        def instrument_subclass(subclass: type, **kwargs) -> None:
+            super(PugModule, subclass).__init_subclass__(**kwargs)
+            cls._instrument_class(subclass, Construct)
+
+        cls._wrap(PugModule, "play", lambda args: f"{type(args[0]).__qualname__}.play")
+        PugModule.__init_subclass__ = classmethod(instrument_subclass)  # type: ignore
+
+    @classmethod
+    def _instrument_class(cls, target: type, construct_type: type) -> None:
+        for name in list(vars(target)):
+            if name.startswith("_build_") or (
+                name == "play" and issubclass(target, PugModule)
+            ):
+                cls._wrap(target, name)
+        if "__init__" in vars(target) and issubclass(
+            target, (PugModule, construct_type)
+        ):
+            cls._wrap(
+                target,
+                "__init__",
+                construct_type=(
+                    construct_type if issubclass(target, construct_type) else None
+                ),
+            )
+
+    @classmethod
+    def _wrap(
+        cls,
+        target: type,
+        name: str,
+        get_kind: Optional[Callable[[tuple], str]] = None,
+        construct_type: Optional[type] = None,
+    ) -> None:
+        attribute = vars(target)[name]
+        descriptor = (
+            type(attribute)
+            if isinstance(attribute, (staticmethod, classmethod))
+            else None
+        )
+        function = attribute.__func__ if descriptor else attribute
+        if not callable(function) or getattr(function, _WRAPPED_ATTRIBUTE, False):
+            return
+
+        @functools.wraps(function)
+        def profiled(*args, **kwargs):
+            frame = cls._enter(
+                get_kind(args) if get_kind else function.__qualname__
+            )
+            try:
+                return function(*args, **kwargs)
+            finally:
+                cls._exit(
+                    frame,
+                    args[0]
+                    if construct_type and isinstance(args[0], construct_type)
+                    else None,
+                )
+
+        setattr(profiled, _WRAPPED_ATTRIBUTE, True)
+        setattr(target, name, descriptor(profiled) if descriptor else profiled)
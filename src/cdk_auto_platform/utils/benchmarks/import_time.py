@@ -0,0 +1,88 @@
+"""
+Cold import cost of the public symbols exported by cdk_auto_platform.
+
+Every symbol is resolved in a fresh interpreter, so each measurement includes
+all the modules it drags in and reports whether it loaded aws_cdk (and with it
+the jsii node runtime).
+
+    python -m cdk_auto_platform.utils.benchmarks.import_time
+    python -m cdk_auto_platform.utils.benchmarks.import_time TenantBase --json out.json
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from typing import Optional, Sequence
+
+import cdk_auto_platform
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import cdk_auto_platform
+getattr(cdk_auto_platform, {name!r})
+print(json.dumps({{
+    "seconds": time.perf_counter() - start,
+    "loads_jsii": "aws_cdk" in sys.modules,
+    "modules": len(sys.modules),
+}}))
+"""
+
+
+class ImportTimeBenchmark:
+    def __init__(self, symbols: Optional[Sequence[str]] = None):
+        self.symbols = list(symbols or cdk_auto_platform._EXPORTS)
+        unknown = [
+            name for name in self.symbols if name not in cdk_auto_platform._EXPORTS
+        ]
+        if unknown:
+            raise ValueError(f"Unknown public symbols: {', '.join(unknown)}")
+
+    def run(self) -> dict[str, dict]:
+        return {name: self.measure(name) for name in self.symbols}
+
+    @staticmethod
+    def measure(name: str) -> dict:
+        completed = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(name=name)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return json.loads(completed.stdout.strip().splitlines()[-1])
+
+    @staticmethod
+    def report(results: dict[str, dict]) -> str:
+        rows = sorted(
+            results.items(), key=lambda item: item[1]["seconds"], reverse=True
+        )
+        width = max(len(name) for name in results)
+        lines = [f"{'symbol':<{width}}  {'seconds':>8}  {'jsii':>5}  {'modules':>7}"]
+        for name, result in rows:
+            lines.append(
+                f"{name:<{width}}  {result['seconds']:>8.3f}  "
+                f"{'yes' if result['loads_jsii'] else 'no':>5}  {result['modules']:>7}"
+            )
+        return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("symbols", nargs="*", help="Symbols to measure (default: all)")
+    parser.add_argument("--json", dest="json_path", help="Write the results as JSON")
+    args = parser.parse_args(argv)
+
+    benchmark = ImportTimeBenchmark(args.symbols)
+    results = benchmark.run()
+    print(benchmark.report(results))
+
+    if args.json_path:
+        with open(args.json_path, "w") as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
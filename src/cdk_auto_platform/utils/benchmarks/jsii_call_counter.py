@@ -0,0 +1,55 @@
+import os
+from typing import Optional
+
+
+class JsiiCallCounter:
+    """
+    Counts the round trips between Python and the jsii node kernel by wrapping
+    the request sender of the kernel process. Installing it is idempotent and
+    does not start the kernel.
+    """
+
+    calls: int = 0
+    _installed: bool = False
+
+    @classmethod
+    def install(cls) -> None:
+        if cls._installed:
+            return
+
+        from jsii._kernel.providers.process import _NodeProcess
+
+        send = _NodeProcess.send
+
+        def counted_send(process, request, response_type):
+            cls.calls += 1
+            return send(process, request, response_type)
+
+        _NodeProcess.send = counted_send
+        cls._installed = True
+
+    @classmethod
+    def reset(cls) -> None:
+        cls.calls = 0
+
+    @staticmethod
+    def kernel_pid() -> Optional[int]:
+        try:
+            import jsii
+
+            return jsii.kernel.provider._process._process.pid
+        except (AttributeError, ImportError):
+            return None
+
+    @classmethod
+    def kernel_peak_rss_kib(cls) -> int:
+        pid = cls.kernel_pid()
+        status_path = f"/proc/{pid}/status"
+        if pid is None or not os.path.exists(status_path):
+            return 0
+
+        with open(status_path) as file:
+            for line in file:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+        return 0
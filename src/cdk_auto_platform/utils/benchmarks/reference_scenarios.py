@@ -0,0 +1,116 @@
+import os
+from enum import Enum
+from typing import Any
+from cdk_auto_platform.models.tenants.cross_platform import (
+    CrossPlatform,
+    MsTeamsSecrets,
+)
+
+
+class ReferenceSecrets(Enum):
+    API_KEY = "API_KEY"
+
+
+class SynthScenario:
+    def __init__(
+        self, name: str, services: int, scheduled_tasks: int, databases: int
+    ):
+        if services < 1 or databases < 1 or scheduled_tasks < 0:
+            raise ValueError(
+                f"Scenario {name} needs at least one service and one database"
+            )
+        self.name = name
+        self.services = services
+        self.scheduled_tasks = scheduled_tasks
+        self.databases = databases
+
+        self.service_types = Enum(
+            "ReferenceServices",
+            {f"SERVICE_{index}": f"service-{index}" for index in range(services)},
+        )
+        self.task_types = Enum(
+            "ReferenceTasks",
+            {f"TASK_{index}": f"task-{index}" for index in range(scheduled_tasks)},
+        )
+        self.database_instances = Enum(
+            "ReferenceDatabases",
+            {f"DATABASE_{index}": f"db-{index}" for index in range(databases)},
+        )
+        self.persistent_databases = Enum(
+            "ReferencePersistentDatabases",
+            {f"PRODUCT_{index}": f"product-{index}" for index in range(databases)},
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "services": self.services,
+            "scheduled_tasks": self.scheduled_tasks,
+            "databases": self.databases,
+        }
+
+    @classmethod
+    def from_dict(cls, values: dict[str, Any]) -> "SynthScenario":
+        return cls(
+            values["name"],
+            values["services"],
+            values["scheduled_tasks"],
+            values["databases"],
+        )
+
+
+DEFAULT_SCENARIOS = [
+    SynthScenario("small", services=2, scheduled_tasks=1, databases=1),
+    SynthScenario("medium", services=6, scheduled_tasks=2, databases=2),
+    SynthScenario("large", services=9, scheduled_tasks=3, databases=3),
+]
+
+
+class ReferenceWorkspace:
+    """
+    Writes the files a reference tenant reads during synth (deployment .env,
+    service secret files and the lambda sources of the monitoring and
+    database factory packages) under a throwaway repository root.
+    """
+
+    _LAMBDA_SOURCES = {
+        f"src/services/apps/{CrossPlatform.MS_TEAMS.value}-notifier/index.py": (
+            "def handler(event, context):\n    return event\n"
+        ),
+        "src/services/apps/ms-sql-database-factory/handler.py": (
+            "def handler(event, context):\n    return event\n"
+        ),
+        "src/services/apps/ms-sql-database-factory/Dockerfile": (
+            "FROM public.ecr.aws/lambda/python:3.12\n"
+            "COPY src/services/apps/ms-sql-database-factory ${LAMBDA_TASK_ROOT}\n"
+            'CMD ["handler.handler"]\n'
+        ),
+    }
+
+    @classmethod
+    def create(cls, root: str, scenario: SynthScenario, environment: str) -> None:
+        cls._write(root, "server/aws/cdk/.env", "IS_FIRST_DEPLOYMENT=false\n")
+
+        config_folder = f"server/aws/cdk/.config/{environment}"
+        secret_values = "".join(
+            f"{secret.value}=benchmark\n" for secret in ReferenceSecrets
+        )
+        for service_type in [*scenario.service_types, *scenario.task_types]:
+            cls._write(root, f"{config_folder}/{service_type.value}.env", secret_values)
+        cls._write(
+            root,
+            f"{config_folder}/{CrossPlatform.MS_TEAMS.value}.env",
+            "".join(
+                f"{secret.value}=https://example.com\n" for secret in MsTeamsSecrets
+            ),
+        )
+
+        for relative_path, content in cls._LAMBDA_SOURCES.items():
+            cls._write(root, relative_path, content)
+
+    @staticmethod
+    def _write(root: str, relative_path: str, content: str) -> None:
+        path = os.path.join(root, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as file:
+            file.write(content)
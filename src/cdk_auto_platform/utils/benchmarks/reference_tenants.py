@@ -0,0 +1,320 @@
+# region: primitives
+from enum import Enum
+from typing import Any
+from constructs import Construct
+
+# endregion
+
+# region: aws-cdk
+from aws_cdk import Environment, Stack
+
+# endregion
+
+# region: iden-q-auto-platform
+from cdk_auto_platform.build.drawable_services_builder import (
+    DrawableServicesBuilder,
+)
+from cdk_auto_platform.build.firewall_rules_builder import FirewallRulesBuilder
+from cdk_auto_platform.build.nested_stack_sharding_builder import (
+    NestedStackShardingBuilder,
+)
+from cdk_auto_platform.build.scaling_rules_builder import ScalingRulesBuilder
+from cdk_auto_platform.build.service_task_definition_builder import (
+    EcsComputeArchitecture,
+)
+from cdk_auto_platform.build.trackable_services_builder import (
+    TrackableServicesBuilder,
+)
+from cdk_auto_platform.models.blueprints.database_blueprint import DatabaseBlueprint
+from cdk_auto_platform.models.blueprints.ecs_fargate_blueprint import (
+    EcsFargateBlueprint,
+)
+from cdk_auto_platform.models.compute.compute_time_configuration import (
+    ComputeTimeConfiguration,
+)
+from cdk_auto_platform.models.compute.fargate_task_compute import FargateTaskCompute
+from cdk_auto_platform.models.compute.operating_system import OperatingSystem
+from cdk_auto_platform.models.compute.scaling_rule import ScalingRule
+from cdk_auto_platform.models.containers.ecs_fargate_types import EcsFargateTypes
+from cdk_auto_platform.models.containers.registry_types import RegistryTypes
+from cdk_auto_platform.models.database.database_matrix import DatabaseMatrix
+from cdk_auto_platform.models.database.database_privileges import DatabasePrivileges
+from cdk_auto_platform.models.database.instance_family import InstanceFamily
+from cdk_auto_platform.models.database.instance_size import InstanceSize
+from cdk_auto_platform.models.database.rds_capacity import RdsCapacity
+from cdk_auto_platform.models.database.rds_performance import RdsPerformance
+from cdk_auto_platform.models.database.service_user_secret import ServiceUserSecret
+from cdk_auto_platform.models.environments.app_environment import AppEnvironment
+from cdk_auto_platform.models.tenants.cross_platform import (
+    CrossPlatform,
+    MsTeamsSecrets,
+)
+from cdk_auto_platform.models.tenants.infrastructure_types import InfrastructureTypes
+from cdk_auto_platform.models.tenants.tenant_base import TenantBase
+from cdk_auto_platform.models.vpc.ip_ranges_types import IpPrivateRanges
+from cdk_auto_platform.models.vpc.prefix_list_cidr import PrefixListCidr
+from cdk_auto_platform.packages.application_dashboard.infrastructure import (
+    ApplicationDashboard,
+)
+from cdk_auto_platform.packages.application_monitoring.infrastructure import (
+    ApplicationMonitoring,
+)
+from cdk_auto_platform.packages.databases.infrastructure import Databases
+from cdk_auto_platform.packages.ecs_cluster.infrastructure import EcsCluster
+from cdk_auto_platform.packages.ecs_scheduled_task.infrastructure import (
+    EcsScheduledTask,
+)
+from cdk_auto_platform.packages.ecs_service.infrastructure import EcsService
+from cdk_auto_platform.packages.factory_databases.infrastructure import (
+    FactoryDatabases,
+)
+from cdk_auto_platform.packages.federated_dns.infrastructure import FederatedDns
+from cdk_auto_platform.packages.networking.infrastructure import Networking
+from cdk_auto_platform.packages.power_bi_bastion.infrastructure import PowerBiBastion
+from cdk_auto_platform.packages.secrets.secrets_store import SecretsStore
+from cdk_auto_platform.utils.benchmarks.reference_scenarios import (
+    ReferenceSecrets,
+    SynthScenario,
+)
+from cdk_auto_platform.utils.configs import SqlServerDatabaseConfig
+
+# endregion
+
+REFERENCE_ACCOUNT = "111111111111"
+REFERENCE_REGION = "eu-west-3"
+
+
+class ReferenceProducts(Enum):
+    BENCHMARK = "bench"
+
+
+class ReferenceTenant(TenantBase):
+    def __init__(self, scenario: SynthScenario):
+        super().__init__(
+            company="reference",
+            product=ReferenceProducts.BENCHMARK,
+            aws_account=REFERENCE_ACCOUNT,
+            aws_region=REFERENCE_REGION,
+            principal_dns="example.com",
+            certificate_arn=(
+                f"arn:aws:acm:{REFERENCE_REGION}:{REFERENCE_ACCOUNT}:certificate/x"
+            ),
+            prefix_list_cidrs=[
+                PrefixListCidr(cidr="10.255.255.0/24", description="benchmark")
+            ],
+            ip_private_ranges=IpPrivateRanges.LARGE_COMPANY,
+            infrastructure_type=InfrastructureTypes.ECS_FARGATE_RDS,
+        )
+        self.scenario = scenario
+        self._builder_blueprints(
+            self._ecs_fargate_blueprints_for(scenario),
+            self._rds_blueprints_for(scenario),
+        )
+
+    @staticmethod
+    def _ecs_fargate_blueprints_for(
+        scenario: SynthScenario,
+    ) -> dict[Enum, EcsFargateBlueprint]:
+        time_configuration = ComputeTimeConfiguration(
+            health_check_interval_seconds=30, health_check_timeout_seconds=10
+        )
+        blueprints: dict[Enum, EcsFargateBlueprint] = {
+            service_type: EcsFargateBlueprint(
+                EcsFargateTypes.SERVICE,
+                FargateTaskCompute(512, 1024, OperatingSystem.LINUX),
+                ["/bin/sh", "-c"],
+                ["python", "app.py"],
+                time_configuration,
+                scaling_rule=ScalingRule(min_capacity=1, max_capacity=4),
+            )
+            for service_type in scenario.service_types
+        }
+        for task_type in scenario.task_types:
+            blueprints[task_type] = EcsFargateBlueprint(
+                EcsFargateTypes.SCHEDULED_TASK,
+                FargateTaskCompute(512, 1024, OperatingSystem.LINUX),
+                ["/bin/sh", "-c"],
+                ["python", "job.py"],
+                time_configuration,
+                desired_task_count=1,
+                schedule="cron(0 1 * * ? *)",
+            )
+        return blueprints
+
+    @staticmethod
+    def _rds_blueprints_for(
+        scenario: SynthScenario,
+    ) -> dict[Enum, DatabaseBlueprint]:
+        return {
+            database_instance: DatabaseBlueprint(
+                RdsCapacity(),
+                RdsPerformance(
+                    SqlServerDatabaseConfig.get_sql_web(),
+                    InstanceFamily.T3,
+                    InstanceSize.SMALL,
+                ),
+            )
+            for database_instance in scenario.database_instances
+        }
+
+
+class ReferenceTenantStack(
+    Stack,
+    FirewallRulesBuilder,
+    ScalingRulesBuilder,
+    TrackableServicesBuilder,
+    DrawableServicesBuilder,
+    NestedStackShardingBuilder,
+):
+    def __init__(self, scope: Construct, tenant: ReferenceTenant, **kwargs: Any):
+        scenario = tenant.scenario
+        stack_id = (
+            f"{tenant.company}-{tenant.product.value}-{tenant.environment.value}"
+        )
+        super().__init__(
+            scope,
+            stack_id,
+            env=Environment(account=tenant.AWS_ACCOUNT, region=tenant.AWS_REGION),
+            **kwargs,
+        )
+
+        SecretsStore.validate(
+            tenant.environment,
+            {
+                **{
+                    service_type: ReferenceSecrets
+                    for service_type in [*scenario.service_types, *scenario.task_types]
+                },
+                CrossPlatform.MS_TEAMS: MsTeamsSecrets,
+            },
+        )
+
+        networking = Networking(self, tenant, 2)
+        tenant_dns = FederatedDns(self, tenant, networking.tenant_vpc)
+        cluster = EcsCluster(self, tenant, networking.tenant_vpc)
+
+        database_instances = list(scenario.database_instances)
+        is_unique_database = len(database_instances) == 1
+        databases = Databases(
+            self,
+            tenant,
+            networking.tenant_vpc,
+            database_instances,
+            tenant_dns,
+            is_unique=is_unique_database,
+        )
+        self._build_sharded(
+            "factory-databases",
+            lambda scope: FactoryDatabases(
+                scope,
+                tenant,
+                networking.tenant_vpc,
+                database_instances,
+                self._database_matrix_for(scenario),
+                databases,
+                is_unique=is_unique_database,
+            ),
+        )
+
+        services = {
+            service_type: self._build_sharded(
+                f"{service_type.value}-service",
+                lambda scope, index=index, service_type=service_type: EcsService(
+                    scope,
+                    tenant,
+                    cluster.tenant_ecs_cluster,
+                    service_type,
+                    RegistryTypes.ECR,
+                    ReferenceSecrets,
+                    EcsComputeArchitecture.ARM64,
+                    tenant_dns,
+                    is_unique=index == 0,
+                    is_internal=index % 2 == 1,
+                ),
+            ).service
+            for index, service_type in enumerate(scenario.service_types)
+        }
+        scheduled_tasks = {
+            task_type: EcsScheduledTask(
+                self,
+                tenant,
+                cluster.tenant_ecs_cluster,
+                task_type,
+                RegistryTypes.ECR,
+                ReferenceSecrets,
+                EcsComputeArchitecture.ARM64,
+            ).scheduled_task
+            for task_type in scenario.task_types
+        }
+        bastion = PowerBiBastion(self, tenant, networking.tenant_vpc)
+        # The bastion only exists in production
+        bastion_security_group = (
+            bastion.bastion_security_group
+            if tenant.environment == AppEnvironment.PROD
+            else None
+        )
+
+        self._build_firewall_rules(
+            tenant,
+            services,
+            databases.db_instance_wrappers,
+            networking.prefix_list,
+            scheduled_tasks,
+            bastion_security_group,
+        )
+        self._build_scaling_rules(tenant, services)
+        self._build_trackable_services(
+            tenant, services, databases.db_instance_wrappers
+        )
+        monitoring = self._build_sharded(
+            "monitoring",
+            lambda scope: ApplicationMonitoring(
+                scope, tenant, self.trackable_services
+            ),
+            # The reference tenant is never deployed, its named alarms and
+            # dashboard have nothing to migrate
+            is_movable=True,
+        )
+        self._build_drawable_services(
+            services, {}, databases.db_instance_wrappers, tenant
+        )
+        self._build_sharded(
+            "dashboard",
+            lambda scope: ApplicationDashboard(
+                scope,
+                tenant,
+                database_instances,
+                self.drawable_services,
+                monitoring.trackable_wit_alarm_services,
+                database_instance_is_unique=is_unique_database,
+            ),
+            is_movable=True,
+        )
+
+    @staticmethod
+    def _database_matrix_for(scenario: SynthScenario):
+        services = list(scenario.service_types)
+        persistent_databases = list(scenario.persistent_databases)
+        matrix = DatabaseMatrix().set_matrix_seed(
+            {
+                database_instance: [persistent_databases[index]]
+                for index, database_instance in enumerate(scenario.database_instances)
+            }
+        )
+        for index, persistent_database in enumerate(persistent_databases):
+            matrix.add_vector_persistent_service(
+                {
+                    persistent_database: {
+                        services[index % len(services)]: ServiceUserSecret(
+                            secret_arn=(
+                                f"arn:aws:secretsmanager:{REFERENCE_REGION}:"
+                                f"{REFERENCE_ACCOUNT}:secret:"
+                                f"{persistent_database.value}"
+                            ),
+                            privilege=DatabasePrivileges.READ_WRITE,
+                            password_is_recreable=False,
+                        )
+                    }
+                }
+            )
+        return matrix.build()
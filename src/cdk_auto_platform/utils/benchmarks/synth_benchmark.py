@@ -0,0 +1,245 @@
+"""
+Synthesis benchmark over programmatically generated reference tenants.
+
+Each scenario is synthesized in a fresh interpreter inside its own throwaway
+workspace and reports wall time, peak RSS (Python plus the jsii kernel), jsii
+round trips, resource count and template bytes. Results are compared with a
+baseline file and any metric above its tolerance fails the run.
+
+    python -m cdk_auto_platform.utils.benchmarks.synth_benchmark
+    python -m cdk_auto_platform.utils.benchmarks.synth_benchmark --update-baseline
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Optional, Sequence
+from cdk_auto_platform.utils.benchmarks.reference_scenarios import (
+    DEFAULT_SCENARIOS,
+    ReferenceWorkspace,
+    SynthScenario,
+)
+
+DEFAULT_BASELINE_PATH = "benchmarks/synth-baselines.json"
+DEFAULT_TOLERANCES = {
+    "wall_seconds": 0.5,
+    "peak_rss_mib": 0.25,
+    "jsii_calls": 0.05,
+    "resources": 0.0,
+    "template_bytes": 0.05,
+}
+_BENCHMARK_ENVIRONMENT = "prod"
+_WORKER_MODULE = "cdk_auto_platform.utils.benchmarks.synth_benchmark"
+
+
+def _synth_scenario(scenario: SynthScenario, outdir: str) -> dict[str, Any]:
+    from cdk_auto_platform.utils.benchmarks.jsii_call_counter import (
+        JsiiCallCounter,
+    )
+
+    JsiiCallCounter.install()
+    start = time.perf_counter()
+
+    from aws_cdk import App
+    from cdk_auto_platform.utils.benchmarks.reference_tenants import (
+        ReferenceTenant,
+        ReferenceTenantStack,
+    )
+
+    app = App(outdir=outdir)
+    tenant = getattr(ReferenceTenant(scenario), _BENCHMARK_ENVIRONMENT)()
+    ReferenceTenantStack(app, tenant)
+    app.synth()
+
+    wall_seconds = time.perf_counter() - start
+    jsii_calls = JsiiCallCounter.calls
+    python_peak_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    resources = 0
+    template_bytes = 0
+    for file_name in os.listdir(outdir):
+        if file_name.endswith(".template.json"):
+            template_path = os.path.join(outdir, file_name)
+            template_bytes += os.path.getsize(template_path)
+            with open(template_path) as file:
+                resources += len(json.load(file).get("Resources", {}))
+
+    return {
+        "wall_seconds": round(wall_seconds, 3),
+        "peak_rss_mib": round(
+            (python_peak_kib + JsiiCallCounter.kernel_peak_rss_kib()) / 1024, 1
+        ),
+        "jsii_calls": jsii_calls,
+        "resources": resources,
+        "template_bytes": template_bytes,
+    }
+
+
+class SynthBaseline:
+    def __init__(self, path: str):
+        self.path = path
+        self.tolerances = dict(DEFAULT_TOLERANCES)
+        self.scenarios: dict[str, dict[str, Any]] = {}
+        if os.path.exists(path):
+            with open(path) as file:
+                content = json.load(file)
+            self.tolerances.update(content.get("tolerances", {}))
+            self.scenarios = content.get("scenarios", {})
+
+    def regressions(self, name: str, metrics: dict[str, Any]) -> list[str]:
+        baseline = self.scenarios.get(name)
+        if baseline is None:
+            return []
+
+        regressions = []
+        for metric, tolerance in self.tolerances.items():
+            if metric not in baseline or metric not in metrics:
+                continue
+            limit = baseline[metric] * (1 + tolerance)
+            if metrics[metric] > limit:
+                regressions.append(
+                    f"{name}.{metric}: {metrics[metric]} > {baseline[metric]} "
+                    f"(+{tolerance:.0%} allowed)"
+                )
+        return regressions
+
+    def update(self, results: dict[str, dict[str, Any]]) -> None:
+        self.scenarios.update(results)
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(self.path, "w") as file:
+            json.dump(
+                {"tolerances": self.tolerances, "scenarios": self.scenarios},
+                file,
+                indent=2,
+                sort_keys=True,
+            )
+            file.write("\n")
+
+
+class SynthBenchmark:
+    def __init__(self, scenarios: Optional[Sequence[SynthScenario]] = None):
+        self.scenarios = list(scenarios or DEFAULT_SCENARIOS)
+
+    def run(self) -> dict[str, dict[str, Any]]:
+        return {scenario.name: self.measure(scenario) for scenario in self.scenarios}
+
+    @staticmethod
+    def measure(scenario: SynthScenario) -> dict[str, Any]:
+        package_root = os.path.dirname(
+            os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+        )
+        environment = dict(os.environ)
+        environment["PYTHONPATH"] = os.pathsep.join(
+            path for path in [package_root, environment.get("PYTHONPATH")] if path
+        )
+        environment.pop("CDK_OUTDIR", None)
+
+        with tempfile.TemporaryDirectory(prefix="cdk-auto-platform-bench-") as root:
+            workspace = os.path.join(root, "workspace")
+            outdir = os.path.join(root, "cdk.out")
+            ReferenceWorkspace.create(workspace, scenario, _BENCHMARK_ENVIRONMENT)
+            completed = subprocess.run(
+                [
+                    sys.executable,
+                    "-m",
+                    _WORKER_MODULE,
+                    "--worker",
+                    json.dumps(scenario.to_dict()),
+                    "--outdir",
+                    outdir,
+                ],
+                cwd=workspace,
+                env=environment,
+                capture_output=True,
+                text=True,
+            )
+        if completed.returncode != 0:
+            raise RuntimeError(
+                f"Scenario {scenario.name} failed to synthesize:\n{completed.stderr}"
+            )
+        return json.loads(completed.stdout.strip().splitlines()[-1])
+
+    @staticmethod
+    def report(
+        results: dict[str, dict[str, Any]], baseline: SynthBaseline
+    ) -> str:
+        lines = [
+            f"{'scenario':<10}  {'metric':<15}  {'baseline':>12}  "
+            f"{'current':>12}  {'delta':>8}"
+        ]
+        for name, metrics in results.items():
+            previous = baseline.scenarios.get(name, {})
+            for metric, value in metrics.items():
+                reference = previous.get(metric)
+                delta = (
+                    f"{(value - reference) / reference:+.1%}" if reference else "-"
+                )
+                lines.append(
+                    f"{name:<10}  {metric:<15}  {str(reference or '-'):>12}  "
+                    f"{value:>12}  {delta:>8}"
+                )
+        return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "scenarios",
+        nargs="*",
+        help="Scenarios to run (default: all reference scenarios)",
+    )
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_PATH)
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Store the results as the new baseline instead of comparing",
+    )
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    parser.add_argument("--outdir", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        scenario = SynthScenario.from_dict(json.loads(args.worker))
+        print(json.dumps(_synth_scenario(scenario, args.outdir)))
+        return 0
+
+    return run_benchmark(args.scenarios, args.baseline, args.update_baseline)
+
+
+def run_benchmark(
+    scenario_names: Sequence[str], baseline_path: str, update_baseline: bool
+) -> int:
+    known = {scenario.name: scenario for scenario in DEFAULT_SCENARIOS}
+    unknown = [name for name in scenario_names if name not in known]
+    if unknown:
+        raise ValueError(f"Unknown benchmark scenarios: {', '.join(unknown)}")
+
+    benchmark = SynthBenchmark([known[name] for name in scenario_names])
+    baseline = SynthBaseline(baseline_path)
+    results = benchmark.run()
+    print(benchmark.report(results, baseline))
+
+    if update_baseline:
+        baseline.update(results)
+        print(f"\033[1;36m✨ Baseline updated: \033[1;33m{baseline_path}\033[0m")
+        return 0
+
+    regressions = [
+        regression
+        for name, metrics in results.items()
+        for regression in baseline.regressions(name, metrics)
+    ]
+    for regression in regressions:
+        print(f"\033[1;31m❌ Regression: {regression}\033[0m")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
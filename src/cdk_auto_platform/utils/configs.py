@@ -1,10 +1,59 @@
 import os
-import aws_cdk.aws_rds as rds
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Mapping, Optional
 from cdk_auto_platform.utils.validators.environment_validator import (
     EnvironmentValidator,
-    load_dotenv,
 )
 
+if TYPE_CHECKING:
+    import aws_cdk.aws_rds as rds
+
+
+class ConfigSnapshot:
+    """
+    Process-wide snapshot of the configuration files read during synthesis.
+    Each path is validated and parsed once, kept as an immutable mapping and
+    reloaded only when its modification time changes. The parsed values are
+    never written into os.environ.
+    """
+
+    _entries: dict[str, tuple[int, Mapping[str, str]]] = {}
+    hits: int = 0
+    misses: int = 0
+
+    @classmethod
+    def load(cls, absolute_path: str) -> Mapping[str, str]:
+        modification_time = cls._get_modification_time(absolute_path)
+        entry = cls._entries.get(absolute_path)
+
+        if entry is not None and entry[0] == modification_time:
+            cls.hits += 1
+            return entry[1]
+
+        cls.misses += 1
+        values = MappingProxyType(EnvironmentValidator.parse(absolute_path))
+        if modification_time is not None:
+            cls._entries[absolute_path] = (modification_time, values)
+
+        return values
+
+    @classmethod
+    def stats(cls) -> dict[str, int]:
+        return {"hits": cls.hits, "misses": cls.misses, "entries": len(cls._entries)}
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._entries = {}
+        cls.hits = 0
+        cls.misses = 0
+
+    @staticmethod
+    def _get_modification_time(absolute_path: str) -> Optional[int]:
+        try:
+            return os.stat(absolute_path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
 
 class PathConfig:
     _REPO_ROOT = os.getcwd()
@@ -18,30 +67,44 @@ class PathConfig:
         return cls._REPO_ROOT
 
     @classmethod
-    def get_central_dot_env_path(cls) -> str:
+    def get_central_dot_env(cls) -> Mapping[str, str]:
         path = os.path.join(cls._REPO_ROOT, cls._DOT_ENV_MAIN_CONFIG_RELATIVE_PATH)
-        EnvironmentValidator.validate(path)
-        return path
+        return ConfigSnapshot.load(path)
+
+    @classmethod
+    def get_central_dot_env_path(cls) -> str:
+        cls.get_central_dot_env()
+        return os.path.join(cls._REPO_ROOT, cls._DOT_ENV_MAIN_CONFIG_RELATIVE_PATH)
 
     @classmethod
     def get_folder_environment_config_path(cls) -> str:
         path = os.path.join(
             cls._REPO_ROOT, cls._DOT_ENV_FOLDER_environment_CONFIG_RELATIVE_PATH
         )
-        EnvironmentValidator.validate(path)
+        ConfigSnapshot.load(path)
         return path
 
 
 class DeploymentConfig:
-    @staticmethod
-    def is_first_deployment() -> bool:
-        load_dotenv(PathConfig.get_central_dot_env_path())
+    """
+    Deployment flags of the central .env, read from its ConfigSnapshot. Each
+    value is printed once, not on every read.
+    """
+
+    _printed_is_first_deployment: Optional[bool] = None
+
+    @classmethod
+    def is_first_deployment(cls) -> bool:
+        central_dot_env = PathConfig.get_central_dot_env()
         is_first_deployment = (
-            os.getenv("IS_FIRST_DEPLOYMENT", "false").lower() == "true"
-        )
-        print(
-            f"\033[1;36m✨ Is First Deployment: \033[1;33m{is_first_deployment}\033[0m"
+            central_dot_env.get("IS_FIRST_DEPLOYMENT", "false").lower() == "true"
         )
+        if cls._printed_is_first_deployment != is_first_deployment:
+            cls._printed_is_first_deployment = is_first_deployment
+            print(
+                f"\033[1;36m✨ Is First Deployment: "
+                f"\033[1;33m{is_first_deployment}\033[0m"
+            )
         return is_first_deployment
 
 
@@ -59,13 +122,17 @@ class SqlServerDatabaseConfig:
     MSSQL_PORT = 1433
 
     @staticmethod
-    def get_sql_express() -> rds.IEngine:
+    def get_sql_express() -> "rds.IEngine":
+        import aws_cdk.aws_rds as rds
+
         return rds.DatabaseInstanceEngine.sql_server_ex(
             version=rds.SqlServerEngineVersion.VER_16_00_4095_4_V1
         )
 
     @staticmethod
-    def get_sql_web() -> rds.IEngine:
+    def get_sql_web() -> "rds.IEngine":
+        import aws_cdk.aws_rds as rds
+
         return rds.DatabaseInstanceEngine.sql_server_web(
             version=rds.SqlServerEngineVersion.VER_16_00_4095_4_V1
         )
@@ -0,0 +1,191 @@
+import json
+import os
+import shutil
+from typing import Optional, Sequence
+from cdk_auto_platform.utils.synthesis.incremental_synth import SYNTH_STATE_FILE
+
+_MANIFEST_FILE = "manifest.json"
+_TREE_FILE = "tree.json"
+_VALIDATION_REPORT_FILE = "validation-report.json"
+_MERGED_FILES = {
+    _MANIFEST_FILE,
+    _TREE_FILE,
+    _VALIDATION_REPORT_FILE,
+    "cdk.out",
+    SYNTH_STATE_FILE,
+}
+_APP_WIDE_ARTIFACT_TYPES = {"cdk:tree", "cdk:feature-flag-report"}
+# Read and write locks the CDK CLI holds on the assembly while the app runs
+_LOCK_EXTENSION = ".lock"
+
+
+class CloudAssemblyMerger:
+    """
+    Merges the cloud assemblies synthesized for each target into a single
+    assembly the CDK CLI can deploy. Targets are merged in plan order, so the
+    manifest and construct tree list stacks exactly like a serial synth does.
+    Stack files and content-addressed assets are hard linked when possible.
+    Files left in outdir by a previous synth that none of the assemblies
+    produce (removed stacks, old assets) are deleted before merging.
+    """
+
+    def __init__(self, outdir: str):
+        self.outdir = outdir
+
+    def merge(self, assembly_dirs: Sequence[str]) -> None:
+        if not assembly_dirs:
+            raise ValueError("At least one cloud assembly is required to merge")
+
+        os.makedirs(self.outdir, exist_ok=True)
+        self._remove_stale_files(assembly_dirs)
+        for assembly_dir in assembly_dirs:
+            self._link_assembly_files(assembly_dir)
+
+        manifests = [self._read(folder, _MANIFEST_FILE) for folder in assembly_dirs]
+        self._write(_MANIFEST_FILE, self._merge_manifests(manifests))
+        self._copy_file(os.path.join(assembly_dirs[0], "cdk.out"))
+
+        trees = [self._read(folder, _TREE_FILE) for folder in assembly_dirs]
+        self._write(_TREE_FILE, self._merge_trees(trees), indent=None)
+
+        reports = [
+            self._read(folder, _VALIDATION_REPORT_FILE)
+            for folder in assembly_dirs
+            if os.path.exists(os.path.join(folder, _VALIDATION_REPORT_FILE))
+        ]
+        if reports:
+            self._write(_VALIDATION_REPORT_FILE, self._merge_reports(reports))
+
+    @staticmethod
+    def _merge_manifests(manifests: list[dict]) -> dict:
+        merged = {key: value for key, value in manifests[0].items()}
+        stack_artifacts: dict = {}
+        app_artifacts: dict = {}
+        missing: dict = {}
+
+        for manifest in manifests:
+            for name, artifact in manifest.get("artifacts", {}).items():
+                if artifact["type"] in _APP_WIDE_ARTIFACT_TYPES:
+                    app_artifacts.setdefault(name, artifact)
+                elif name in stack_artifacts:
+                    raise ValueError(f"Artifact {name} is synthesized by two targets")
+                else:
+                    stack_artifacts[name] = artifact
+            for context in manifest.get("missing", []):
+                missing.setdefault(context["key"], context)
+
+        merged["artifacts"] = {**stack_artifacts, **app_artifacts}
+        if missing:
+            merged["missing"] = list(missing.values())
+        return merged
+
+    @staticmethod
+    def _merge_trees(trees: list[dict]) -> dict:
+        merged = {key: value for key, value in trees[0].items()}
+        root = {key: value for key, value in trees[0]["tree"].items()}
+        stack_children: dict = {}
+        app_children: dict = {}
+
+        for tree in trees:
+            for name, child in tree["tree"].get("children", {}).items():
+                if name == "Tree":
+                    app_children.setdefault(name, child)
+                else:
+                    stack_children[name] = child
+
+        root["children"] = {**stack_children, **app_children}
+        merged["tree"] = root
+        return merged
+
+    @staticmethod
+    def _merge_reports(reports: list[dict]) -> dict:
+        merged = {key: value for key, value in reports[0].items()}
+        plugins: dict = {}
+
+        violations: dict[str, dict] = {}
+
+        for report in reports:
+            for plugin in report.get("pluginReports", []):
+                name = plugin["pluginName"]
+                current = plugins.setdefault(name, {**plugin, "violations": []})
+                rules = violations.setdefault(name, {})
+                for violation in plugin.get("violations", []):
+                    rule = rules.setdefault(
+                        violation["ruleName"], {**violation, "violatingConstructs": []}
+                    )
+                    rule["violatingConstructs"].extend(
+                        violation.get("violatingConstructs", [])
+                    )
+                if plugin.get("conclusion") != "success":
+                    current["conclusion"] = plugin.get("conclusion")
+
+        for name, plugin in plugins.items():
+            plugin["violations"] = list(violations[name].values())
+        merged["pluginReports"] = list(plugins.values())
+        return merged
+
+    def _remove_stale_files(self, assembly_dirs: Sequence[str]) -> None:
+        expected = {
+            name for folder in assembly_dirs for name in os.listdir(folder)
+        } - {SYNTH_STATE_FILE}
+        # Folders of outdir holding the assemblies being merged
+        containers = {
+            os.path.relpath(folder, self.outdir).split(os.sep)[0]
+            for folder in assembly_dirs
+        }
+        for name in os.listdir(self.outdir):
+            if (
+                name in expected
+                or name in containers
+                or name.endswith(_LOCK_EXTENSION)
+            ):
+                continue
+            path = os.path.join(self.outdir, name)
+            if os.path.isdir(path) and not os.path.islink(path):
+                shutil.rmtree(path)
+            else:
+                os.remove(path)
+
+    def _link_assembly_files(self, assembly_dir: str) -> None:
+        for name in sorted(os.listdir(assembly_dir)):
+            if name in _MERGED_FILES:
+                continue
+            source = os.path.join(assembly_dir, name)
+            destination = os.path.join(self.outdir, name)
+            if os.path.isdir(source):
+                if not os.path.exists(destination):
+                    shutil.copytree(source, destination, copy_function=self._link)
+            else:
+                self._copy_file(source)
+
+    def _copy_file(self, source: str) -> None:
+        destination = os.path.join(self.outdir, os.path.basename(source))
+        if os.path.exists(destination):
+            os.remove(destination)
+        self._link(source, destination)
+
+    @staticmethod
+    def _link(source: str, destination: str) -> None:
+        try:
+            os.link(source, destination)
+        except OSError:
+            shutil.copy2(source, destination)
+
+    @staticmethod
+    def _read(folder: str, file_name: str) -> dict:
+        with open(os.path.join(folder, file_name)) as file:
+            return json.load(file)
+
+    def _write(self, file_name: str, content: dict, indent: Optional[int] = 2) -> None:
+        destination = os.path.join(self.outdir, file_name)
+        if os.path.exists(destination):
+            os.remove(destination)
+        separators = (",", ":") if indent is None else None
+        with open(destination, "w") as file:
+            json.dump(
+                content,
+                file,
+                indent=indent,
+                separators=separators,
+                ensure_ascii=False,
+            )
@@ -0,0 +1,240 @@
+import hashlib
+import inspect
+import json
+import os
+import re
+from enum import Enum
+from importlib import metadata
+from typing import Any, Optional
+from pydantic import BaseModel
+from cdk_auto_platform.models.tenants.tenant_base import TenantBase
+from cdk_auto_platform.utils.assets.asset_fingerprint_cache import (
+    AssetFingerprintCache,
+)
+from cdk_auto_platform.utils.configs import PathConfig
+from cdk_auto_platform.utils.synthesis.stack_sharding import ShardingPlan
+from cdk_auto_platform.utils.synthesis.synth_plan import SynthPlan, SynthTarget
+
+SYNTH_STATE_FILE = ".synth-state.json"
+_SOURCE_EXTENSIONS = (".py", ".json")
+_SKIPPED_FOLDERS = {"__pycache__", "node_modules", "cdk.out"}
+_OBJECT_ADDRESS = re.compile(r" at 0x[0-9a-fA-F]+")
+
+
+def _canonical(value: Any, seen: Optional[set[int]] = None) -> Any:
+    seen = seen if seen is not None else set()
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, type) or inspect.isroutine(value):
+        # Classes and functions are hashed by name, their sources by file
+        return f"{getattr(value, '__module__', None)}.{value.__qualname__}"
+    if isinstance(value, Enum):
+        return f"{type(value).__qualname__}.{value.name}={value.value!r}"
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, dict):
+        return {
+            json.dumps(_canonical(key, seen), sort_keys=True): _canonical(item, seen)
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item, seen) for item in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted(json.dumps(_canonical(item, seen)) for item in value)
+    if hasattr(type(value), "__jsii_type__"):
+        return f"jsii:{type(value).__jsii_type__}"
+    return _canonical_object(value, seen)
+
+
+def _canonical_object(value: Any, seen: set[int]) -> Any:
+    if id(value) in seen:
+        return f"cycle:{type(value).__qualname__}"
+
+    seen.add(id(value))
+    state = getattr(value, "__dict__", None)
+    if state is None:
+        # The default repr embeds the address, which differs in every process
+        return f"{type(value).__qualname__}:{_OBJECT_ADDRESS.sub('', repr(value))}"
+    return {
+        "type": f"{type(value).__module__}.{type(value).__qualname__}",
+        "state": {key: _canonical(item, seen) for key, item in sorted(state.items())},
+    }
+
+
+class SynthState:
+    """
+    Inputs of the last synth of a target, stored in its assembly folder. A
+    target is reused when its input hash matches and every asset it staged
+    still has the same fingerprint.
+    """
+
+    def __init__(self, inputs_hash: str, assets: dict[str, dict[str, Any]]):
+        self.inputs_hash = inputs_hash
+        self.assets = assets
+
+    @classmethod
+    def read(cls, assembly_dir: str) -> Optional["SynthState"]:
+        path = os.path.join(assembly_dir, SYNTH_STATE_FILE)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path) as file:
+                content = json.load(file)
+            return cls(content["inputs_hash"], content["assets"])
+        except (OSError, ValueError, KeyError):
+            return None
+
+    @classmethod
+    def capture(cls, inputs_hash: str) -> "SynthState":
+        cache = AssetFingerprintCache.default()
+        return cls(
+            inputs_hash,
+            {
+                directory: {
+                    "exclude": exclude,
+                    "fingerprint": cache.fingerprint(directory, exclude),
+                }
+                for directory, exclude in AssetFingerprintCache.tracked.items()
+            },
+        )
+
+    def write(self, assembly_dir: str) -> None:
+        with open(os.path.join(assembly_dir, SYNTH_STATE_FILE), "w") as file:
+            json.dump(
+                {"inputs_hash": self.inputs_hash, "assets": self.assets},
+                file,
+                indent=2,
+                sort_keys=True,
+            )
+
+    def is_current(self, inputs_hash: Optional[str]) -> bool:
+        if inputs_hash is None or inputs_hash != self.inputs_hash:
+            return False
+        cache = AssetFingerprintCache.default()
+        return all(
+            os.path.isdir(directory)
+            and cache.fingerprint(directory, asset["exclude"]) == asset["fingerprint"]
+            for directory, asset in self.assets.items()
+        )
+
+
+class SynthInputs:
+    """
+    Content hash of everything a target is synthesized from: library and CDK
+    versions and sources, the app sources (other than tenant modules), the
+    configuration files of its environment, the sharding plan and the state
+    of its TenantBase, blueprints included.
+    """
+
+    def __init__(self, plan: SynthPlan, app_path: str):
+        self.plan = plan
+        self.app_folder = os.path.dirname(os.path.abspath(app_path))
+        self._shared_hash: Optional[str] = None
+
+    def hash(self, target: SynthTarget) -> Optional[str]:
+        """
+        None when the inputs of the target can't be hashed, it is then always
+        synthesized.
+        """
+        tenant = self.plan.build_tenant(target)
+        tenant_hash = self._hash_tenant(tenant)
+        if tenant_hash is None:
+            return None
+        digest = hashlib.sha256()
+        digest.update(self._get_shared_hash().encode())
+        digest.update(tenant_hash.encode())
+        digest.update(self._hash_environment(target).encode())
+        AssetFingerprintCache.default().save()
+        return digest.hexdigest()
+
+    def _get_shared_hash(self) -> str:
+        if self._shared_hash is None:
+            import cdk_auto_platform
+
+            digest = hashlib.sha256()
+            digest.update(cdk_auto_platform.__version__.encode())
+            digest.update(self._get_distribution_version("aws-cdk-lib").encode())
+            digest.update(
+                self._hash_sources(
+                    os.path.dirname(os.path.abspath(cdk_auto_platform.__file__))
+                ).encode()
+            )
+            digest.update(
+                self._hash_sources(self.app_folder, self._get_tenant_files()).encode()
+            )
+            digest.update(self._hash_file(ShardingPlan.load().path).encode())
+            digest.update(
+                self._hash_file(
+                    os.path.join(
+                        PathConfig._REPO_ROOT,
+                        PathConfig._DOT_ENV_MAIN_CONFIG_RELATIVE_PATH,
+                    )
+                ).encode()
+            )
+            self._shared_hash = digest.hexdigest()
+        return self._shared_hash
+
+    def _hash_tenant(self, tenant: TenantBase) -> Optional[str]:
+        digest = hashlib.sha256()
+        digest.update(json.dumps(_canonical(tenant), sort_keys=True).encode())
+        try:
+            tenant_file = inspect.getsourcefile(type(tenant))
+        except (TypeError, OSError):
+            # e.g. a tenant class defined in the app module
+            return None
+        if tenant_file:
+            digest.update(self._hash_file(tenant_file).encode())
+        return digest.hexdigest()
+
+    def _hash_environment(self, target: SynthTarget) -> str:
+        folder = os.path.join(
+            PathConfig._REPO_ROOT,
+            PathConfig._DOT_ENV_FOLDER_environment_CONFIG_RELATIVE_PATH,
+            target.environment.value,
+        )
+        return self._hash_sources(folder, extensions=(".env",))
+
+    def _get_tenant_files(self) -> set[str]:
+        tenant_files = set()
+        for tenant_factory in self.plan.tenants.values():
+            try:
+                source_file = inspect.getsourcefile(tenant_factory)  # type: ignore
+            except TypeError:
+                continue
+            if source_file:
+                tenant_files.add(os.path.abspath(source_file))
+        return tenant_files
+
+    def _hash_sources(
+        self,
+        folder: str,
+        skipped_files: Optional[set[str]] = None,
+        extensions: tuple[str, ...] = _SOURCE_EXTENSIONS,
+    ) -> str:
+        digest = hashlib.sha256()
+        for current, folders, files in os.walk(folder):
+            folders[:] = sorted(
+                name
+                for name in folders
+                if name not in _SKIPPED_FOLDERS and not name.startswith(".")
+            )
+            for file_name in sorted(files):
+                path = os.path.join(current, file_name)
+                if not file_name.endswith(extensions) or path in (skipped_files or ()):
+                    continue
+                digest.update(os.path.relpath(path, folder).encode())
+                digest.update(self._hash_file(path).encode())
+        return digest.hexdigest()
+
+    @staticmethod
+    def _hash_file(path: str) -> str:
+        if not os.path.isfile(path):
+            return "missing"
+        return AssetFingerprintCache.default().hash_file(os.path.abspath(path))
+
+    @staticmethod
+    def _get_distribution_version(name: str) -> str:
+        try:
+            return metadata.version(name)
+        except metadata.PackageNotFoundError:
+            return "unknown"
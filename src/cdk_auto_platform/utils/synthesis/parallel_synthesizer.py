@@ -0,0 +1,133 @@
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context
+from typing import Optional
+from cdk_auto_platform.utils.assets.asset_fingerprint_cache import (
+    AssetFingerprintCache,
+)
+from cdk_auto_platform.utils.benchmarks.construct_profiler import ConstructProfiler
+from cdk_auto_platform.utils.synthesis.cloud_assembly_merger import (
+    CloudAssemblyMerger,
+)
+from cdk_auto_platform.utils.synthesis.incremental_synth import (
+    SynthInputs,
+    SynthState,
+)
+from cdk_auto_platform.utils.synthesis.synth_plan import SynthPlan
+
+TARGETS_FOLDER = ".targets"
+
+
+def _synth_target(
+    app_path: str,
+    attribute: str,
+    target_key: str,
+    outdir: str,
+    incremental: bool = False,
+) -> str:
+    os.environ.pop("CDK_OUTDIR", None)
+    plan = SynthPlan.load(app_path, attribute)
+    target = plan.get_target(target_key)
+    inputs_hash = SynthInputs(plan, app_path).hash(target) if incremental else None
+
+    shutil.rmtree(outdir, ignore_errors=True)
+    AssetFingerprintCache.reset_tracked()
+    ConstructProfiler.install_from_environment(target_key)
+    plan.synth(outdir, [target])
+    if inputs_hash is not None:
+        SynthState.capture(inputs_hash).write(outdir)
+    return target_key
+
+
+class ParallelSynthesizer:
+    """
+    Shards the tenant/environment targets of a SynthPlan across worker
+    processes. Each worker synthesizes into outdir/.targets/<target> and the
+    resulting cloud assemblies are merged into outdir once all of them finish.
+    In incremental mode, targets whose inputs and assets are unchanged since
+    their last synth keep their assembly and are only merged again.
+    """
+
+    def __init__(
+        self,
+        app_path: str,
+        outdir: str,
+        jobs: Optional[int] = None,
+        attribute: str = "synth_plan",
+        incremental: bool = False,
+    ):
+        self.app_path = os.path.abspath(app_path)
+        self.outdir = os.path.abspath(outdir)
+        self.jobs = jobs or os.cpu_count() or 1
+        self.attribute = attribute
+        self.incremental = incremental
+
+    def synth(self) -> None:
+        plan = SynthPlan.load(self.app_path, self.attribute)
+        if self.jobs <= 1 and not self.incremental:
+            plan.synth(self.outdir)
+            return
+
+        targets_outdir = os.path.join(self.outdir, TARGETS_FOLDER)
+        assembly_dirs = {
+            target.key: os.path.join(targets_outdir, target.key)
+            for target in plan.targets
+        }
+        pending = (
+            self._get_changed_targets(plan, assembly_dirs)
+            if self.incremental
+            else list(assembly_dirs)
+        )
+
+        if self.jobs <= 1:
+            for key in pending:
+                self._report(
+                    _synth_target(
+                        self.app_path,
+                        self.attribute,
+                        key,
+                        assembly_dirs[key],
+                        self.incremental,
+                    )
+                )
+        elif pending:
+            with ProcessPoolExecutor(
+                max_workers=min(self.jobs, len(pending)),
+                mp_context=get_context("spawn"),
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _synth_target,
+                        self.app_path,
+                        self.attribute,
+                        key,
+                        assembly_dirs[key],
+                        self.incremental,
+                    )
+                    for key in pending
+                ]
+                for future in as_completed(futures):
+                    self._report(future.result())
+
+        CloudAssemblyMerger(self.outdir).merge(list(assembly_dirs.values()))
+
+    def _get_changed_targets(
+        self, plan: SynthPlan, assembly_dirs: dict[str, str]
+    ) -> list[str]:
+        inputs = SynthInputs(plan, self.app_path)
+        changed = []
+        for target in plan.targets:
+            state = SynthState.read(assembly_dirs[target.key])
+            if state is not None and state.is_current(inputs.hash(target)):
+                print(
+                    f"\033[1;36m✨ Reused target: \033[1;33m{target.key}\033[0m"
+                )
+            else:
+                changed.append(target.key)
+        AssetFingerprintCache.default().save()
+        return changed
+
+    @staticmethod
+    def _report(target_key: str) -> None:
+        print(f"\033[1;36m✨ Synthesized target: \033[1;33m{target_key}\033[0m")
@@ -0,0 +1,326 @@
+import json
+import os
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+from pydantic import BaseModel, ConfigDict, Field
+
+CLOUDFORMATION_MAX_RESOURCES = 500
+CLOUDFORMATION_MAX_TEMPLATE_BYTES = 1_000_000
+DEFAULT_MAX_RESOURCES = 450
+DEFAULT_MAX_TEMPLATE_BYTES = 900_000
+NESTED_STACK_TEMPLATE_BYTES = 1_500
+
+DEFAULT_SHARDING_PLAN_PATH = "cdk.sharding.json"
+SHARDING_PLAN_ENVIRONMENT_VARIABLE = "CDK_SHARDING_PLAN"
+STACK_RESOURCE_LIMIT_CONTEXT = "@aws-cdk/core:stackResourceLimit"
+
+_STACK_ARTIFACT_TYPE = "aws:cloudformation:stack"
+_LOGICAL_ID_METADATA = "aws:cdk:logicalId"
+# Properties giving a resource a fixed physical name. Moving such a resource
+# to a nested stack creates the replacement before deleting the original,
+# which fails because the name is already taken.
+_PHYSICAL_NAME_PROPERTIES = {
+    "AlarmName",
+    "BucketName",
+    "ClusterName",
+    "DashboardName",
+    "DBInstanceIdentifier",
+    "FunctionName",
+    "GroupName",
+    "LoadBalancerName",
+    "LogGroupName",
+    "Name",
+    "QueueName",
+    "RepositoryName",
+    "RoleName",
+    "ServiceName",
+    "TableName",
+    "TopicName",
+}
+
+
+@contextmanager
+def _file_lock(path: str) -> Iterator[None]:
+    with open(f"{path}.lock", "a+") as lock:
+        if os.name == "nt":
+            import msvcrt
+
+            msvcrt.locking(lock.fileno(), msvcrt.LK_LOCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if os.name == "nt":
+                lock.seek(0)
+                msvcrt.locking(lock.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+
+class ShardingBudget(BaseModel):
+    model_config = ConfigDict(validate_default=True, extra="forbid")
+
+    max_resources: int = Field(
+        default=DEFAULT_MAX_RESOURCES,
+        ge=1,
+        le=CLOUDFORMATION_MAX_RESOURCES,
+        description="Resources a stack may keep before packages are nested",
+    )
+
+    max_template_bytes: int = Field(
+        default=DEFAULT_MAX_TEMPLATE_BYTES,
+        ge=1,
+        le=CLOUDFORMATION_MAX_TEMPLATE_BYTES,
+        description="Template bytes a stack may keep before packages are nested",
+    )
+
+
+class ShardingPlan:
+    """
+    Packages of each stack that are synthesized inside their own nested stack.
+    The plan is stored next to the app and only grows, so a package is never
+    moved back and forth between stacks (which would replace its resources).
+    Packages with explicitly named resources are only nested when they are
+    registered as movable.
+    """
+
+    _plans: dict[str, "ShardingPlan"] = {}
+
+    def __init__(self, path: str):
+        self.path = path
+        self.stacks: dict[str, list[str]] = self._read(path)
+        self.packages: dict[str, dict[str, str]] = {}
+        self.movable_packages: dict[str, set[str]] = {}
+
+    @classmethod
+    def load(cls, path: Optional[str] = None) -> "ShardingPlan":
+        path = os.path.abspath(
+            path
+            or os.environ.get(
+                SHARDING_PLAN_ENVIRONMENT_VARIABLE, DEFAULT_SHARDING_PLAN_PATH
+            )
+        )
+        if path not in cls._plans:
+            cls._plans[path] = cls(path)
+        return cls._plans[path]
+
+    def is_nested(self, stack_path: str, package_id: str) -> bool:
+        return package_id in self.stacks.get(stack_path, [])
+
+    def register(
+        self,
+        stack_path: str,
+        package_id: str,
+        construct_id: str,
+        is_movable: bool = False,
+    ) -> None:
+        self.packages.setdefault(stack_path, {})[construct_id] = package_id
+        if is_movable:
+            self.movable_packages.setdefault(stack_path, set()).add(package_id)
+
+    def is_movable(self, stack_path: str, package_id: str) -> bool:
+        return package_id in self.movable_packages.get(stack_path, set())
+
+    def nest(self, stack_path: str, package_id: str) -> None:
+        packages = self.stacks.setdefault(stack_path, [])
+        if package_id not in packages:
+            packages.append(package_id)
+
+    def save(self) -> None:
+        # Parallel synth workers merge their plans into the same file
+        with _file_lock(self.path):
+            stacks = self._read(self.path)
+            for stack_path, packages in self.stacks.items():
+                merged = stacks.setdefault(stack_path, [])
+                merged.extend(
+                    package for package in packages if package not in merged
+                )
+            self.stacks = stacks
+
+            temporary_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(temporary_path, "w") as file:
+                json.dump({"stacks": stacks}, file, indent=2, sort_keys=True)
+                file.write("\n")
+            os.replace(temporary_path, self.path)
+
+    @staticmethod
+    def _read(path: str) -> dict[str, list[str]]:
+        if not os.path.exists(path):
+            return {}
+        with open(path) as file:
+            return json.load(file).get("stacks", {})
+
+
+class StackSharder:
+    """
+    Post-synthesis pass over a cloud assembly of the current process. Every
+    stack built with NestedStackShardingBuilder is measured per registered
+    package (resources and template bytes, grouped through the logical ID
+    metadata of its constructs). When a stack exceeds the budget, its largest
+    packages are added to the ShardingPlan until it fits again, and the caller
+    synthesizes once more. Cross-stack references between the parent and its
+    nested stacks are wired by the CDK as parameters/outputs. Stacks that
+    still exceed the CloudFormation limits fail the synth.
+    """
+
+    def __init__(
+        self,
+        budget: Optional[ShardingBudget] = None,
+        plan: Optional[ShardingPlan] = None,
+    ):
+        self.budget = budget or ShardingBudget()
+        self.plan = plan or ShardingPlan.load()
+
+    def review(self, outdir: str) -> bool:
+        with open(os.path.join(outdir, "manifest.json")) as file:
+            manifest = json.load(file)
+
+        is_plan_changed = False
+        for artifact_id, artifact in manifest.get("artifacts", {}).items():
+            if artifact.get("type") != _STACK_ARTIFACT_TYPE:
+                continue
+            stack_path = artifact.get("displayName", artifact_id)
+            if self._shard_stack(outdir, artifact, stack_path):
+                is_plan_changed = True
+
+        if is_plan_changed:
+            self.plan.save()
+        return is_plan_changed
+
+    def _shard_stack(
+        self, outdir: str, artifact: dict[str, Any], stack_path: str
+    ) -> bool:
+        template_path = os.path.join(outdir, artifact["properties"]["templateFile"])
+        with open(template_path) as file:
+            resources: dict[str, Any] = json.load(file).get("Resources", {})
+        resource_count = len(resources)
+        template_bytes = os.path.getsize(template_path)
+
+        if (
+            resource_count <= self.budget.max_resources
+            and template_bytes <= self.budget.max_template_bytes
+        ):
+            return False
+
+        packages = self.plan.packages.get(stack_path, {})
+        metadata = self._read_metadata(outdir, artifact)
+        sizes = self._measure_packages(resources, metadata, packages)
+        named_packages = self._find_named_packages(resources, metadata, packages)
+        candidates = sorted(
+            (
+                (package_id, *sizes.get(package_id, (0, 0)))
+                for package_id in set(packages.values())
+                if not self.plan.is_nested(stack_path, package_id)
+                and self._is_movable(stack_path, package_id, named_packages)
+            ),
+            key=lambda candidate: (candidate[1], candidate[2]),
+            reverse=True,
+        )
+
+        is_plan_changed = False
+        for package_id, package_resources, package_bytes in candidates:
+            if (
+                resource_count <= self.budget.max_resources
+                and template_bytes <= self.budget.max_template_bytes
+            ):
+                break
+            if package_resources <= 1:
+                continue
+            self.plan.nest(stack_path, package_id)
+            resource_count -= package_resources - 1
+            template_bytes -= package_bytes - NESTED_STACK_TEMPLATE_BYTES
+            is_plan_changed = True
+            print(
+                f"\033[1;36m✨ Nesting package: \033[1;33m{stack_path}/{package_id} "
+                f"({package_resources} resources, {package_bytes} bytes)\033[0m"
+            )
+
+        if not is_plan_changed and (
+            len(resources) > CLOUDFORMATION_MAX_RESOURCES
+            or template_bytes > CLOUDFORMATION_MAX_TEMPLATE_BYTES
+        ):
+            print(
+                f"\033[1;31m❌ Stack exceeds CloudFormation limits: "
+                f"{stack_path}\033[0m"
+            )
+            raise Exception(
+                f"Stack {stack_path} has {len(resources)} resources and "
+                f"{os.path.getsize(template_path)} template bytes and no package "
+                "left to nest (packages with named resources need is_movable)"
+            )
+        return is_plan_changed
+
+    def _is_movable(
+        self, stack_path: str, package_id: str, named_packages: set[str]
+    ) -> bool:
+        if package_id not in named_packages or self.plan.is_movable(
+            stack_path, package_id
+        ):
+            return True
+        print(
+            f"\033[1;33m⚠️  Not nesting package with named resources: "
+            f"{stack_path}/{package_id}\033[0m"
+        )
+        return False
+
+    @staticmethod
+    def _read_metadata(
+        outdir: str, artifact: dict[str, Any]
+    ) -> dict[str, list[dict[str, Any]]]:
+        metadata = dict(artifact.get("metadata", {}))
+        metadata_file = artifact.get("additionalMetadataFile")
+        if metadata_file:
+            with open(os.path.join(outdir, metadata_file)) as file:
+                metadata.update(json.load(file))
+        return metadata
+
+    @staticmethod
+    def _measure_packages(
+        resources: dict[str, Any],
+        metadata: dict[str, list[dict[str, Any]]],
+        packages: dict[str, str],
+    ) -> dict[str, tuple[int, int]]:
+        sizes: dict[str, tuple[int, int]] = {}
+        for path, entries in metadata.items():
+            parts = path.strip("/").split("/")
+            if len(parts) < 2 or parts[1] not in packages:
+                continue
+            package_id = packages[parts[1]]
+            for entry in entries:
+                logical_id = entry.get("data")
+                if (
+                    entry.get("type") != _LOGICAL_ID_METADATA
+                    or logical_id not in resources
+                ):
+                    continue
+                count, size = sizes.get(package_id, (0, 0))
+                sizes[package_id] = (
+                    count + 1,
+                    size
+                    + len(json.dumps({logical_id: resources[logical_id]}, indent=1)),
+                )
+        return sizes
+
+    @staticmethod
+    def _find_named_packages(
+        resources: dict[str, Any],
+        metadata: dict[str, list[dict[str, Any]]],
+        packages: dict[str, str],
+    ) -> set[str]:
+        named_packages = set()
+        for path, entries in metadata.items():
+            parts = path.strip("/").split("/")
+            if len(parts) < 2 or parts[1] not in packages:
+                continue
+            for entry in entries:
+                if entry.get("type") != _LOGICAL_ID_METADATA:
+                    continue
+                properties = (
+                    resources.get(entry.get("data"), {}).get("Properties") or {}
+                )
+                if _PHYSICAL_NAME_PROPERTIES & set(properties):
+                    named_packages.add(packages[parts[1]])
+        return named_packages
@@ -0,0 +1,105 @@
+import os
+import runpy
+import sys
+from typing import TYPE_CHECKING, Callable, Optional, Sequence
+from cdk_auto_platform.models.environments.app_environment import AppEnvironment
+from cdk_auto_platform.models.tenants.tenant_base import TenantBase
+from cdk_auto_platform.utils.benchmarks.construct_profiler import ConstructProfiler
+from cdk_auto_platform.utils.synthesis.stack_sharding import (
+    STACK_RESOURCE_LIMIT_CONTEXT,
+    ShardingBudget,
+    StackSharder,
+)
+
+if TYPE_CHECKING:
+    from constructs import Construct
+
+
+class SynthTarget:
+    def __init__(self, tenant_name: str, environment: AppEnvironment):
+        self.tenant_name = tenant_name
+        self.environment = environment
+
+    @property
+    def key(self) -> str:
+        return f"{self.tenant_name}-{self.environment.value}"
+
+
+class SynthPlan:
+    """
+    Declares which tenant/environment pairs an app synthesizes and how their
+    stacks are built. The same plan drives the serial synth of a single App
+    and the parallel driver, where every target gets its own App and outdir.
+    Stacks over the sharding budget are synthesized again with their largest
+    packages moved into nested stacks.
+    """
+
+    def __init__(
+        self,
+        tenants: dict[str, Callable[[], TenantBase]],
+        stack_factory: Callable[["Construct", TenantBase], None],
+        environments: Optional[Sequence[AppEnvironment]] = None,
+        sharding_budget: Optional[ShardingBudget] = None,
+    ):
+        self.tenants = tenants
+        self.stack_factory = stack_factory
+        self.environments = list(environments or [AppEnvironment.PROD])
+        self.sharding_budget = sharding_budget or ShardingBudget()
+
+    @property
+    def targets(self) -> list[SynthTarget]:
+        return [
+            SynthTarget(tenant_name, environment)
+            for tenant_name in self.tenants
+            for environment in self.environments
+        ]
+
+    def get_target(self, key: str) -> SynthTarget:
+        for target in self.targets:
+            if target.key == key:
+                return target
+        raise ValueError(f"Synth target {key} is not part of the plan")
+
+    def build_tenant(self, target: SynthTarget) -> TenantBase:
+        tenant = self.tenants[target.tenant_name]()
+        return getattr(tenant, target.environment.value)()
+
+    def build(
+        self, scope: "Construct", targets: Optional[Sequence[SynthTarget]] = None
+    ) -> None:
+        for target in targets or self.targets:
+            self.stack_factory(scope, self.build_tenant(target))
+
+    def synth(
+        self,
+        outdir: Optional[str] = None,
+        targets: Optional[Sequence[SynthTarget]] = None,
+    ):
+        from aws_cdk import App
+
+        ConstructProfiler.install_from_environment()
+        sharder = StackSharder(self.sharding_budget)
+        while True:
+            context = {STACK_RESOURCE_LIMIT_CONTEXT: 0}
+            app = (
+                App(outdir=outdir, context=context) if outdir else App(context=context)
+            )
+            ConstructProfiler.span("SynthPlan.build", lambda: self.build(app, targets))
+            assembly = ConstructProfiler.span("App.synth", app.synth)
+            if not sharder.review(assembly.directory):
+                return assembly
+
+    @staticmethod
+    def load(app_path: str, attribute: str = "synth_plan") -> "SynthPlan":
+        app_path = os.path.abspath(app_path)
+        app_folder = os.path.dirname(app_path)
+        if app_folder not in sys.path:
+            sys.path.insert(0, app_folder)
+
+        namespace = runpy.run_path(app_path, run_name="cdk_auto_platform_app")
+        plan = namespace.get(attribute)
+        if not isinstance(plan, SynthPlan):
+            raise ValueError(
+                f"{app_path} does not define a SynthPlan named {attribute}"
+            )
+        return plan
@@ -0,0 +1,120 @@
+from datetime import datetime, timedelta
+from typing import Optional
+
+_REFERENCE_YEAR = 2028
+_MONTH_NAMES = {
+    name: index
+    for index, name in enumerate(
+        [
+            "JAN",
+            "FEB",
+            "MAR",
+            "APR",
+            "MAY",
+            "JUN",
+            "JUL",
+            "AUG",
+            "SEP",
+            "OCT",
+            "NOV",
+            "DEC",
+        ],
+        start=1,
+    )
+}
+_DAY_NAMES = {
+    "SUN": 1,
+    "MON": 2,
+    "TUE": 3,
+    "WED": 4,
+    "THU": 5,
+    "FRI": 6,
+    "SAT": 7,
+}
+
+
+class CronExpression:
+    """
+    AWS six-field cron expression, cron(minutes hours day-of-month month
+    day-of-week year), expanded into the minutes it fires at over a reference
+    year. The year field is ignored and L/W/# are not supported.
+    """
+
+    def __init__(self, expression: str):
+        if not expression.startswith("cron(") or not expression.endswith(")"):
+            raise ValueError(f"Invalid cron expression {expression}")
+
+        fields = expression.removeprefix("cron(").removesuffix(")").split()
+        if len(fields) != 6:
+            raise ValueError(f"Cron expression {expression} must have 6 fields")
+
+        self.expression = expression
+        self.minutes = self._parse(fields[0], 0, 59)
+        self.hours = self._parse(fields[1], 0, 23)
+        self.days_of_month = self._parse(fields[2], 1, 31)
+        self.months = self._parse(fields[3], 1, 12, _MONTH_NAMES)
+        self.days_of_week = self._parse(fields[4], 1, 7, _DAY_NAMES)
+        self._is_day_of_month_any = fields[2] in ("*", "?")
+        self._is_day_of_week_any = fields[4] in ("*", "?")
+
+    def occurrences(self) -> list[datetime]:
+        occurrences = []
+        day = datetime(_REFERENCE_YEAR, 1, 1)
+        while day.year == _REFERENCE_YEAR:
+            if self._matches_day(day):
+                occurrences.extend(
+                    day.replace(hour=hour, minute=minute)
+                    for hour in sorted(self.hours)
+                    for minute in sorted(self.minutes)
+                )
+            day += timedelta(days=1)
+        return occurrences
+
+    def _matches_day(self, day: datetime) -> bool:
+        if day.month not in self.months:
+            return False
+        day_of_week = (day.weekday() + 1) % 7 + 1
+        if self._is_day_of_month_any:
+            return self._is_day_of_week_any or day_of_week in self.days_of_week
+        if self._is_day_of_week_any:
+            return day.day in self.days_of_month
+        return day.day in self.days_of_month or day_of_week in self.days_of_week
+
+    def _parse(
+        self,
+        field: str,
+        minimum: int,
+        maximum: int,
+        names: Optional[dict[str, int]] = None,
+    ) -> set[int]:
+        names = names or {}
+        values: set[int] = set()
+        for part in field.upper().split(","):
+            if any(token in part for token in ("L", "W", "#")) and not any(
+                name in part for name in names
+            ):
+                raise ValueError(
+                    f"Cron field {field} of {self.expression} is not supported"
+                )
+
+            part, _, step = part.partition("/")
+            if part in ("*", "?"):
+                start, end = minimum, maximum
+            elif "-" in part:
+                first, last = part.split("-", 1)
+                start = self._parse_value(first, names)
+                end = self._parse_value(last, names)
+            else:
+                start = self._parse_value(part, names)
+                end = maximum if step else start
+
+            if not minimum <= start <= end <= maximum:
+                raise ValueError(
+                    f"Cron field {field} of {self.expression} is out of range"
+                )
+            values.update(range(start, end + 1, int(step) if step else 1))
+        return values
+
+    @staticmethod
+    def _parse_value(value: str, names: dict[str, int]) -> int:
+        return names[value] if value in names else int(value)
@@ -1,5 +1,5 @@
 import os
-from dotenv import load_dotenv
+from dotenv import load_dotenv, dotenv_values
 
 from enum import Enum
 
@@ -54,6 +54,50 @@ class EnvironmentValidator:
             🟢 Loaded .env: /path/to/your/file.env
         """
 
+        file_type = EnvironmentValidator._ensure_exists(absolute_patch)
+
+        if file_type == PathTypes.DOT_ENV:
+            dotenv_success = load_dotenv(
+                absolute_patch,
+                override=True,
+            )
+            if not dotenv_success:
+                EnvironmentValidator._fail_to_load(file_type, absolute_patch)
+        print(
+            f"\033[1;32m🟢 Loaded {file_type.value}: \033[1;33m{absolute_patch}\033[0m"
+        )
+
+    @staticmethod
+    def parse(absolute_patch: str) -> dict[str, str]:
+        """
+        Validates a path like `validate` but parses .env files without writing them
+        into os.environ. Folders and other files return an empty dictionary.
+        Args:
+            absolute_patch (str): The absolute path to the file that needs to be parsed.
+        Returns:
+            dict[str, str]: The key/value pairs declared in the .env file.
+        Raises:
+            Exception: If the file does not exist or if a .env file is empty or malformed.
+        """
+
+        file_type = EnvironmentValidator._ensure_exists(absolute_patch)
+
+        values: dict[str, str] = {}
+        if file_type == PathTypes.DOT_ENV:
+            values = {
+                key: value
+                for key, value in dotenv_values(absolute_patch).items()
+                if value is not None
+            }
+            if not values:
+                EnvironmentValidator._fail_to_load(file_type, absolute_patch)
+        print(
+            f"\033[1;32m🟢 Loaded {file_type.value}: \033[1;33m{absolute_patch}\033[0m"
+        )
+        return values
+
+    @staticmethod
+    def _ensure_exists(absolute_patch: str) -> PathTypes:
         file_type = PathDispatcher(absolute_patch).dispatch()
 
         print(
@@ -63,19 +107,12 @@ class EnvironmentValidator:
             print(f"\033[1;31m❌ {file_type.value} not found: {absolute_patch}\033[0m")
             raise Exception(f"{file_type.value} not found: {absolute_patch}")
 
-        if file_type == PathTypes.DOT_ENV:
-            dotenv_success = load_dotenv(
-                absolute_patch,
-                override=True,
-            )
-            if not dotenv_success:
-                print(
-                    f"\033[1;31m❌ Failed to load {file_type.value}: {absolute_patch}\033[0m"
-                )
-                print(
-                    f"\033[1;31m❌ Check if the {file_type.value} is empty or malformed\033[0m"
-                )
-                raise Exception(f"Failed to load {file_type.value}: {absolute_patch}")
+        return file_type
+
+    @staticmethod
+    def _fail_to_load(file_type: PathTypes, absolute_patch: str):
+        print(f"\033[1;31m❌ Failed to load {file_type.value}: {absolute_patch}\033[0m")
         print(
-            f"\033[1;32m🟢 Loaded {file_type.value}: \033[1;33m{absolute_patch}\033[0m"
+            f"\033[1;31m❌ Check if the {file_type.value} is empty or malformed\033[0m"
         )
+        raise Exception(f"Failed to load {file_type.value}: {absolute_patch}")